@@ -1,13 +1,10 @@
-# Django imports
-from django.utils import timezone
-from django.db.models import Q
-
 # Third party imports
 from rest_framework import authentication
 from rest_framework.exceptions import AuthenticationFailed
 
 # Module imports
-from plane.db.models import APIToken
+from plane.db.models import User
+from plane.utils.api_token import get_api_token_details, touch_api_token
 
 
 class APIKeyAuthentication(authentication.BaseAuthentication):
@@ -23,19 +20,18 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
         return request.headers.get(self.auth_header_name)
 
     def validate_api_token(self, token):
+        api_token = get_api_token_details(token)
+        if api_token is None:
+            raise AuthenticationFailed("Given API token is not valid")
+
         try:
-            api_token = APIToken.objects.get(
-                Q(Q(expired_at__gt=timezone.now()) | Q(expired_at__isnull=True)),
-                token=token,
-                is_active=True,
-            )
-        except APIToken.DoesNotExist:
+            user = User.objects.get(pk=api_token["user_id"])
+        except User.DoesNotExist:
             raise AuthenticationFailed("Given API token is not valid")
 
         # save api token last used
-        api_token.last_used = timezone.now()
-        api_token.save(update_fields=["last_used"])
-        return (api_token.user, api_token.token)
+        touch_api_token(api_token["id"])
+        return (user, token)
 
     def authenticate(self, request):
         token = self.get_api_token(request=request)
@@ -1,4 +1,4 @@
-from plane.db.models import WorkspaceMember, ProjectMember
+from plane.app.permissions.membership import get_membership
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
@@ -30,22 +30,14 @@ def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
             ]
 
             # Check role permissions
+            membership = get_membership(request, kwargs["slug"])
             if level == "WORKSPACE":
-                if WorkspaceMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
+                if membership.is_workspace_member(roles=allowed_role_values):
                     return view_func(instance, request, *args, **kwargs)
             else:
-                if ProjectMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    project_id=kwargs["project_id"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
+                if membership.is_project_member(
+                    kwargs["project_id"], roles=allowed_role_values
+                ):
                     return view_func(instance, request, *args, **kwargs)
 
             # Return permission denied if no conditions are met
@@ -0,0 +1,125 @@
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+
+# Permission Mappings
+Admin = 20
+Member = 15
+Guest = 5
+
+
+def membership_cache_key(user_id, slug):
+    return f"membership:{user_id}:{slug}"
+
+
+def invalidate_membership(user_id, slug):
+    cache.delete(membership_cache_key(user_id, slug))
+
+
+def invalidate_memberships(user_ids, slugs):
+    """
+    Drop the cached roles of the users in the workspaces
+    Used by the bulk and queryset writes of members, which send no model signals
+    """
+    if settings.MEMBERSHIP_CACHE_TIMEOUT:
+        cache.delete_many(
+            [
+                membership_cache_key(user_id, slug)
+                for user_id in user_ids
+                for slug in slugs
+            ]
+        )
+
+
+class MembershipResolver:
+    """
+    Workspace and project roles of a user in a workspace
+    The roles are loaded once and shared by every permission check and guest
+    filter of the request, optionally through a short lived cache entry
+    """
+
+    def __init__(self, user, slug):
+        self.user = user
+        self.slug = slug
+        self.workspace = None
+        self.projects = None
+        self.identifiers = None
+
+    def load(self):
+        if self.projects is not None:
+            return
+
+        key = membership_cache_key(self.user.id, self.slug)
+        timeout = settings.MEMBERSHIP_CACHE_TIMEOUT
+        data = cache.get(key) if timeout else None
+        if data is None:
+            data = {
+                "workspace": WorkspaceMember.objects.filter(
+                    member=self.user, workspace__slug=self.slug
+                )
+                .values("role", "is_active")
+                .first(),
+                "projects": [
+                    (str(project_id), identifier, role)
+                    for project_id, identifier, role in ProjectMember.objects.filter(
+                        member=self.user, workspace__slug=self.slug, is_active=True
+                    ).values_list("project_id", "project__identifier", "role")
+                ],
+            }
+            if timeout:
+                cache.set(key, data, timeout)
+
+        self.workspace = data["workspace"]
+        self.projects = {
+            project_id: role for project_id, _, role in data["projects"]
+        }
+        self.identifiers = {
+            identifier: role for _, identifier, role in data["projects"]
+        }
+
+    def workspace_role(self, active=True):
+        """Return the workspace role, inactive members count when active is False"""
+        self.load()
+        if self.workspace is None or (active and not self.workspace["is_active"]):
+            return None
+        return self.workspace["role"]
+
+    def project_role(self, project_id=None, identifier=None):
+        self.load()
+        if identifier is not None:
+            return self.identifiers.get(identifier)
+        return self.projects.get(str(project_id))
+
+    def is_workspace_member(self, roles=None, active=True):
+        role = self.workspace_role(active=active)
+        return role is not None and (roles is None or role in roles)
+
+    def is_project_member(self, project_id=None, roles=None, identifier=None):
+        role = self.project_role(project_id=project_id, identifier=identifier)
+        return role is not None and (roles is None or role in roles)
+
+    def is_any_project_member(self):
+        self.load()
+        return bool(self.projects)
+
+    def is_workspace_guest(self):
+        return self.workspace_role() == Guest
+
+    def is_project_guest(self, project_id):
+        return self.project_role(project_id) == Guest
+
+
+def get_membership(request, slug):
+    """Return the membership resolver of the request user in the workspace"""
+    # Store on the underlying request so the DRF and django requests share it
+    holder = getattr(request, "_request", request)
+    resolvers = getattr(holder, "_membership_resolvers", None)
+    if resolvers is None:
+        resolvers = {}
+        holder._membership_resolvers = resolvers
+    if slug not in resolvers:
+        resolvers[slug] = MembershipResolver(request.user, slug)
+    return resolvers[slug]
@@ -2,7 +2,7 @@
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 
 # Module import
-from plane.db.models import ProjectMember, WorkspaceMember
+from plane.app.permissions.membership import get_membership
 
 # Permission Mappings
 Admin = 20
@@ -15,29 +15,18 @@ class ProjectBasePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        membership = get_membership(request, view.workspace_slug)
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return membership.is_workspace_member()
 
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return membership.is_workspace_member(roles=[Admin, Member])
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=Admin,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return membership.is_project_member(view.project_id, roles=[Admin])
 
 
 class ProjectMemberPermission(BasePermission):
@@ -45,28 +34,17 @@ class ProjectMemberPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        membership = get_membership(request, view.workspace_slug)
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return membership.is_any_project_member()
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return membership.is_workspace_member(roles=[Admin, Member])
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return membership.is_project_member(view.project_id, roles=[Admin, Member])
 
 
 class ProjectEntityPermission(BasePermission):
@@ -74,33 +52,21 @@ class ProjectEntityPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        membership = get_membership(request, view.workspace_slug)
+
         # Handle requests based on project__identifier
         if hasattr(view, "project__identifier") and view.project__identifier:
             if request.method in SAFE_METHODS:
-                return ProjectMember.objects.filter(
-                    workspace__slug=view.workspace_slug,
-                    member=request.user,
-                    project__identifier=view.project__identifier,
-                    is_active=True,
-                ).exists()
+                return membership.is_project_member(
+                    identifier=view.project__identifier
+                )
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                project_id=view.project_id,
-                is_active=True,
-            ).exists()
+            return membership.is_project_member(view.project_id)
 
         ## Only project members or admins can create and edit the project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return membership.is_project_member(view.project_id, roles=[Admin, Member])
 
 
 class ProjectLitePermission(BasePermission):
@@ -108,9 +74,6 @@ class ProjectLitePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return get_membership(request, view.workspace_slug).is_project_member(
+            view.project_id
+        )
@@ -2,7 +2,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module imports
-from plane.db.models import WorkspaceMember
+from plane.app.permissions.membership import get_membership
 
 
 # Permission Mappings
@@ -27,21 +27,15 @@ class WorkSpaceBasePermission(BasePermission):
 
         # allow only admins and owners to update the workspace settings
         if request.method in ["PUT", "PATCH"]:
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return get_membership(request, view.workspace_slug).is_workspace_member(
+                roles=[Admin, Member]
+            )
 
         # allow only owner to delete the workspace
         if request.method == "DELETE":
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role=Admin,
-                is_active=True,
-            ).exists()
+            return get_membership(request, view.workspace_slug).is_workspace_member(
+                roles=[Admin]
+            )
 
 
 class WorkspaceOwnerPermission(BasePermission):
@@ -49,9 +43,9 @@ class WorkspaceOwnerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            workspace__slug=view.workspace_slug, member=request.user, role=Admin
-        ).exists()
+        return get_membership(request, view.workspace_slug).is_workspace_member(
+            roles=[Admin], active=False
+        )
 
 
 class WorkSpaceAdminPermission(BasePermission):
@@ -59,12 +53,9 @@ class WorkSpaceAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Admin, Member],
-            is_active=True,
-        ).exists()
+        return get_membership(request, view.workspace_slug).is_workspace_member(
+            roles=[Admin, Member]
+        )
 
 
 class WorkspaceEntityPermission(BasePermission):
@@ -72,18 +63,13 @@ class WorkspaceEntityPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        membership = get_membership(request, view.workspace_slug)
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return membership.is_workspace_member()
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Admin, Member],
-            is_active=True,
-        ).exists()
+        return membership.is_workspace_member(roles=[Admin, Member])
 
 
 class WorkspaceViewerPermission(BasePermission):
@@ -91,9 +77,7 @@ class WorkspaceViewerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug, is_active=True
-        ).exists()
+        return get_membership(request, view.workspace_slug).is_workspace_member()
 
 
 class WorkspaceUserPermission(BasePermission):
@@ -101,6 +85,4 @@ class WorkspaceUserPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug, is_active=True
-        ).exists()
+        return get_membership(request, view.workspace_slug).is_workspace_member()
@@ -1,11 +1,22 @@
+# Third party imports
+from rest_framework import serializers
+
 # Module imports
 from .base import BaseSerializer
+from plane.bgtasks.export_task import get_export_progress
 from plane.db.models import ExporterHistory
 from .user import UserLiteSerializer
 
 
 class ExporterHistorySerializer(BaseSerializer):
     initiated_by_detail = UserLiteSerializer(source="initiated_by", read_only=True)
+    progress = serializers.SerializerMethodField()
+
+    def get_progress(self, obj):
+        # Status of the file of each project while they are exported
+        if obj.status != "processing":
+            return {}
+        return get_export_progress(obj.token)
 
     class Meta:
         model = ExporterHistory
@@ -20,6 +31,7 @@ class ExporterHistorySerializer(BaseSerializer):
             "initiated_by",
             "initiated_by_detail",
             "token",
+            "progress",
             "created_by",
             "updated_by",
         ]
@@ -1,7 +1,5 @@
 # Django imports
-from django.db.models import Count, F, Sum, Q
-from django.db.models.functions import ExtractMonth
-from django.utils import timezone
+from django.db.models import Q
 from django.db.models.functions import Concat
 from django.db.models import Case, When, Value
 from django.db import models
@@ -17,6 +15,7 @@ from plane.app.views.base import BaseAPIView, BaseViewSet
 from plane.bgtasks.analytic_plot_export import analytic_export_task
 from plane.db.models import AnalyticView, Issue, Workspace
 from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.default_analytics import get_default_analytics
 from plane.utils.issue_filters import issue_filters
 from plane.app.permissions import allow_permission, ROLE
 
@@ -299,145 +298,7 @@ class DefaultAnalyticsEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def get(self, request, slug):
         filters = issue_filters(request.GET, "GET")
-        base_issues = Issue.issue_objects.filter(workspace__slug=slug, **filters)
-
-        total_issues = base_issues.count()
-
-        state_groups = base_issues.annotate(state_group=F("state__group"))
-
-        total_issues_classified = (
-            state_groups.values("state_group")
-            .annotate(state_count=Count("state_group"))
-            .order_by("state_group")
-        )
-
-        open_issues_groups = ["backlog", "unstarted", "started"]
-        open_issues_queryset = state_groups.filter(state__group__in=open_issues_groups)
-
-        open_issues = open_issues_queryset.count()
-        open_issues_classified = (
-            open_issues_queryset.values("state_group")
-            .annotate(state_count=Count("state_group"))
-            .order_by("state_group")
-        )
-
-        current_year = timezone.now().year
-        issue_completed_month_wise = (
-            base_issues.filter(completed_at__year=current_year)
-            .annotate(month=ExtractMonth("completed_at"))
-            .values("month")
-            .annotate(count=Count("*"))
-            .order_by("month")
-        )
-
-        user_details = [
-            "created_by__first_name",
-            "created_by__last_name",
-            "created_by__display_name",
-            "created_by__id",
-        ]
-
-        most_issue_created_user = (
-            base_issues.exclude(created_by=None)
-            .values(*user_details)
-            .annotate(count=Count("id"))
-            .annotate(
-                created_by__avatar_url=Case(
-                    # If `avatar_asset` exists, use it to generate the asset URL
-                    When(
-                        created_by__avatar_asset__isnull=False,
-                        then=Concat(
-                            Value("/api/assets/v2/static/"),
-                            "created_by__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                            Value("/"),
-                        ),
-                    ),
-                    # If `avatar_asset` is None, fall back to using `avatar` field directly
-                    When(
-                        created_by__avatar_asset__isnull=True, then="created_by__avatar"
-                    ),
-                    default=Value(None),
-                    output_field=models.CharField(),
-                )
-            )
-            .order_by("-count")[:5]
-        )
-
-        user_assignee_details = [
-            "assignees__first_name",
-            "assignees__last_name",
-            "assignees__display_name",
-            "assignees__id",
-        ]
-
-        most_issue_closed_user = (
-            base_issues.filter(completed_at__isnull=False)
-            .exclude(assignees=None)
-            .values(*user_assignee_details)
-            .annotate(
-                assignees__avatar_url=Case(
-                    # If `avatar_asset` exists, use it to generate the asset URL
-                    When(
-                        assignees__avatar_asset__isnull=False,
-                        then=Concat(
-                            Value("/api/assets/v2/static/"),
-                            "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                            Value("/"),
-                        ),
-                    ),
-                    # If `avatar_asset` is None, fall back to using `avatar` field directly
-                    When(
-                        assignees__avatar_asset__isnull=True, then="assignees__avatar"
-                    ),
-                    default=Value(None),
-                    output_field=models.CharField(),
-                )
-            )
-            .annotate(count=Count("id"))
-            .order_by("-count")[:5]
-        )
-
-        pending_issue_user = (
-            base_issues.filter(completed_at__isnull=True)
-            .values(*user_assignee_details)
-            .annotate(count=Count("id"))
-            .annotate(
-                assignees__avatar_url=Case(
-                    # If `avatar_asset` exists, use it to generate the asset URL
-                    When(
-                        assignees__avatar_asset__isnull=False,
-                        then=Concat(
-                            Value("/api/assets/v2/static/"),
-                            "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                            Value("/"),
-                        ),
-                    ),
-                    # If `avatar_asset` is None, fall back to using `avatar` field directly
-                    When(
-                        assignees__avatar_asset__isnull=True, then="assignees__avatar"
-                    ),
-                    default=Value(None),
-                    output_field=models.CharField(),
-                )
-            )
-            .order_by("-count")
-        )
-
-        open_estimate_sum = open_issues_queryset.aggregate(sum=Sum("point"))["sum"]
-        total_estimate_sum = base_issues.aggregate(sum=Sum("point"))["sum"]
-
         return Response(
-            {
-                "total_issues": total_issues,
-                "total_issues_classified": total_issues_classified,
-                "open_issues": open_issues,
-                "open_issues_classified": open_issues_classified,
-                "issue_completed_month_wise": issue_completed_month_wise,
-                "most_issue_created_user": most_issue_created_user,
-                "most_issue_closed_user": most_issue_closed_user,
-                "pending_issue_user": pending_issue_user,
-                "open_estimate_sum": open_estimate_sum,
-                "total_estimate_sum": total_estimate_sum,
-            },
+            get_default_analytics(slug, filters),
             status=status.HTTP_200_OK,
         )
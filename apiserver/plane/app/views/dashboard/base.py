@@ -25,6 +25,7 @@ from rest_framework import status
 # Third Party imports
 from rest_framework.response import Response
 
+from plane.app.permissions import get_membership
 from plane.app.serializers import (
     DashboardSerializer,
     IssueActivitySerializer,
@@ -41,9 +42,11 @@ from plane.db.models import (
     IssueRelation,
     Project,
     Widget,
+    Workspace,
     WorkspaceMember,
     CycleIssue,
 )
+from plane.utils.dashboard_counters import get_dashboard_counters
 from plane.utils.issue_filters import issue_filters
 
 # Module imports
@@ -51,119 +54,15 @@ from .. import BaseAPIView
 
 
 def dashboard_overview_stats(self, request, slug):
-    assigned_issues = (
-        Issue.issue_objects.filter(
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
-        .count()
-    )
-
-    pending_issues_count = (
-        Issue.issue_objects.filter(
-            ~Q(state__group__in=["completed", "cancelled"]),
-            target_date__lt=timezone.now().date(),
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
-        .count()
-    )
-
-    created_issues_count = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            created_by_id=request.user.id,
-        )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
-        .count()
-    )
-
-    completed_issues_count = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            assignees__in=[request.user],
-            state__group="completed",
-        )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
-        .count()
-    )
+    workspace = Workspace.objects.only("id").get(slug=slug)
+    counters = get_dashboard_counters(workspace.id, request.user.id)
 
     return Response(
         {
-            "assigned_issues_count": assigned_issues,
-            "pending_issues_count": pending_issues_count,
-            "completed_issues_count": completed_issues_count,
-            "created_issues_count": created_issues_count,
+            "assigned_issues_count": counters["assigned_issues_count"],
+            "pending_issues_count": counters["pending_issues_count"],
+            "completed_issues_count": counters["completed_issues_count"],
+            "created_issues_count": counters["created_issues_count"],
         },
         status=status.HTTP_200_OK,
     )
@@ -259,9 +158,7 @@ def dashboard_assigned_issues(self, request, slug):
         )
     )
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug, member=request.user, role=5, is_active=True
-    ).exists():
+    if get_membership(request, slug).is_workspace_guest():
         assigned_issues = assigned_issues.filter(created_by=request.user)
 
     # Priority Ordering
@@ -516,9 +413,7 @@ def dashboard_issues_by_state_groups(self, request, slug):
     state_order = ["backlog", "unstarted", "started", "completed", "cancelled"]
     extra_filters = {}
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug, member=request.user, role=5, is_active=True
-    ).exists():
+    if get_membership(request, slug).is_workspace_guest():
         extra_filters = {"created_by": request.user}
 
     issues_by_state_groups = (
@@ -553,9 +448,7 @@ def dashboard_issues_by_priority(self, request, slug):
     priority_order = ["urgent", "high", "medium", "low", "none"]
     extra_filters = {}
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug, member=request.user, role=5, is_active=True
-    ).exists():
+    if get_membership(request, slug).is_workspace_guest():
         extra_filters = {"created_by": request.user}
 
     issues_by_priority = (
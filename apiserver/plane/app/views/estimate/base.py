@@ -18,7 +18,7 @@ from plane.app.serializers import (
     EstimatePointSerializer,
     EstimateReadSerializer,
 )
-from plane.utils.cache import invalidate_cache
+from plane.utils.cache import WORKSPACE_TAG, invalidate_cache
 from plane.bgtasks.issue_activities_task import issue_activity
 
 
@@ -57,7 +57,10 @@ class BulkEstimatePointEndpoint(BaseViewSet):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @invalidate_cache(
-        path="/api/workspaces/:slug/estimates/", url_params=True, user=False
+        path="/api/workspaces/:slug/estimates/",
+        url_params=True,
+        user=False,
+        tags=[WORKSPACE_TAG],
     )
     def create(self, request, slug, project_id):
         estimate = request.data.get("estimate")
@@ -108,7 +111,10 @@ class BulkEstimatePointEndpoint(BaseViewSet):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @invalidate_cache(
-        path="/api/workspaces/:slug/estimates/", url_params=True, user=False
+        path="/api/workspaces/:slug/estimates/",
+        url_params=True,
+        user=False,
+        tags=[WORKSPACE_TAG],
     )
     def partial_update(self, request, slug, project_id, estimate_id):
         if not len(request.data.get("estimate_points", [])):
@@ -160,7 +166,10 @@ class BulkEstimatePointEndpoint(BaseViewSet):
         return Response(estimate_serializer.data, status=status.HTTP_200_OK)
 
     @invalidate_cache(
-        path="/api/workspaces/:slug/estimates/", url_params=True, user=False
+        path="/api/workspaces/:slug/estimates/",
+        url_params=True,
+        user=False,
+        tags=[WORKSPACE_TAG],
     )
     def destroy(self, request, slug, project_id, estimate_id):
         estimate = Estimate.objects.get(
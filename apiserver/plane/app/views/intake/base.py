@@ -16,7 +16,7 @@ from rest_framework.response import Response
 
 # Module imports
 from ..base import BaseViewSet
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import allow_permission, get_membership, ROLE
 from plane.db.models import (
     Intake,
     IntakeIssue,
@@ -25,7 +25,6 @@ from plane.db.models import (
     IssueLink,
     FileAsset,
     Project,
-    ProjectMember,
     CycleIssue,
 )
 from plane.app.serializers import (
@@ -209,13 +208,7 @@ class IntakeIssueViewSet(BaseViewSet):
             intake_issue = intake_issue.filter(status__in=intake_status)
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_guest(project_id)
             and not project.guest_view_all_features
         ):
             intake_issue = intake_issue.filter(created_by=request.user)
@@ -328,17 +321,12 @@ class IntakeIssueViewSet(BaseViewSet):
             project_id=project_id,
             intake_id=intake_id,
         )
-        # Get the project member
-        project_member = ProjectMember.objects.get(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            is_active=True,
-        )
+        # Get the project member role
+        project_role = get_membership(request, slug).project_role(project_id)
         # Only project members admins and created_by users can access this endpoint
-        if project_member.role <= 5 and str(intake_issue.created_by_id) != str(
-            request.user.id
-        ):
+        if (project_role is None or project_role <= 5) and str(
+            intake_issue.created_by_id
+        ) != str(request.user.id):
             return Response(
                 {"error": "You cannot edit intake issues"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -372,7 +360,7 @@ class IntakeIssueViewSet(BaseViewSet):
                 ),
             ).get(pk=intake_issue.issue_id, workspace__slug=slug, project_id=project_id)
             # Only allow guests to edit name and description
-            if project_member.role <= 5:
+            if project_role is None or project_role <= 5:
                 issue_data = {
                     "name": issue_data.get("name", issue.name),
                     "description_html": issue_data.get(
@@ -412,7 +400,7 @@ class IntakeIssueViewSet(BaseViewSet):
                 )
 
         # Only project admins and members can edit intake issue attributes
-        if project_member.role > 15:
+        if project_role is not None and project_role > 15:
             serializer = IntakeIssueSerializer(
                 intake_issue, data=request.data, partial=True
             )
@@ -540,13 +528,7 @@ class IntakeIssueViewSet(BaseViewSet):
             .get(intake_id=intake_id.id, issue_id=pk, project_id=project_id)
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_guest(project_id)
             and not project.guest_view_all_features
             and not intake_issue.created_by == request.user
         ):
@@ -26,7 +26,7 @@ from rest_framework import status
 from rest_framework.response import Response
 
 # Module imports
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import allow_permission, get_membership, ROLE
 from plane.app.serializers import (
     IssueCreateSerializer,
     IssueDetailSerializer,
@@ -42,7 +42,6 @@ from plane.db.models import (
     IssueReaction,
     IssueSubscriber,
     Project,
-    ProjectMember,
     CycleIssue,
 )
 from plane.utils.grouper import (
@@ -52,7 +51,12 @@ from plane.utils.grouper import (
 )
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
-from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
+from plane.utils.paginator import (
+    COUNT_EXACT,
+    COUNT_MODES,
+    GroupedOffsetPaginator,
+    SubGroupedOffsetPaginator,
+)
 from .. import BaseAPIView, BaseViewSet
 from plane.utils.timezone_converter import user_timezone_converter
 from plane.bgtasks.recent_visited_task import recent_visited_task
@@ -263,13 +267,7 @@ class IssueViewSet(BaseViewSet):
             user_id=request.user.id,
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_guest(project_id)
             and not project.guest_view_all_features
         ):
             issue_queryset = issue_queryset.filter(created_by=request.user)
@@ -551,13 +549,7 @@ class IssueViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_guest(project_id)
             and not project.guest_view_all_features
             and not issue.created_by == request.user
         ):
@@ -810,6 +802,12 @@ class IssuePaginatedViewSet(BaseViewSet):
         cursor = request.GET.get("cursor", None)
         is_description_required = request.GET.get("description", "false")
         updated_at = request.GET.get("updated_at__gt", None)
+        count_mode = request.GET.get("count", COUNT_EXACT)
+        if count_mode not in COUNT_MODES:
+            return Response(
+                {"error": "Invalid count parameter"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         # required fields
         required_fields = [
@@ -854,14 +852,10 @@ class IssuePaginatedViewSet(BaseViewSet):
 
         # validation for guest user
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
-        project_member = ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            role=5,
-            is_active=True,
-        )
-        if project_member.exists() and not project.guest_view_all_features:
+        if (
+            get_membership(request, slug).is_project_guest(project_id)
+            and not project.guest_view_all_features
+        ):
             base_queryset = base_queryset.filter(created_by=request.user)
             queryset = queryset.filter(created_by=request.user)
 
@@ -915,6 +909,9 @@ class IssuePaginatedViewSet(BaseViewSet):
             on_result=lambda results: self.process_paginated_result(
                 required_fields, results, request.user.user_timezone
             ),
+            order_by="updated_at",
+            keyset=request.GET.get("pagination") == "keyset",
+            count_mode=count_mode,
         )
 
         return Response(paginated_data, status=status.HTTP_200_OK)
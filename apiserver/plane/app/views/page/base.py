@@ -19,7 +19,7 @@ from rest_framework import status
 from rest_framework.response import Response
 
 # Module imports
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import allow_permission, get_membership, ROLE
 from plane.app.serializers import (
     PageLogSerializer,
     PageSerializer,
@@ -30,14 +30,13 @@ from plane.db.models import (
     Page,
     PageLog,
     UserFavorite,
-    ProjectMember,
     ProjectPage,
     Project,
 )
 from plane.utils.error_codes import ERROR_CODES
 from ..base import BaseAPIView, BaseViewSet
 from plane.bgtasks.page_transaction_task import page_transaction
-from plane.bgtasks.page_version_task import page_version
+from plane.bgtasks.page_save_task import schedule_page_save
 from plane.bgtasks.recent_visited_task import recent_visited_task
 
 
@@ -200,13 +199,7 @@ class PageViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_guest(project_id)
             and not project.guest_view_all_features
             and not page.owned_by == request.user
         ):
@@ -283,13 +276,7 @@ class PageViewSet(BaseViewSet):
         queryset = self.get_queryset()
         project = Project.objects.get(pk=project_id)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_guest(project_id)
             and not project.guest_view_all_features
         ):
             queryset = queryset.filter(owned_by=request.user)
@@ -302,9 +289,9 @@ class PageViewSet(BaseViewSet):
 
         # only the owner or admin can archive the page
         if (
-            ProjectMember.objects.filter(
-                project_id=project_id, member=request.user, is_active=True, role__lte=15
-            ).exists()
+            get_membership(request, slug).is_project_member(
+                project_id, roles=[ROLE.MEMBER.value, ROLE.GUEST.value]
+            )
             and request.user.id != page.owned_by_id
         ):
             return Response(
@@ -329,9 +316,9 @@ class PageViewSet(BaseViewSet):
 
         # only the owner or admin can un archive the page
         if (
-            ProjectMember.objects.filter(
-                project_id=project_id, member=request.user, is_active=True, role__lte=15
-            ).exists()
+            get_membership(request, slug).is_project_member(
+                project_id, roles=[ROLE.MEMBER.value, ROLE.GUEST.value]
+            )
             and request.user.id != page.owned_by_id
         ):
             return Response(
@@ -359,13 +346,9 @@ class PageViewSet(BaseViewSet):
             )
 
         if page.owned_by_id != request.user.id and (
-            not ProjectMember.objects.filter(
-                workspace__slug=slug,
-                member=request.user,
-                role=20,
-                project_id=project_id,
-                is_active=True,
-            ).exists()
+            not get_membership(request, slug).is_project_member(
+                project_id, roles=[ROLE.ADMIN.value]
+            )
         ):
             return Response(
                 {"error": "Only admin or owner can delete the page"},
@@ -522,10 +505,8 @@ class PagesDescriptionViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Serialize the existing instance
-        existing_instance = json.dumps(
-            {"description_html": page.description_html}, cls=DjangoJSONEncoder
-        )
+        # The description before the update
+        existing_html = page.description_html
 
         # Get the base64 data from the request
         base64_data = request.data.get("description_binary")
@@ -534,22 +515,16 @@ class PagesDescriptionViewSet(BaseViewSet):
         if base64_data:
             # Decode the base64 data to bytes
             new_binary_data = base64.b64decode(base64_data)
-            # capture the page transaction
-            if request.data.get("description_html"):
-                page_transaction.delay(
-                    new_value=request.data, old_value=existing_instance, page_id=pk
-                )
             # Store the updated binary data
             page.description_binary = new_binary_data
             page.description_html = request.data.get("description_html")
             page.description = request.data.get("description")
             page.save()
-            # Return a success response
-            page_version.delay(
-                page_id=page.id,
-                existing_instance=existing_instance,
-                user_id=request.user.id,
+            # Capture the page transactions and version of the save
+            schedule_page_save(
+                page_id=page.id, existing_html=existing_html, user_id=request.user.id
             )
+            # Return a success response
             return Response({"message": "Updated successfully"})
         else:
             return Response({"error": "No binary data provided"})
@@ -7,6 +7,7 @@ from plane.db.models import PageVersion
 from ..base import BaseAPIView
 from plane.app.serializers import PageVersionSerializer, PageVersionDetailSerializer
 from plane.app.permissions import allow_permission, ROLE
+from plane.utils.description_version import materialize_version
 
 
 class PageVersionEndpoint(BaseAPIView):
@@ -18,6 +19,8 @@ class PageVersionEndpoint(BaseAPIView):
             page_version = PageVersion.objects.get(
                 workspace__slug=slug, page_id=page_id, pk=pk
             )
+            # Rebuild the description of a version stored as a delta
+            materialize_version(page_version, "page_id")
             # Serialize the page version
             serializer = PageVersionDetailSerializer(page_version)
             return Response(serializer.data, status=status.HTTP_200_OK)
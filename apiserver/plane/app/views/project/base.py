@@ -613,7 +613,7 @@ class ProjectPublicCoverImagesEndpoint(BaseAPIView):
     permission_classes = [AllowAny]
 
     # Cache the below api for 24 hours
-    @cache_response(60 * 60 * 24, user=False)
+    @cache_response(60 * 60 * 24, user=False, stale_timeout=60 * 60)
     def get(self, request):
         files = []
         if settings.USE_MINIO:
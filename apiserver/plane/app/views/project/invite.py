@@ -17,7 +17,7 @@ from rest_framework.permissions import AllowAny
 from .base import BaseViewSet, BaseAPIView
 from plane.app.serializers import ProjectMemberInviteSerializer
 
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import allow_permission, invalidate_memberships, ROLE
 
 from plane.db.models import (
     ProjectMember,
@@ -163,6 +163,8 @@ class UserProjectInvitationsViewset(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        # The bulk writes skip the signals dropping the cached roles
+        invalidate_memberships([request.user.id], [slug])
 
         IssueUserProperty.objects.bulk_create(
             [
@@ -11,6 +11,7 @@ from plane.app.serializers import (
 )
 
 from plane.app.permissions import (
+    invalidate_memberships,
     ProjectMemberPermission,
     ProjectLitePermission,
     WorkspaceUserPermission,
@@ -149,6 +150,8 @@ class ProjectMemberViewSet(BaseViewSet):
         project_members = ProjectMember.objects.bulk_create(
             bulk_project_members, batch_size=10, ignore_conflicts=True
         )
+        # The bulk writes skip the signals dropping the cached roles
+        invalidate_memberships(member_roles.keys(), [slug])
 
         _ = IssueUserProperty.objects.bulk_create(
             bulk_issue_props, batch_size=10, ignore_conflicts=True
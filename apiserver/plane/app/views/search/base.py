@@ -1,7 +1,8 @@
 # Python imports
-import re
+from functools import partial
 
 # Django imports
+from django.conf import settings
 from django.db.models import Q, OuterRef, Subquery, Value, UUIDField, CharField
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
@@ -21,8 +22,18 @@ from plane.db.models import (
     Module,
     Page,
     IssueView,
+    ProjectMember,
     ProjectPage,
 )
+from plane.utils.issue_search import issue_search_filter
+from plane.utils.search import (
+    SEARCH_RESULTS_LIMIT,
+    database_search,
+    run_searches,
+    search_query,
+    search_rank,
+    with_search_vector,
+)
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -30,6 +41,15 @@ class GlobalSearchEndpoint(BaseAPIView):
     also show related workspace if found
     """
 
+    def member_projects(self, slug):
+        """Active projects of the workspace the user is a member of"""
+        return ProjectMember.objects.filter(
+            member=self.request.user,
+            is_active=True,
+            project__archived_at__isnull=True,
+            workspace__slug=slug,
+        ).values("project_id")
+
     def filter_workspaces(self, query, slug, project_id, workspace_search):
         fields = ["name"]
         q = Q()
@@ -38,7 +58,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         return (
             Workspace.objects.filter(q, workspace_member__member=self.request.user)
             .distinct()
-            .values("name", "id", "slug")
+            .values("name", "id", "slug")[:SEARCH_RESULTS_LIMIT]
         )
 
     def filter_projects(self, query, slug, project_id, workspace_search):
@@ -55,40 +75,35 @@ class GlobalSearchEndpoint(BaseAPIView):
                 workspace__slug=slug,
             )
             .distinct()
-            .values("name", "id", "identifier", "workspace__slug")
+            .values("name", "id", "identifier", "workspace__slug")[
+                :SEARCH_RESULTS_LIMIT
+            ]
         )
 
     def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                # Match whole integers only (exclude decimal numbers)
-                sequences = re.findall(r"\b\d+\b", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
-
-        issues = Issue.issue_objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
-        )
+        text_query = search_query(query)
+        issues = with_search_vector(
+            Issue.issue_objects.filter(
+                project_id__in=self.member_projects(slug), workspace__slug=slug
+            )
+        ).filter(issue_search_filter(query, text_query, slug))
 
         if workspace_search == "false" and project_id:
             issues = issues.filter(project_id=project_id)
 
-        return issues.distinct().values(
-            "name",
-            "id",
-            "sequence_id",
-            "project__identifier",
-            "project_id",
-            "workspace__slug",
-        )[:100]
+        return (
+            issues.annotate(search_rank=search_rank(text_query))
+            .order_by("-search_rank", "-created_at")
+            .distinct()
+            .values(
+                "name",
+                "id",
+                "sequence_id",
+                "project__identifier",
+                "project_id",
+                "workspace__slug",
+            )[:SEARCH_RESULTS_LIMIT]
+        )
 
     def filter_cycles(self, query, slug, project_id, workspace_search):
         fields = ["name"]
@@ -97,19 +112,15 @@ class GlobalSearchEndpoint(BaseAPIView):
             q |= Q(**{f"{field}__icontains": query})
 
         cycles = Cycle.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
+            q, project_id__in=self.member_projects(slug), workspace__slug=slug
         )
 
         if workspace_search == "false" and project_id:
             cycles = cycles.filter(project_id=project_id)
 
-        return cycles.distinct().values(
+        return cycles.values(
             "name", "id", "project_id", "project__identifier", "workspace__slug"
-        )
+        )[:SEARCH_RESULTS_LIMIT]
 
     def filter_modules(self, query, slug, project_id, workspace_search):
         fields = ["name"]
@@ -118,29 +129,25 @@ class GlobalSearchEndpoint(BaseAPIView):
             q |= Q(**{f"{field}__icontains": query})
 
         modules = Module.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
+            q, project_id__in=self.member_projects(slug), workspace__slug=slug
         )
 
         if workspace_search == "false" and project_id:
             modules = modules.filter(project_id=project_id)
 
-        return modules.distinct().values(
+        return modules.values(
             "name", "id", "project_id", "project__identifier", "workspace__slug"
-        )
+        )[:SEARCH_RESULTS_LIMIT]
 
     def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
+        text_query = search_query(query)
+        if text_query is None:
+            return []
 
         pages = (
-            Page.objects.filter(
-                q,
+            with_search_vector(Page.objects.all())
+            .filter(
+                search_vector=text_query,
                 projects__project_projectmember__member=self.request.user,
                 projects__project_projectmember__is_active=True,
                 projects__archived_at__isnull=True,
@@ -175,8 +182,13 @@ class GlobalSearchEndpoint(BaseAPIView):
                 project_id=project_id
             )
 
-        return pages.distinct().values(
-            "name", "id", "project_ids", "project_identifiers", "workspace__slug"
+        return (
+            pages.annotate(search_rank=search_rank(text_query))
+            .order_by("-search_rank", "-created_at")
+            .distinct()
+            .values(
+                "name", "id", "project_ids", "project_identifiers", "workspace__slug"
+            )[:SEARCH_RESULTS_LIMIT]
         )
 
     def filter_views(self, query, slug, project_id, workspace_search):
@@ -186,19 +198,15 @@ class GlobalSearchEndpoint(BaseAPIView):
             q |= Q(**{f"{field}__icontains": query})
 
         issue_views = IssueView.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
+            q, project_id__in=self.member_projects(slug), workspace__slug=slug
         )
 
         if workspace_search == "false" and project_id:
             issue_views = issue_views.filter(project_id=project_id)
 
-        return issue_views.distinct().values(
+        return issue_views.values(
             "name", "id", "project_id", "project__identifier", "workspace__slug"
-        )
+        )[:SEARCH_RESULTS_LIMIT]
 
     def get(self, request, slug):
         query = request.query_params.get("search", False)
@@ -231,9 +239,18 @@ class GlobalSearchEndpoint(BaseAPIView):
             "page": self.filter_pages,
         }
 
-        results = {}
-
-        for model in MODELS_MAPPER.keys():
-            func = MODELS_MAPPER.get(model, None)
-            results[model] = func(query, slug, project_id, workspace_search)
-        return Response({"results": results}, status=status.HTTP_200_OK)
+        # Every entity is searched on its own connection, the entities not
+        # searched in time are left out of the results
+        timeout = settings.GLOBAL_SEARCH_TIMEOUT
+        results, timed_out = run_searches(
+            {
+                model: database_search(
+                    partial(func, query, slug, project_id, workspace_search), timeout
+                )
+                for model, func in MODELS_MAPPER.items()
+            },
+            timeout,
+        )
+        return Response(
+            {"results": results, "timed_out": timed_out}, status=status.HTTP_200_OK
+        )
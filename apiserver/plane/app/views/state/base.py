@@ -10,7 +10,7 @@ from .. import BaseViewSet
 from plane.app.serializers import StateSerializer
 from plane.app.permissions import ROLE, allow_permission
 from plane.db.models import State, Issue
-from plane.utils.cache import invalidate_cache
+from plane.utils.cache import WORKSPACE_TAG, invalidate_cache
 
 
 class StateViewSet(BaseViewSet):
@@ -34,7 +34,12 @@ class StateViewSet(BaseViewSet):
             .distinct()
         )
 
-    @invalidate_cache(path="workspaces/:slug/states/", url_params=True, user=False)
+    @invalidate_cache(
+        path="workspaces/:slug/states/",
+        url_params=True,
+        user=False,
+        tags=[WORKSPACE_TAG],
+    )
     @allow_permission([ROLE.ADMIN])
     def create(self, request, slug, project_id):
         serializer = StateSerializer(data=request.data)
@@ -57,7 +62,12 @@ class StateViewSet(BaseViewSet):
             return Response(state_dict, status=status.HTTP_200_OK)
         return Response(states, status=status.HTTP_200_OK)
 
-    @invalidate_cache(path="workspaces/:slug/states/", url_params=True, user=False)
+    @invalidate_cache(
+        path="workspaces/:slug/states/",
+        url_params=True,
+        user=False,
+        tags=[WORKSPACE_TAG],
+    )
     @allow_permission([ROLE.ADMIN])
     def mark_as_default(self, request, slug, project_id, pk):
         # Select all the states which are marked as default
@@ -69,7 +79,12 @@ class StateViewSet(BaseViewSet):
         ).update(default=True)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-    @invalidate_cache(path="workspaces/:slug/states/", url_params=True, user=False)
+    @invalidate_cache(
+        path="workspaces/:slug/states/",
+        url_params=True,
+        user=False,
+        tags=[WORKSPACE_TAG],
+    )
     @allow_permission([ROLE.ADMIN])
     def destroy(self, request, slug, project_id, pk):
         state = State.objects.get(
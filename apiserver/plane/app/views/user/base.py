@@ -12,6 +12,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 
 # Module imports
+from plane.app.permissions import invalidate_memberships
 from plane.app.serializers import (
     AccountSerializer,
     IssueActivitySerializer,
@@ -143,6 +144,13 @@ class UserEndpoint(BaseViewSet):
         WorkspaceMember.objects.bulk_update(
             workspaces_to_deactivate, ["is_active"], batch_size=100
         )
+        # The bulk writes skip the signals dropping the cached roles
+        invalidate_memberships(
+            [request.user.id],
+            WorkspaceMember.objects.filter(member=request.user).values_list(
+                "workspace__slug", flat=True
+            ),
+        )
 
         # Delete all workspace invites
         WorkspaceMemberInvite.objects.filter(email=user.email).delete()
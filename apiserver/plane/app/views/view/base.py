@@ -12,7 +12,7 @@ from rest_framework import status
 from rest_framework.response import Response
 
 # Module imports
-from plane.app.permissions import allow_permission, ROLE
+from plane.app.permissions import allow_permission, get_membership, ROLE
 from plane.app.serializers import IssueViewSerializer
 from plane.db.models import (
     Issue,
@@ -20,8 +20,6 @@ from plane.db.models import (
     IssueLink,
     IssueView,
     Workspace,
-    WorkspaceMember,
-    ProjectMember,
     Project,
     CycleIssue,
 )
@@ -64,9 +62,7 @@ class WorkspaceViewViewSet(BaseViewSet):
     def list(self, request, slug):
         queryset = self.get_queryset()
         fields = [field for field in request.GET.get("fields", "").split(",") if field]
-        if WorkspaceMember.objects.filter(
-            workspace__slug=slug, member=request.user, role=5, is_active=True
-        ).exists():
+        if get_membership(request, slug).is_workspace_guest():
             queryset = queryset.filter(owned_by=request.user)
         views = IssueViewSerializer(
             queryset, many=True, fields=fields if fields else None
@@ -121,10 +117,10 @@ class WorkspaceViewViewSet(BaseViewSet):
     def destroy(self, request, slug, pk):
         workspace_view = IssueView.objects.get(pk=pk, workspace__slug=slug)
 
-        workspace_member = WorkspaceMember.objects.filter(
-            workspace__slug=slug, member=request.user, role=20, is_active=True
-        )
-        if workspace_member.exists() or workspace_view.owned_by == request.user:
+        if (
+            get_membership(request, slug).is_workspace_member(roles=[ROLE.ADMIN.value])
+            or workspace_view.owned_by == request.user
+        ):
             workspace_view.delete()
             # Delete the user favorite view
             UserFavorite.objects.filter(
@@ -393,13 +389,7 @@ class IssueViewViewSet(BaseViewSet):
         queryset = self.get_queryset()
         project = Project.objects.get(id=project_id)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_guest(project_id)
             and not project.guest_view_all_features
         ):
             queryset = queryset.filter(owned_by=request.user)
@@ -419,13 +409,7 @@ class IssueViewViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_guest(project_id)
             and not project.guest_view_all_features
             and not issue_view.owned_by == request.user
         ):
@@ -478,13 +462,9 @@ class IssueViewViewSet(BaseViewSet):
             pk=pk, project_id=project_id, workspace__slug=slug
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=20,
-                is_active=True,
-            ).exists()
+            get_membership(request, slug).is_project_member(
+                project_id, roles=[ROLE.ADMIN.value]
+            )
             or project_view.owned_by_id == request.user.id
         ):
             project_view.delete()
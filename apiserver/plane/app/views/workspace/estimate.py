@@ -7,13 +7,13 @@ from plane.app.permissions import WorkspaceEntityPermission
 from plane.app.serializers import WorkspaceEstimateSerializer
 from plane.app.views.base import BaseAPIView
 from plane.db.models import Estimate, Project
-from plane.utils.cache import cache_response
+from plane.utils.cache import WORKSPACE_TAG, cache_response
 
 
 class WorkspaceEstimatesEndpoint(BaseAPIView):
     permission_classes = [WorkspaceEntityPermission]
 
-    @cache_response(60 * 60 * 2)
+    @cache_response(60 * 60 * 2, tags=[WORKSPACE_TAG])
     def get(self, request, slug):
         estimate_ids = Project.objects.filter(
             workspace__slug=slug, estimate__isnull=False
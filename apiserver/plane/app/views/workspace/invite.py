@@ -16,7 +16,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 # Module imports
-from plane.app.permissions import WorkSpaceAdminPermission
+from plane.app.permissions import WorkSpaceAdminPermission, invalidate_memberships
 from plane.app.serializers import (
     WorkSpaceMemberInviteSerializer,
     WorkSpaceMemberSerializer,
@@ -289,6 +289,11 @@ class UserWorkspaceInvitationsViewSet(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        # The bulk writes skip the signals dropping the cached roles
+        invalidate_memberships(
+            [request.user.id],
+            [invitation.workspace.slug for invitation in workspace_invitations],
+        )
 
         # Delete joined workspace invites
         workspace_invitations.delete()
@@ -7,13 +7,13 @@ from plane.app.serializers import LabelSerializer
 from plane.app.views.base import BaseAPIView
 from plane.db.models import Label
 from plane.app.permissions import WorkspaceViewerPermission
-from plane.utils.cache import cache_response
+from plane.utils.cache import WORKSPACE_TAG, cache_response
 
 
 class WorkspaceLabelsEndpoint(BaseAPIView):
     permission_classes = [WorkspaceViewerPermission]
 
-    @cache_response(60 * 60 * 2)
+    @cache_response(60 * 60 * 2, tags=[WORKSPACE_TAG])
     def get(self, request, slug):
         labels = Label.objects.filter(
             workspace__slug=slug,
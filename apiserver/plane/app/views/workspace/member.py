@@ -6,7 +6,12 @@ from django.db.models.functions import Coalesce
 from rest_framework import status
 from rest_framework.response import Response
 
-from plane.app.permissions import WorkspaceEntityPermission, allow_permission, ROLE
+from plane.app.permissions import (
+    WorkspaceEntityPermission,
+    allow_permission,
+    invalidate_memberships,
+    ROLE,
+)
 
 # Module imports
 from plane.app.serializers import (
@@ -72,6 +77,7 @@ class WorkSpaceMemberViewSet(BaseViewSet):
             _ = ProjectMember.objects.filter(
                 workspace__slug=slug, member_id=workspace_member.member_id
             ).update(role=int(request.data.get("role")))
+            invalidate_memberships([workspace_member.member_id], [slug])
 
         serializer = WorkSpaceMemberSerializer(
             workspace_member, data=request.data, partial=True
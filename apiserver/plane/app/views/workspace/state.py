@@ -7,13 +7,13 @@ from plane.app.serializers import StateSerializer
 from plane.app.views.base import BaseAPIView
 from plane.db.models import State
 from plane.app.permissions import WorkspaceEntityPermission
-from plane.utils.cache import cache_response
+from plane.utils.cache import WORKSPACE_TAG, cache_response
 
 
 class WorkspaceStatesEndpoint(BaseAPIView):
     permission_classes = [WorkspaceEntityPermission]
 
-    @cache_response(60 * 60 * 2)
+    @cache_response(60 * 60 * 2, tags=[WORKSPACE_TAG])
     def get(self, request, slug):
         states = State.objects.filter(
             workspace__slug=slug,
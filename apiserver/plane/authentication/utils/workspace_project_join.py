@@ -1,3 +1,4 @@
+from plane.app.permissions import invalidate_memberships
 from plane.db.models import (
     ProjectMember,
     ProjectMemberInvite,
@@ -78,6 +79,15 @@ def process_workspace_project_invitations(user):
         ignore_conflicts=True,
     )
 
+    # The bulk writes skip the signals dropping the cached roles
+    invalidate_memberships(
+        [user.id],
+        {
+            *workspace_member_invites.values_list("workspace__slug", flat=True),
+            *project_member_invites.values_list("workspace__slug", flat=True),
+        },
+    )
+
     # Delete all the invites
     workspace_member_invites.delete()
     project_member_invites.delete()
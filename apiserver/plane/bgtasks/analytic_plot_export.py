@@ -44,14 +44,23 @@ CYCLE_ID = "issue_cycle__cycle_id"
 MODULE_ID = "issue_module__module_id"
 
 
-def send_export_email(email, slug, csv_buffer, rows):
+ENTITY_NAMES = {
+    ASSIGNEE_ID: lambda user: (
+        f"{user['assignees__first_name']} {user['assignees__last_name']}"
+    ),
+    LABEL_ID: lambda label: label["labels__name"],
+    STATE_ID: lambda state: state["state__name"],
+    CYCLE_ID: lambda cycle: cycle["issue_cycle__cycle__name"],
+    MODULE_ID: lambda module: module["issue_module__module__name"],
+}
+
+
+def send_export_email(email, slug, csv_buffer):
     """Helper function to send export email."""
     subject = "Your Export is ready"
     html_content = render_to_string("emails/exports/analytics.html", {})
     text_content = strip_tags(html_content)
 
-    csv_buffer.seek(0)
-
     (
         EMAIL_HOST,
         EMAIL_HOST_USER,
@@ -175,215 +184,66 @@ def get_cycle_details(slug, filters):
     )
 
 
+def build_name_index(field, details):
+    """Map the ids of the entities of an axis to their name in a single pass"""
+    if field not in ENTITY_NAMES:
+        return {}
+    return {str(detail[field]): ENTITY_NAMES[field](detail) for detail in details}
+
+
 def generate_csv_from_rows(rows):
-    """Generate CSV buffer from rows."""
+    """Write the rows to a CSV buffer as they are generated."""
     csv_buffer = io.StringIO()
     writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
-    [writer.writerow(row) for row in rows]
+    writer.writerows(rows)
     return csv_buffer
 
 
-def generate_segmented_rows(
-    distribution,
-    x_axis,
-    y_axis,
-    segment,
-    key,
-    assignee_details,
-    label_details,
-    state_details,
-    cycle_details,
-    module_details,
-):
-    segment_zero = list(
-        set(
+def generate_segmented_rows(distribution, x_axis, y_axis, segment, key, details):
+    """
+    Yield the header and a row per x axis value, with a column per segment
+
+    The distribution is pivoted into a dense matrix through a column index of
+    the segments, the ids are named through dict indexes built once per axis.
+    """
+    segments = list(
+        dict.fromkeys(
             item.get("segment") for sublist in distribution.values() for item in sublist
         )
     )
+    columns = {segment_id: index for index, segment_id in enumerate(segments)}
+    item_names = build_name_index(x_axis, details.get(x_axis, []))
+    segment_names = build_name_index(segment, details.get(segment, []))
 
-    segmented = segment
-
-    row_zero = [
+    yield (
         row_mapping.get(x_axis, "X-Axis"),
         row_mapping.get(y_axis, "Y-Axis"),
-    ] + segment_zero
+        *(segment_names.get(str(segment_id), segment_id) for segment_id in segments),
+    )
 
-    rows = []
     for item, data in distribution.items():
-        generated_row = [
-            item,
-            sum(obj.get(key) for obj in data if obj.get(key) is not None),
-        ]
-
-        for segment in segment_zero:
-            value = next((x.get(key) for x in data if x.get("segment") == segment), "0")
-            generated_row.append(value)
-
-        if x_axis == ASSIGNEE_ID:
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(item)
-                ),
-                None,
-            )
-            if assignee:
-                generated_row[0] = (
-                    f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-                )
-
-        if x_axis == LABEL_ID:
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(item)), None
-            )
-
-            if label:
-                generated_row[0] = f"{label['labels__name']}"
-
-        if x_axis == STATE_ID:
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(item)), None
-            )
-
-            if state:
-                generated_row[0] = f"{state['state__name']}"
-
-        if x_axis == CYCLE_ID:
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(item)), None
-            )
-
-            if cycle:
-                generated_row[0] = f"{cycle['issue_cycle__cycle__name']}"
-
-        if x_axis == MODULE_ID:
-            module = next(
-                (mod for mod in module_details if str(mod[MODULE_ID]) == str(item)),
-                None,
-            )
-
-            if module:
-                generated_row[0] = f"{module['issue_module__module__name']}"
-
-        rows.append(tuple(generated_row))
-
-    if segmented == ASSIGNEE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(segm)
-                ),
-                None,
-            )
-            if assignee:
-                row_zero[index + 2] = (
-                    f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-                )
-
-    if segmented == LABEL_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(segm)), None
-            )
-            if label:
-                row_zero[index + 2] = label["labels__name"]
-
-    if segmented == STATE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(segm)), None
-            )
-            if state:
-                row_zero[index + 2] = state["state__name"]
-
-    if segmented == MODULE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            module = next(
-                (mod for mod in label_details if str(mod[MODULE_ID]) == str(segm)), None
-            )
-            if module:
-                row_zero[index + 2] = module["issue_module__module__name"]
-
-    if segmented == CYCLE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(segm)), None
-            )
-            if cycle:
-                row_zero[index + 2] = cycle["issue_cycle__cycle__name"]
-
-    return [tuple(row_zero)] + rows
-
-
-def generate_non_segmented_rows(
-    distribution,
-    x_axis,
-    y_axis,
-    key,
-    assignee_details,
-    label_details,
-    state_details,
-    cycle_details,
-    module_details,
-):
-    rows = []
+        values = ["0"] * len(segments)
+        filled = [False] * len(segments)
+        total = 0
+        for obj in data:
+            value = obj.get(key)
+            if value is not None:
+                total += value
+            # The first value of a segment is kept, as several may share it
+            column = columns[obj.get("segment")]
+            if not filled[column]:
+                values[column] = value
+                filled[column] = True
+
+        yield (item_names.get(str(item), item), total, *values)
+
+
+def generate_non_segmented_rows(distribution, x_axis, y_axis, key, details):
+    yield (row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis"))
+
+    item_names = build_name_index(x_axis, details.get(x_axis, []))
     for item, data in distribution.items():
-        row = [item, data[0].get("count" if y_axis == "issue_count" else "estimate")]
-
-        if x_axis == ASSIGNEE_ID:
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(item)
-                ),
-                None,
-            )
-            if assignee:
-                row[0] = (
-                    f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-                )
-
-        if x_axis == LABEL_ID:
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(item)), None
-            )
-
-            if label:
-                row[0] = f"{label['labels__name']}"
-
-        if x_axis == STATE_ID:
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(item)), None
-            )
-
-            if state:
-                row[0] = f"{state['state__name']}"
-
-        if x_axis == CYCLE_ID:
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(item)), None
-            )
-
-            if cycle:
-                row[0] = f"{cycle['issue_cycle__cycle__name']}"
-
-        if x_axis == MODULE_ID:
-            module = next(
-                (mod for mod in module_details if str(mod[MODULE_ID]) == str(item)),
-                None,
-            )
-
-            if module:
-                row[0] = f"{module['issue_module__module__name']}"
-
-        rows.append(tuple(row))
-
-    row_zero = [row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis")]
-    return [tuple(row_zero)] + rows
+        yield (item_names.get(str(item), item), data[0].get(key))
 
 
 @shared_task
@@ -401,64 +261,30 @@ def analytic_export_task(email, data, slug):
         )
         key = "count" if y_axis == "issue_count" else "estimate"
 
-        assignee_details = (
-            get_assignee_details(slug, filters)
-            if x_axis == ASSIGNEE_ID or segment == ASSIGNEE_ID
-            else {}
-        )
-
-        label_details = (
-            get_label_details(slug, filters)
-            if x_axis == LABEL_ID or segment == LABEL_ID
-            else {}
-        )
-
-        state_details = (
-            get_state_details(slug, filters)
-            if x_axis == STATE_ID or segment == STATE_ID
-            else {}
-        )
-
-        cycle_details = (
-            get_cycle_details(slug, filters)
-            if x_axis == CYCLE_ID or segment == CYCLE_ID
-            else {}
-        )
-
-        module_details = (
-            get_module_details(slug, filters)
-            if x_axis == MODULE_ID or segment == MODULE_ID
-            else {}
-        )
+        details_getters = {
+            ASSIGNEE_ID: get_assignee_details,
+            LABEL_ID: get_label_details,
+            STATE_ID: get_state_details,
+            CYCLE_ID: get_cycle_details,
+            MODULE_ID: get_module_details,
+        }
+        details = {
+            field: details_getters[field](slug, filters)
+            for field in {x_axis, segment}
+            if field in details_getters
+        }
 
         if segment:
             rows = generate_segmented_rows(
-                distribution,
-                x_axis,
-                y_axis,
-                segment,
-                key,
-                assignee_details,
-                label_details,
-                state_details,
-                cycle_details,
-                module_details,
+                distribution, x_axis, y_axis, segment, key, details
             )
         else:
             rows = generate_non_segmented_rows(
-                distribution,
-                x_axis,
-                y_axis,
-                key,
-                assignee_details,
-                label_details,
-                state_details,
-                cycle_details,
-                module_details,
+                distribution, x_axis, y_axis, key, details
             )
 
         csv_buffer = generate_csv_from_rows(rows)
-        send_export_email(email, slug, csv_buffer, rows)
+        send_export_email(email, slug, csv_buffer)
         logging.getLogger("plane").info("Email sent succesfully.")
         return
     except Exception as e:
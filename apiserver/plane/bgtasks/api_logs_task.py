@@ -1,15 +1,59 @@
+import json
+
+from django.conf import settings
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from datetime import timedelta
 from plane.db.models import APIActivityLog
+from plane.settings.redis import redis_instance
+from plane.utils.purge import purge
+from plane.utils.api_activity_log import (
+    API_ACTIVITY_LOG_FLUSH_KEY,
+    API_ACTIVITY_LOG_KEY,
+)
 from celery import shared_task
 
 
 @shared_task
 def delete_api_logs():
-    # Get the logs older than 30 days to delete
-    logs_to_delete = APIActivityLog.objects.filter(
-        created_at__lte=timezone.now() - timedelta(days=30)
+    # Delete the logs older than 30 days
+    purge(
+        "api_logs",
+        models=[APIActivityLog],
+        field="created_at",
+        cutoff=timezone.now() - timedelta(days=30),
     )
 
-    # Delete the logs
-    logs_to_delete._raw_delete(logs_to_delete.db)
+
+@shared_task
+def flush_api_activity_logs():
+    ri = redis_instance()
+    batch_size = settings.API_ACTIVITY_LOG_BATCH_SIZE
+    # Allow the next burst to schedule a flush while this one drains the list
+    ri.delete(API_ACTIVITY_LOG_FLUSH_KEY)
+
+    while True:
+        # Take a batch off the head of the list atomically
+        pipeline = ri.pipeline(transaction=True)
+        pipeline.lrange(API_ACTIVITY_LOG_KEY, 0, batch_size - 1)
+        pipeline.ltrim(API_ACTIVITY_LOG_KEY, batch_size, -1)
+        records = pipeline.execute()[0]
+        if not records:
+            return
+
+        flushed_at = timezone.now()
+        logs = []
+        for record in records:
+            log = APIActivityLog(**json.loads(record))
+            # Keep the time the request was made at
+            log.created_at = log.updated_at = (
+                parse_datetime(log.created_at) if log.created_at else flushed_at
+            )
+            logs.append(log)
+        # A raw insert keeps the timestamps set above in a single statement,
+        # bulk_create would stamp the rows with the flush time on auto_now_add
+        APIActivityLog.objects._insert(
+            logs, fields=APIActivityLog._meta.concrete_fields, raw=True
+        )
+        if len(records) < batch_size:
+            return
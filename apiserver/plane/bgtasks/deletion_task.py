@@ -1,14 +1,124 @@
+# Python imports
+import logging
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.db import models
-from django.db.models.fields.related import OneToOneRel
+from django.db.models.signals import post_save
 
 
 # Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.settings.redis import redis_instance
+
+
+SOFT_DELETE_PROGRESS_TIMEOUT = 86400
+
+
+def soft_delete_progress_key(app_label, model_name, instance_pk):
+    return f"soft_delete:{app_label}.{model_name}:{instance_pk}"
+
+
+@lru_cache(maxsize=None)
+def get_cascade_plan(model):
+    """
+    Return the (related model, field, action) of every reverse relation of the
+    model, action being "set_null" or "cascade"
+    """
+    plan = []
+    for relation in model._meta.get_fields():
+        if not (
+            (relation.one_to_many or relation.one_to_one)
+            and relation.auto_created
+            and not relation.concrete
+        ):
+            continue
+
+        # Get the on_delete behavior name
+        on_delete_name = getattr(relation.on_delete, "__name__", "")
+        if on_delete_name == "DO_NOTHING":
+            continue
+        elif on_delete_name == "SET_NULL":
+            plan.append((relation.related_model, relation.field, "set_null"))
+        elif hasattr(relation.related_model, "deleted_at"):
+            # Handle CASCADE and other delete behaviors of soft deletable models
+            plan.append((relation.related_model, relation.field, "cascade"))
+    return plan
+
+
+def update_in_batches(queryset, values, batch_size):
+    """Update the rows of the queryset in primary key batches, returns the count"""
+    model = queryset.model
+    count = 0
+    while True:
+        pks = list(queryset.order_by().values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return count
+        if post_save.has_listeners(model):
+            # Saved row by row so the receivers keeping caches in sync still run
+            for obj in model._base_manager.filter(pk__in=pks):
+                for name, value in values.items():
+                    setattr(obj, name, value)
+                obj.save(update_fields=list(values))
+            count += len(pks)
+        else:
+            count += model._base_manager.filter(pk__in=pks).update(**values)
+
+
+def soft_delete_cascade(instance, deleted_at, batch_size, progress=None):
+    """
+    Soft delete everything cascading from the instance, relation level by
+    relation level with set based updates
+
+    Every row of the cascade gets the deleted_at of the instance which is what
+    finds the parents of the next level, so running it again after an
+    interruption resumes where it stopped.
+    """
+    model = instance._meta.concrete_model
+    parents = {model: model._base_manager.filter(pk=instance.pk)}
+    visited = set()
+
+    while parents:
+        deleted = {}
+        for parent_model, parent_queryset in parents.items():
+            visited.add(parent_model)
+            for related_model, field, action in get_cascade_plan(parent_model):
+                related = related_model._base_manager.filter(
+                    **{
+                        f"{field.name}__in": parent_queryset.values(
+                            field.target_field.attname
+                        )
+                    }
+                )
+                if hasattr(related_model, "deleted_at"):
+                    related = related.filter(deleted_at__isnull=True)
+
+                if action == "set_null":
+                    update_in_batches(related, {field.name: None}, batch_size)
+                    continue
+
+                values = {"deleted_at": deleted_at}
+                if hasattr(related_model, "updated_at"):
+                    values["updated_at"] = timezone.now()
+                count = update_in_batches(related, values, batch_size)
+                if count and progress is not None:
+                    progress(related_model, count)
+
+                related_model = related_model._meta.concrete_model
+                deleted[related_model] = deleted.get(related_model, 0) + count
+
+        # The next level starts from every row of the cascade of the models that
+        # gained rows, or that were never expanded which resumes an interrupted run
+        parents = {
+            related_model: related_model._base_manager.filter(deleted_at=deleted_at)
+            for related_model, count in deleted.items()
+            if count or related_model not in visited
+        }
+
 
 @shared_task
 def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
@@ -24,86 +134,33 @@ def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
     except model_class.DoesNotExist:
         return
 
-    # Get all related fields that are reverse relationships
-    all_related = [
-        f
-        for f in instance._meta.get_fields()
-        if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-    ]
-
-    # Handle each related field
-    for relation in all_related:
-        related_name = relation.get_accessor_name()
-
-        # Skip if the relation doesn't exist
-        if not hasattr(instance, related_name):
-            continue
-
-        # Get the on_delete behavior name
-        on_delete_name = (
-            relation.on_delete.__name__
-            if hasattr(relation.on_delete, "__name__")
-            else ""
-        )
-
-        if on_delete_name == "DO_NOTHING":
-            continue
-
-        elif on_delete_name == "SET_NULL":
-            # Handle SET_NULL relationships
-            if isinstance(relation, OneToOneRel):
-                # For OneToOne relationships
-                related_obj = getattr(instance, related_name, None)
-                if related_obj and isinstance(related_obj, models.Model):
-                    setattr(related_obj, relation.remote_field.name, None)
-                    related_obj.save(update_fields=[relation.remote_field.name])
-            else:
-                # For other relationships
-                related_queryset = getattr(instance, related_name).all()
-                related_queryset.update(**{relation.remote_field.name: None})
-
-        else:
-            # Handle CASCADE and other delete behaviors
-            try:
-                if relation.one_to_one:
-                    # Handle OneToOne relationships
-                    related_obj = getattr(instance, related_name, None)
-                    if related_obj:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-                else:
-                    # Handle other relationships
-                    related_queryset = getattr(instance, related_name).all()
-                    for related_obj in related_queryset:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-            except Exception as e:
-                # Log the error or handle as needed
-                print(f"Error handling relation {related_name}: {str(e)}")
-                continue
-
-    # Finally, soft delete the instance itself if it hasn't been deleted yet
+    # The instance deletion time marks every row of the cascade
     if hasattr(instance, "deleted_at") and not instance.deleted_at:
         instance.deleted_at = timezone.now()
-        instance.save()
+        instance.save(update_fields=["deleted_at"])
+    deleted_at = getattr(instance, "deleted_at", None) or timezone.now()
+
+    ri = redis_instance()
+    key = soft_delete_progress_key(app_label, model_name, instance_pk)
+    logger = logging.getLogger("plane")
+
+    def progress(related_model, count):
+        label = related_model._meta.label_lower
+        ri.hincrby(key, label, count)
+        ri.expire(key, SOFT_DELETE_PROGRESS_TIMEOUT)
+        logger.info(
+            f"Soft deleted {count} {label} of {app_label}.{model_name} {instance_pk}"
+        )
+
+    ri.hset(key, "status", "running")
+    ri.expire(key, SOFT_DELETE_PROGRESS_TIMEOUT)
+    soft_delete_cascade(
+        instance,
+        deleted_at=deleted_at,
+        batch_size=settings.SOFT_DELETE_BATCH_SIZE,
+        progress=progress,
+    )
+    ri.hset(key, "status", "completed")
 
 
 # @shared_task
@@ -113,120 +170,13 @@ def restore_related_objects(app_label, model_name, instance_pk, using=None):
 
 @shared_task
 def hard_delete():
-    from plane.db.models import (
-        Workspace,
-        Project,
-        Cycle,
-        Module,
-        Issue,
-        Page,
-        IssueView,
-        Label,
-        State,
-        IssueActivity,
-        IssueComment,
-        IssueLink,
-        IssueReaction,
-        UserFavorite,
-        ModuleIssue,
-        CycleIssue,
-        Estimate,
-        EstimatePoint,
+    from plane.utils.purge import get_soft_delete_models, purge
+
+    # Children are purged before the rows they reference, in bounded batches
+    purge(
+        "hard_delete",
+        models=get_soft_delete_models(),
+        field="deleted_at",
+        cutoff=timezone.now()
+        - timezone.timedelta(days=settings.HARD_DELETE_AFTER_DAYS),
     )
-
-    days = settings.HARD_DELETE_AFTER_DAYS
-    # check delete workspace
-    _ = Workspace.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete project
-    _ = Project.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete cycle
-    _ = Cycle.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete module
-    _ = Module.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete issue
-    _ = Issue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete page
-    _ = Page.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete view
-    _ = IssueView.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete label
-    _ = Label.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete state
-    _ = State.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueActivity.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueComment.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueLink.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueReaction.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = UserFavorite.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = ModuleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = CycleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = Estimate.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = EstimatePoint.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # at last, check for every thing which ever is left and delete it
-    # Get all Django models
-    all_models = apps.get_models()
-
-    # Iterate through all models
-    for model in all_models:
-        # Check if the model has a 'deleted_at' field
-        if hasattr(model, "deleted_at"):
-            # Get all instances where 'deleted_at' is greater than 30 days ago
-            _ = model.all_objects.filter(
-                deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-            ).delete()
-
-    return
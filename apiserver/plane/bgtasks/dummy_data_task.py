@@ -4,7 +4,7 @@ import random
 from datetime import datetime, timedelta
 
 # Django imports
-from django.db.models import Max
+from django.db import transaction
 
 # Third party imports
 from celery import shared_task
@@ -33,6 +33,7 @@ from plane.db.models import (
     Intake,
     IntakeIssue,
 )
+from plane.db.models.issue import reserve_issue_numbers
 
 
 def create_project(workspace, user_id):
@@ -288,22 +289,6 @@ def create_issues(workspace, project, user_id, issue_count):
 
     issues = []
 
-    # Get the maximum sequence_id
-    last_id = IssueSequence.objects.filter(project=project).aggregate(
-        largest=Max("sequence")
-    )["largest"]
-
-    last_id = 1 if last_id is None else last_id + 1
-
-    # Get the maximum sort order
-    largest_sort_order = Issue.objects.filter(
-        project=project, state_id=states[random.randint(0, len(states) - 1)]
-    ).aggregate(largest=Max("sort_order"))["largest"]
-
-    largest_sort_order = (
-        65535 if largest_sort_order is None else largest_sort_order + 10000
-    )
-
     for _ in range(0, issue_count):
         start_date = [None, fake.date_this_year()][random.randint(0, 1)]
         end_date = (
@@ -324,8 +309,6 @@ def create_issues(workspace, project, user_id, issue_count):
                 name=text[:254],
                 description_html=f"<p>{text}</p>",
                 description_stripped=text,
-                sequence_id=last_id,
-                sort_order=largest_sort_order,
                 start_date=start_date,
                 target_date=end_date,
                 priority=["urgent", "high", "medium", "low", "none"][
@@ -335,10 +318,12 @@ def create_issues(workspace, project, user_id, issue_count):
             )
         )
 
-        largest_sort_order = largest_sort_order + random.randint(0, 1000)
-        last_id = last_id + 1
-
-    issues = Issue.objects.bulk_create(issues, ignore_conflicts=True, batch_size=1000)
+    with transaction.atomic():
+        # Reserve the sequence ids and sort orders of the whole batch
+        reserve_issue_numbers(issues)
+        issues = Issue.objects.bulk_create(
+            issues, ignore_conflicts=True, batch_size=1000
+        )
     # Sequences
     _ = IssueSequence.objects.bulk_create(
         [
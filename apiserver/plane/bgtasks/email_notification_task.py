@@ -6,10 +6,12 @@ from bs4 import BeautifulSoup
 
 # Third party imports
 from celery import shared_task
+from django.conf import settings
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 
 # Django imports
+from django.db import transaction
 from django.utils import timezone
 from django.utils.html import strip_tags
 
@@ -39,62 +41,82 @@ def release_lock(lock_id):
     redis_client.delete(lock_id)
 
 
-@shared_task
-def stack_email_notification():
-    # get all email notifications
-    email_notifications = (
-        EmailNotificationLog.objects.filter(processed_at__isnull=True)
-        .order_by("receiver")
-        .values()
-    )
+def get_email_notification_digests(email_notifications):
+    """
+    Group the notification logs of the receivers into one digest per receiver
+    and issue in a single pass over the rows
+    """
+    # {("receiver_id", "issue_id"): {"actor_id1": [ { data }, { data } ]}}
+    digests = {}
+    for notification in email_notifications:
+        entity_identifier = notification.get("entity_identifier")
+        digest = digests.setdefault(
+            (
+                str(notification.get("receiver_id")),
+                str(entity_identifier) if entity_identifier else None,
+            ),
+            {"notification_data": {}, "email_notification_ids": []},
+        )
+        digest["notification_data"].setdefault(
+            str(notification.get("triggered_by_id")), []
+        ).append(notification.get("data"))
+        digest["email_notification_ids"].append(str(notification.get("id")))
+
+    return [
+        {
+            "issue_id": issue_id,
+            "receiver_id": receiver_id,
+            "notification_data": digest["notification_data"],
+            "email_notification_ids": digest["email_notification_ids"],
+        }
+        for (receiver_id, issue_id), digest in digests.items()
+    ]
 
-    # Create the below format for each of the issues
-    # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
 
-    # Convert to unique receivers list
-    receivers = list(
-        set(
-            [
-                str(notification.get("receiver_id"))
-                for notification in email_notifications
-            ]
+@shared_task
+def stack_email_notification():
+    batch_size = settings.EMAIL_NOTIFICATION_BATCH_SIZE
+    last_receiver_id = None
+    while True:
+        # Walk the receivers with pending notifications in bounded chunks
+        receivers = EmailNotificationLog.objects.filter(processed_at__isnull=True)
+        if last_receiver_id is not None:
+            receivers = receivers.filter(receiver_id__gt=last_receiver_id)
+        receiver_ids = list(
+            receivers.order_by("receiver_id")
+            .values_list("receiver_id", flat=True)
+            .distinct()[:batch_size]
         )
-    )
-    processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification
-            for notification in email_notifications
-            if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
-        email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(
-                receiver_notification.get("entity_identifier"), {}
-            ).setdefault(str(receiver_notification.get("triggered_by_id")), []).append(
-                receiver_notification.get("data")
-            )
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
+        if not receiver_ids:
+            return
+        last_receiver_id = receiver_ids[-1]
+
+        with transaction.atomic():
+            # Rows claimed by another worker are skipped and left to it
+            email_notifications = list(
+                EmailNotificationLog.objects.filter(
+                    processed_at__isnull=True, receiver_id__in=receiver_ids
+                )
+                .select_for_update(skip_locked=True)
+                .values(
+                    "id",
+                    "receiver_id",
+                    "triggered_by_id",
+                    "entity_identifier",
+                    "data",
+                )
             )
+            if not email_notifications:
+                continue
 
-    # Update the email notification log
-    EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
-        processed_at=timezone.now()
-    )
+            EmailNotificationLog.objects.filter(
+                pk__in=[notification["id"] for notification in email_notifications]
+            ).update(processed_at=timezone.now())
+
+        # One task and one SMTP connection for the whole chunk
+        send_email_notification_batch.delay(
+            digests=get_email_notification_digests(email_notifications)
+        )
 
 
 def create_payload(notification_data):
@@ -168,169 +190,229 @@ def process_html_content(content):
     return processed_content_list
 
 
-@shared_task
-def send_email_notification(
-    issue_id, notification_data, receiver_id, email_notification_ids
+def get_email_notification_message(
+    issue, receiver, actors, base_api, notification_data, email_from, connection
 ):
-    # Convert UUIDs to a sorted, concatenated string
-    sorted_ids = sorted(email_notification_ids)
-    ids_str = "_".join(str(id) for id in sorted_ids)
-    lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+    data = create_payload(notification_data=notification_data)
+
+    template_data = []
+    total_changes = 0
+    comments = []
+    actors_involved = []
+    for actor_id, changes in data.items():
+        actor = actors[actor_id]
+        total_changes = total_changes + len(changes)
+        comment = changes.pop("comment", False)
+        mention = changes.pop("mention", False)
+        actors_involved.append(actor_id)
+        if comment:
+            comments.append(
+                {
+                    "actor_comments": comment,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        if mention:
+            mention["new_value"] = process_html_content(mention.get("new_value"))
+            mention["old_value"] = process_html_content(mention.get("old_value"))
+            comments.append(
+                {
+                    "actor_comments": mention,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        activity_time = changes.pop("activity_time")
+        # Parse the input string into a datetime object
+        formatted_time = datetime.strptime(
+            activity_time, "%Y-%m-%d %H:%M:%S"
+        ).strftime("%H:%M %p")
+
+        if changes:
+            template_data.append(
+                {
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                    "changes": changes,
+                    "issue_details": {
+                        "name": issue.name,
+                        "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
+                    },
+                    "activity_time": str(formatted_time),
+                }
+            )
 
-    # acquire the lock for sending emails
-    try:
-        if acquire_lock(lock_id=lock_id):
-            # get the redis instance
-            ri = redis_instance()
-            base_api = ri.get(str(issue_id)).decode() if ri.get(str(issue_id)) else None
+    summary = "Updates were made to the issue by"
+
+    # Send the mail
+    subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
+    context = {
+        "data": template_data,
+        "summary": summary,
+        "actors_involved": len(set(actors_involved)),
+        "issue": {
+            "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
+            "name": issue.name,
+            "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        },
+        "receiver": {"email": receiver.email},
+        "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
+        "workspace": str(issue.project.workspace.slug),
+        "project": str(issue.project.name),
+        "user_preference": f"{base_api}/profile/preferences/email",
+        "comments": comments,
+    }
+    html_content = render_to_string("emails/notifications/issue-updates.html", context)
+    text_content = strip_tags(html_content)
+
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=email_from,
+        to=[receiver.email],
+        connection=connection,
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
 
-            # Skip if base api is not present
-            if not base_api:
-                return
 
-            data = create_payload(notification_data=notification_data)
+@shared_task
+def send_email_notification_batch(digests):
+    """
+    Send the digests of a chunk of receivers, each digest being one email for
+    an issue, over a single SMTP connection
+    """
+    if not digests:
+        return
 
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
-            receiver = User.objects.get(pk=receiver_id)
-            issue = Issue.objects.get(pk=issue_id)
-            template_data = []
-            total_changes = 0
-            comments = []
-            actors_involved = []
-            for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
-                total_changes = total_changes + len(changes)
-                comment = changes.pop("comment", False)
-                mention = changes.pop("mention", False)
-                actors_involved.append(actor_id)
-                if comment:
-                    comments.append(
-                        {
-                            "actor_comments": comment,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                if mention:
-                    mention["new_value"] = process_html_content(
-                        mention.get("new_value")
-                    )
-                    mention["old_value"] = process_html_content(
-                        mention.get("old_value")
-                    )
-                    comments.append(
-                        {
-                            "actor_comments": mention,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                activity_time = changes.pop("activity_time")
-                # Parse the input string into a datetime object
-                formatted_time = datetime.strptime(
-                    activity_time, "%Y-%m-%d %H:%M:%S"
-                ).strftime("%H:%M %p")
-
-                if changes:
-                    template_data.append(
-                        {
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                            "changes": changes,
-                            "issue_details": {
-                                "name": issue.name,
-                                "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
-                            },
-                            "activity_time": str(formatted_time),
-                        }
-                    )
+    # Load the issues, users and base urls of the whole batch at once
+    issue_ids = {digest["issue_id"] for digest in digests if digest["issue_id"]}
+    issues = {
+        str(issue_id): issue
+        for issue_id, issue in Issue.objects.select_related("project__workspace")
+        .in_bulk(issue_ids)
+        .items()
+    }
+    user_ids = {digest["receiver_id"] for digest in digests}
+    for digest in digests:
+        user_ids.update(digest["notification_data"].keys())
+    users = {
+        str(user_id): user for user_id, user in User.objects.in_bulk(user_ids).items()
+    }
+    issue_ids = list(issue_ids)
+    base_apis = (
+        dict(zip(issue_ids, redis_instance().mget(issue_ids))) if issue_ids else {}
+    )
 
-            summary = "Updates were made to the issue by"
-
-            # Send the mail
-            subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
-            context = {
-                "data": template_data,
-                "summary": summary,
-                "actors_involved": len(set(actors_involved)),
-                "issue": {
-                    "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
-                    "name": issue.name,
-                    "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                },
-                "receiver": {"email": receiver.email},
-                "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
-                "workspace": str(issue.project.workspace.slug),
-                "project": str(issue.project.name),
-                "user_preference": f"{base_api}/profile/preferences/email",
-                "comments": comments,
-            }
-            html_content = render_to_string(
-                "emails/notifications/issue-updates.html", context
-            )
-            text_content = strip_tags(html_content)
+    # Get email configurations
+    (
+        EMAIL_HOST,
+        EMAIL_HOST_USER,
+        EMAIL_HOST_PASSWORD,
+        EMAIL_PORT,
+        EMAIL_USE_TLS,
+        EMAIL_USE_SSL,
+        EMAIL_FROM,
+    ) = get_email_configuration()
+
+    connection = get_connection(
+        host=EMAIL_HOST,
+        port=int(EMAIL_PORT),
+        username=EMAIL_HOST_USER,
+        password=EMAIL_HOST_PASSWORD,
+        use_tls=EMAIL_USE_TLS == "1",
+        use_ssl=EMAIL_USE_SSL == "1",
+    )
 
-            try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
-                )
+    sent_notification_ids = []
+    try:
+        # Opened here, the backend keeps the session across the sends
+        connection.open()
+        for digest in digests:
+            issue_id = digest["issue_id"]
+            receiver_id = digest["receiver_id"]
+            email_notification_ids = digest["email_notification_ids"]
+
+            # Convert UUIDs to a sorted, concatenated string
+            ids_str = "_".join(str(id) for id in sorted(email_notification_ids))
+            lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+
+            # acquire the lock for sending emails
+            if not acquire_lock(lock_id=lock_id):
+                logging.getLogger("plane").info("Duplicate email received skipping")
+                continue
 
-                msg = EmailMultiAlternatives(
-                    subject=subject,
-                    body=text_content,
-                    from_email=EMAIL_FROM,
-                    to=[receiver.email],
+            try:
+                # Skip if base api is not present
+                base_api = base_apis.get(issue_id)
+                issue = issues.get(issue_id)
+                receiver = users.get(receiver_id)
+                if not base_api or issue is None or receiver is None:
+                    continue
+                if any(
+                    actor_id not in users for actor_id in digest["notification_data"]
+                ):
+                    continue
+
+                msg = get_email_notification_message(
+                    issue=issue,
+                    receiver=receiver,
+                    actors=users,
+                    base_api=base_api.decode(),
+                    notification_data=digest["notification_data"],
+                    email_from=EMAIL_FROM,
                     connection=connection,
                 )
-                msg.attach_alternative(html_content, "text/html")
                 msg.send()
                 logging.getLogger("plane").info("Email Sent Successfully")
-
-                # Update the logs
-                EmailNotificationLog.objects.filter(
-                    pk__in=email_notification_ids
-                ).update(sent_at=timezone.now())
-
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
+                sent_notification_ids.extend(email_notification_ids)
             except Exception as e:
                 log_exception(e)
+                # Replace a possibly broken connection for the next emails
+                try:
+                    connection.close()
+                    connection.open()
+                except Exception:
+                    pass
+            finally:
                 # release the lock
                 release_lock(lock_id=lock_id)
-                return
-        else:
-            logging.getLogger("plane").info("Duplicate email received skipping")
-            return
-    except (Issue.DoesNotExist, User.DoesNotExist):
-        release_lock(lock_id=lock_id)
-        return
-    except Exception as e:
-        log_exception(e)
-        release_lock(lock_id=lock_id)
-        return
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+        # Update the logs
+        if sent_notification_ids:
+            EmailNotificationLog.objects.filter(pk__in=sent_notification_ids).update(
+                sent_at=timezone.now()
+            )
+
+
+@shared_task
+def send_email_notification(
+    issue_id, notification_data, receiver_id, email_notification_ids
+):
+    # Kept for the tasks enqueued before the batched digests
+    send_email_notification_batch(
+        digests=[
+            {
+                "issue_id": str(issue_id) if issue_id else None,
+                "receiver_id": str(receiver_id),
+                "notification_data": notification_data,
+                "email_notification_ids": email_notification_ids,
+            }
+        ]
+    )
@@ -2,23 +2,60 @@
 import csv
 import io
 import json
+import shutil
 import zipfile
 
 import boto3
 from botocore.client import Config
 
 # Third party imports
-from celery import shared_task
+from celery import chord, group, shared_task
 
 # Django imports
 from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Concat
 from django.utils import timezone
 from openpyxl import Workbook
 
 # Module imports
-from plane.db.models import ExporterHistory, Issue
+from plane.db.models import (
+    CycleIssue,
+    ExporterHistory,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    ModuleIssue,
+    ProjectMember,
+)
+from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
 
+EXPORT_HEADER = [
+    "ID",
+    "Project",
+    "Name",
+    "Description",
+    "State",
+    "Start Date",
+    "Target Date",
+    "Priority",
+    "Created By",
+    "Assignee",
+    "Labels",
+    "Cycle Name",
+    "Cycle Start Date",
+    "Cycle End Date",
+    "Module Name",
+    "Module Start Date",
+    "Module Target Date",
+    "Created At",
+    "Updated At",
+    "Completed At",
+    "Archived At",
+]
+
 
 def dateTimeConverter(time):
     if time:
@@ -30,65 +67,141 @@ def dateConverter(time):
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data):
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
+class S3MultipartWriter(io.RawIOBase):
+    """
+    Writable stream uploading what is written to it as the parts of an S3
+    multipart upload, only the part being filled is kept in memory
+    """
 
-    for row in data:
-        csv_writer.writerow(row)
+    def __init__(self, client, key, part_size=None, **extra_args):
+        self.client = client
+        self.key = key
+        self.part_size = part_size or settings.EXPORT_UPLOAD_PART_SIZE
+        self.buffer = bytearray()
+        self.parts = []
+        self.aborted = False
+        self.upload_id = client.create_multipart_upload(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key, **extra_args
+        )["UploadId"]
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.part_size:
+            self.upload_part(bytes(self.buffer[: self.part_size]))
+            del self.buffer[: self.part_size]
+        return len(data)
+
+    def upload_part(self, body):
+        part_number = len(self.parts) + 1
+        response = self.client.upload_part(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    def close(self):
+        if not self.closed and not self.aborted:
+            # The last part is the only one allowed under the minimum part size
+            if self.buffer or not self.parts:
+                self.upload_part(bytes(self.buffer))
+                self.buffer.clear()
+            self.client.complete_multipart_upload(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={"Parts": self.parts},
+            )
+        super().close()
+
+    def abort(self):
+        self.aborted = True
+        self.client.abort_multipart_upload(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=self.key,
+            UploadId=self.upload_id,
+        )
+        self.close()
 
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
 
+def get_export_file_name(workspace_id, token_id, slug):
+    return (
+        f"{workspace_id}/export-{slug}-{token_id[:6]}-{str(timezone.now().date())}.zip"
+    )
 
-def create_json_file(data):
-    return json.dumps(data)
 
+def get_export_part_name(workspace_id, token_id, project_id, provider):
+    return f"{workspace_id}/export-parts/{token_id}/{project_id}.{provider}"
 
-def create_xlsx_file(data):
-    workbook = Workbook()
-    sheet = workbook.active
 
-    for row in data:
-        sheet.append(row)
+def delete_export_parts(client, workspace_id, token_id, provider, project_ids):
+    """Delete the uploaded project files of an export that will not be assembled"""
+    part_names = [
+        get_export_part_name(workspace_id, token_id, project_id, provider)
+        for project_id in project_ids
+    ]
+    client.delete_objects(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Delete={"Objects": [{"Key": part_name} for part_name in part_names]},
+    )
 
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
 
+def export_progress_key(token_id):
+    return f"export:{token_id}"
 
-def create_zip_file(files):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
 
-    zip_buffer.seek(0)
-    return zip_buffer
+def set_export_progress(token_id, project_ids, status):
+    """Record the status of the files of the projects of an export"""
+    ri = redis_instance()
+    key = export_progress_key(token_id)
+    ri.hset(key, mapping={str(project_id): status for project_id in project_ids})
+    ri.expire(key, 24 * 60 * 60)
 
 
-def upload_to_s3(zip_file, workspace_id, token_id, slug):
-    file_name = (
-        f"{workspace_id}/export-{slug}-{token_id[:6]}-{str(timezone.now().date())}.zip"
-    )
-    expires_in = 7 * 24 * 60 * 60
+def get_export_progress(token_id):
+    """Return the status of the file of each project of an export"""
+    return {
+        project_id.decode(): status.decode()
+        for project_id, status in redis_instance()
+        .hgetall(export_progress_key(token_id))
+        .items()
+    }
 
-    if settings.USE_MINIO:
-        upload_s3 = boto3.client(
+
+def get_s3_client():
+    # If endpoint url is present, use it
+    if settings.USE_MINIO or settings.AWS_S3_ENDPOINT_URL:
+        return boto3.client(
             "s3",
             endpoint_url=settings.AWS_S3_ENDPOINT_URL,
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             config=Config(signature_version="s3v4"),
         )
-        upload_s3.upload_fileobj(
-            zip_file,
-            settings.AWS_STORAGE_BUCKET_NAME,
-            file_name,
-            ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
-        )
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        config=Config(signature_version="s3v4"),
+    )
+
+
+def get_upload_args():
+    if settings.USE_MINIO:
+        return {"ACL": "public-read", "ContentType": "application/zip"}
+    return {"ContentType": "application/zip"}
+
 
+def generate_export_url(file_name):
+    expires_in = 7 * 24 * 60 * 60
+
+    if settings.USE_MINIO:
         # Generate presigned url for the uploaded file with different base
         presign_s3 = boto3.client(
             "s3",
@@ -97,45 +210,18 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             config=Config(signature_version="s3v4"),
         )
-
-        presigned_url = presign_s3.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": file_name},
-            ExpiresIn=expires_in,
-        )
     else:
-        # If endpoint url is present, use it
-        if settings.AWS_S3_ENDPOINT_URL:
-            s3 = boto3.client(
-                "s3",
-                endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
-            )
-        else:
-            s3 = boto3.client(
-                "s3",
-                region_name=settings.AWS_REGION,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
-            )
+        presign_s3 = get_s3_client()
 
-        # Upload the file to S3
-        s3.upload_fileobj(
-            zip_file,
-            settings.AWS_STORAGE_BUCKET_NAME,
-            file_name,
-            ExtraArgs={"ContentType": "application/zip"},
-        )
+    return presign_s3.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": file_name},
+        ExpiresIn=expires_in,
+    )
 
-        # Generate presigned url for the uploaded file
-        presigned_url = s3.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": file_name},
-            ExpiresIn=expires_in,
-        )
+
+def complete_export(file_name, token_id):
+    presigned_url = generate_export_url(file_name)
 
     exporter_instance = ExporterHistory.objects.get(token=token_id)
 
@@ -150,6 +236,14 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
     exporter_instance.save(update_fields=["status", "url", "key"])
 
 
+def fail_export(token_id, error):
+    exporter_instance = ExporterHistory.objects.get(token=token_id)
+    exporter_instance.status = "failed"
+    exporter_instance.reason = str(error)
+    exporter_instance.save(update_fields=["status", "reason"])
+    log_exception(error)
+
+
 def generate_table_row(issue):
     return [
         f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
@@ -165,18 +259,14 @@ def generate_table_row(issue):
             if issue["created_by__first_name"] and issue["created_by__last_name"]
             else ""
         ),
-        (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        issue["labels__name"] if issue["labels__name"] else "",
-        issue["issue_cycle__cycle__name"],
-        dateConverter(issue["issue_cycle__cycle__start_date"]),
-        dateConverter(issue["issue_cycle__cycle__end_date"]),
-        issue["issue_module__module__name"],
-        dateConverter(issue["issue_module__module__start_date"]),
-        dateConverter(issue["issue_module__module__target_date"]),
+        ", ".join(issue["assignee_names"]),
+        ", ".join(issue["label_names"]),
+        issue["cycle_name"],
+        dateConverter(issue["cycle_start_date"]),
+        dateConverter(issue["cycle_end_date"]),
+        issue["module_name"],
+        dateConverter(issue["module_start_date"]),
+        dateConverter(issue["module_target_date"]),
         dateTimeConverter(issue["created_at"]),
         dateTimeConverter(issue["updated_at"]),
         dateTimeConverter(issue["completed_at"]),
@@ -185,118 +275,213 @@ def generate_table_row(issue):
 
 
 def generate_json_row(issue):
-    return {
-        "ID": f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
-        "Project": issue["project__name"],
-        "Name": issue["name"],
-        "Description": issue["description_stripped"],
-        "State": issue["state__name"],
-        "Start Date": dateConverter(issue["start_date"]),
-        "Target Date": dateConverter(issue["target_date"]),
-        "Priority": issue["priority"],
-        "Created By": (
-            f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
-            if issue["created_by__first_name"] and issue["created_by__last_name"]
-            else ""
-        ),
-        "Assignee": (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        "Labels": issue["labels__name"] if issue["labels__name"] else "",
-        "Cycle Name": issue["issue_cycle__cycle__name"],
-        "Cycle Start Date": dateConverter(issue["issue_cycle__cycle__start_date"]),
-        "Cycle End Date": dateConverter(issue["issue_cycle__cycle__end_date"]),
-        "Module Name": issue["issue_module__module__name"],
-        "Module Start Date": dateConverter(issue["issue_module__module__start_date"]),
-        "Module Target Date": dateConverter(issue["issue_module__module__target_date"]),
-        "Created At": dateTimeConverter(issue["created_at"]),
-        "Updated At": dateTimeConverter(issue["updated_at"]),
-        "Completed At": dateTimeConverter(issue["completed_at"]),
-        "Archived At": dateTimeConverter(issue["archived_at"]),
-    }
+    return dict(zip(EXPORT_HEADER, generate_table_row(issue)))
 
 
-def update_json_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
-    )
+def write_csv(stream, issues):
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    csv_writer = csv.writer(text, delimiter=",", quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(EXPORT_HEADER)
+    for issue in issues:
+        csv_writer.writerow(generate_table_row(issue))
+    text.flush()
+    text.detach()
+
+
+def write_json(stream, issues):
+    text = io.TextIOWrapper(stream, encoding="utf-8")
+    text.write("[")
+    for index, issue in enumerate(issues):
+        if index:
+            text.write(", ")
+        text.write(json.dumps(generate_json_row(issue)))
+    text.write("]")
+    text.flush()
+    text.detach()
+
+
+def write_xlsx(stream, issues):
+    # Write only workbooks keep the rows in a temporary file until saved
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(EXPORT_HEADER)
+    for issue in issues:
+        sheet.append(generate_table_row(issue))
+    workbook.save(stream)
 
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
-        )
-        assignee, label = row["Assignee"], row["Labels"]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index]["Labels"] += f", {label}"
-    else:
-        rows.append(row)
 
+EXPORTER_MAPPER = {"csv": write_csv, "json": write_json, "xlsx": write_xlsx}
 
-def update_table_row(rows, row):
-    matched_index = next(
-        (index for index, existing_row in enumerate(rows) if existing_row[0] == row[0]),
-        None,
+
+def first_related(model, field):
+    return Subquery(
+        model.objects.filter(issue_id=OuterRef("id"))
+        .order_by("created_at")
+        .values(field)[:1]
     )
 
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index][8] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index][8] += f", {label}"
-    else:
-        rows.append(row)
+
+def get_export_issues(workspace_id, project_ids, member_id):
+    """
+    Return the issues of the projects to export, one row per issue with the
+    assignees and labels aggregated in SQL
+    """
+    return (
+        Issue.objects.filter(
+            workspace__id=workspace_id,
+            project_id__in=project_ids,
+            project__archived_at__isnull=True,
+        )
+        .filter(
+            project_id__in=ProjectMember.objects.filter(
+                member_id=member_id, is_active=True
+            ).values("project_id")
+        )
+        .annotate(
+            assignee_names=ArraySubquery(
+                IssueAssignee.objects.filter(issue_id=OuterRef("id"))
+                .exclude(assignee__first_name="")
+                .exclude(assignee__last_name="")
+                .order_by("created_at")
+                .values(
+                    name=Concat(
+                        "assignee__first_name", Value(" "), "assignee__last_name"
+                    )
+                )
+            ),
+            label_names=ArraySubquery(
+                IssueLabel.objects.filter(issue_id=OuterRef("id"))
+                .order_by("created_at")
+                .values("label__name")
+            ),
+            cycle_name=first_related(CycleIssue, "cycle__name"),
+            cycle_start_date=first_related(CycleIssue, "cycle__start_date"),
+            cycle_end_date=first_related(CycleIssue, "cycle__end_date"),
+            module_name=first_related(ModuleIssue, "module__name"),
+            module_start_date=first_related(ModuleIssue, "module__start_date"),
+            module_target_date=first_related(ModuleIssue, "module__target_date"),
+        )
+        .values(
+            "project__identifier",
+            "project__name",
+            "sequence_id",
+            "name",
+            "description_stripped",
+            "priority",
+            "start_date",
+            "target_date",
+            "state__name",
+            "created_at",
+            "updated_at",
+            "completed_at",
+            "archived_at",
+            "created_by__first_name",
+            "created_by__last_name",
+            "assignee_names",
+            "label_names",
+            "cycle_name",
+            "cycle_start_date",
+            "cycle_end_date",
+            "module_name",
+            "module_start_date",
+            "module_target_date",
+        )
+        .order_by("project__identifier", "sequence_id")
+    )
+
+
+def write_export_file(zip_file, file_name, provider, issues):
+    """Stream the issues read with a server side cursor into a file of the zip"""
+    with zip_file.open(file_name, "w", force_zip64=True) as stream:
+        EXPORTER_MAPPER[provider](
+            stream, issues.iterator(chunk_size=settings.EXPORT_BATCH_SIZE)
+        )
 
 
-def generate_csv(header, project_id, issues, files):
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=60,
+    max_retries=3,
+    retry_jitter=True,
+    ignore_result=False,
+)
+def export_project_file(self, provider, workspace_id, project_id, token_id, member_id):
     """
-    Generate CSV export for all the passed issues.
+    Upload the file of one project of an export, a failed project is retried
+    on its own
     """
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
+    set_export_progress(token_id, [project_id], "processing")
+    part_name = get_export_part_name(workspace_id, token_id, project_id, provider)
+    upload = S3MultipartWriter(get_s3_client(), part_name)
+    try:
+        issues = get_export_issues(workspace_id, [project_id], member_id)
+        EXPORTER_MAPPER[provider](
+            upload, issues.iterator(chunk_size=settings.EXPORT_BATCH_SIZE)
+        )
+    except Exception as e:
+        upload.abort()
+        if self.request.retries >= self.max_retries:
+            set_export_progress(token_id, [project_id], "failed")
+            fail_export(token_id, e)
+            # The chord callback never runs, drop the files of the other projects
+            delete_export_parts(
+                upload.client,
+                workspace_id,
+                token_id,
+                provider,
+                get_export_progress(token_id),
+            )
+        else:
+            set_export_progress(token_id, [project_id], "retrying")
+        raise
+    upload.close()
+
+    # Another project already failed for good while this one was uploading
+    if "failed" in get_export_progress(token_id).values():
+        delete_export_parts(
+            upload.client, workspace_id, token_id, provider, [project_id]
+        )
+        set_export_progress(token_id, [project_id], "cancelled")
+        return part_name
 
+    set_export_progress(token_id, [project_id], "completed")
+    return part_name
 
-def generate_json(header, project_id, issues, files):
-    rows = []
-    for issue in issues:
-        row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
 
+@shared_task
+def assemble_export(part_names, workspace_id, token_id, slug):
+    """Zip the project files of an export once all of them are uploaded"""
+    try:
+        client = get_s3_client()
+        file_name = get_export_file_name(workspace_id, token_id, slug)
+        upload = S3MultipartWriter(client, file_name, **get_upload_args())
+        try:
+            with zipfile.ZipFile(upload, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for part_name in part_names:
+                    body = client.get_object(
+                        Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=part_name
+                    )["Body"]
+                    with zip_file.open(
+                        part_name.rsplit("/", 1)[-1], "w", force_zip64=True
+                    ) as stream:
+                        shutil.copyfileobj(
+                            body, stream, settings.EXPORT_UPLOAD_PART_SIZE
+                        )
+        except Exception:
+            upload.abort()
+            raise
+        upload.close()
+
+        client.delete_objects(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Delete={"Objects": [{"Key": part_name} for part_name in part_names]},
+        )
+        complete_export(file_name, token_id)
 
-def generate_xlsx(header, project_id, issues, files):
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
+    except Exception as e:
+        fail_export(token_id, e)
+        return
 
 
 @shared_task
@@ -306,102 +491,42 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
         exporter_instance.status = "processing"
         exporter_instance.save(update_fields=["status"])
 
-        workspace_issues = (
-            (
-                Issue.objects.filter(
-                    workspace__id=workspace_id,
-                    project_id__in=project_ids,
-                    project__project_projectmember__member=exporter_instance.initiated_by_id,
-                    project__project_projectmember__is_active=True,
-                    project__archived_at__isnull=True,
-                )
-                .select_related("project", "workspace", "state", "parent", "created_by")
-                .prefetch_related(
-                    "assignees", "labels", "issue_cycle__cycle", "issue_module__module"
+        if multiple and project_ids:
+            # The projects are exported in parallel and zipped by the callback
+            set_export_progress(token_id, project_ids, "pending")
+            chord(
+                group(
+                    export_project_file.s(
+                        provider,
+                        str(workspace_id),
+                        str(project_id),
+                        str(token_id),
+                        str(exporter_instance.initiated_by_id),
+                    )
+                    for project_id in project_ids
                 )
-                .values(
-                    "id",
-                    "project__identifier",
-                    "project__name",
-                    "project__id",
-                    "sequence_id",
-                    "name",
-                    "description_stripped",
-                    "priority",
-                    "start_date",
-                    "target_date",
-                    "state__name",
-                    "created_at",
-                    "updated_at",
-                    "completed_at",
-                    "archived_at",
-                    "issue_cycle__cycle__name",
-                    "issue_cycle__cycle__start_date",
-                    "issue_cycle__cycle__end_date",
-                    "issue_module__module__name",
-                    "issue_module__module__start_date",
-                    "issue_module__module__target_date",
-                    "created_by__first_name",
-                    "created_by__last_name",
-                    "assignees__first_name",
-                    "assignees__last_name",
-                    "labels__name",
-                )
-            )
-            .order_by("project__identifier", "sequence_id")
-            .distinct()
+            )(assemble_export.s(str(workspace_id), str(token_id), slug))
+            return
+
+        issues = get_export_issues(
+            workspace_id, project_ids, exporter_instance.initiated_by_id
         )
-        # CSV header
-        header = [
-            "ID",
-            "Project",
-            "Name",
-            "Description",
-            "State",
-            "Start Date",
-            "Target Date",
-            "Priority",
-            "Created By",
-            "Assignee",
-            "Labels",
-            "Cycle Name",
-            "Cycle Start Date",
-            "Cycle End Date",
-            "Module Name",
-            "Module Start Date",
-            "Module Target Date",
-            "Created At",
-            "Updated At",
-            "Completed At",
-            "Archived At",
-        ]
-
-        EXPORTER_MAPPER = {
-            "csv": generate_csv,
-            "json": generate_json,
-            "xlsx": generate_xlsx,
-        }
-
-        files = []
-        if multiple:
-            for project_id in project_ids:
-                issues = workspace_issues.filter(project__id=project_id)
-                exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
-                    exporter(header, project_id, issues, files)
 
-        else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(header, workspace_id, workspace_issues, files)
+        # The zip is written straight into the upload, part by part
+        file_name = get_export_file_name(workspace_id, token_id, slug)
+        upload = S3MultipartWriter(get_s3_client(), file_name, **get_upload_args())
+        try:
+            with zipfile.ZipFile(upload, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                write_export_file(
+                    zip_file, f"{workspace_id}.{provider}", provider, issues
+                )
+        except Exception:
+            upload.abort()
+            raise
+        upload.close()
 
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+        complete_export(file_name, token_id)
 
     except Exception as e:
-        exporter_instance = ExporterHistory.objects.get(token=token_id)
-        exporter_instance.status = "failed"
-        exporter_instance.reason = str(e)
-        exporter_instance.save(update_fields=["status", "reason"])
-        log_exception(e)
+        fail_export(token_id, e)
         return
@@ -29,8 +29,10 @@ from plane.db.models import (
     EstimatePoint,
 )
 from plane.settings.redis import redis_instance
+from plane.utils.dashboard_counters import refresh_issue_dashboard_counters
+from plane.utils.default_analytics import invalidate_analytics_cache
 from plane.utils.exception_logger import log_exception
-from plane.bgtasks.webhook_task import webhook_activity
+from plane.bgtasks.webhook_task import dispatch_webhook_activity
 from plane.utils.issue_relation_mapper import get_inverse_relation
 
 
@@ -1565,7 +1567,7 @@ def issue_activity(
     try:
         issue_activities = []
 
-        project = Project.objects.get(pk=project_id)
+        project = Project.objects.select_related("workspace").get(pk=project_id)
         workspace_id = project.workspace_id
 
         if issue_id is not None:
@@ -1629,7 +1631,7 @@ def issue_activity(
         # Post the updates to segway for integrations and webhooks
         if len(issue_activities_created):
             for activity in issue_activities_created:
-                webhook_activity.delay(
+                dispatch_webhook_activity(
                     event=(
                         "issue_comment"
                         if activity.field == "comment"
@@ -1676,6 +1678,11 @@ def issue_activity(
                 current_instance=current_instance,
             )
 
+        # Keep the dashboard counters of the affected users up to date
+        refresh_issue_dashboard_counters(type, requested_data, issue_id)
+        # Drop the cached analytics of the workspace
+        invalidate_analytics_cache(type, project.workspace.slug)
+
         return
     except Exception as e:
         log_exception(e)
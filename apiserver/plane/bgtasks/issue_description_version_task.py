@@ -1,10 +1,10 @@
 from celery import shared_task
-from django.db import transaction
 from django.utils import timezone
 from typing import Optional, Dict
 import json
 
 from plane.db.models import Issue, IssueDescriptionVersion
+from plane.utils.description_version import update_latest_version
 from plane.utils.exception_logger import log_exception
 
 
@@ -16,26 +16,23 @@ def should_update_existing_version(
 
     time_difference = (timezone.now() - version.last_saved_at).total_seconds()
     return (
-        str(version.owned_by_id) == str(user_id)
+        version.description_delta is None
+        and str(version.owned_by_id) == str(user_id)
         and time_difference <= max_time_difference
     )
 
 
 def update_existing_version(version: IssueDescriptionVersion, issue) -> None:
-    version.description_json = issue.description
-    version.description_html = issue.description_html
-    version.description_binary = issue.description_binary
-    version.description_stripped = issue.description_stripped
-    version.last_saved_at = timezone.now()
-
-    version.save(
-        update_fields=[
-            "description_json",
-            "description_html",
-            "description_binary",
-            "description_stripped",
-            "last_saved_at",
-        ]
+    update_latest_version(
+        version,
+        values={
+            "description_json": issue.description,
+            "description_html": issue.description_html,
+            "description_binary": issue.description_binary,
+            "description_stripped": issue.description_stripped,
+        },
+        parent_field="issue_id",
+        last_saved_at=timezone.now(),
     )
 
 
@@ -57,21 +54,21 @@ def issue_description_version_task(
         ):
             return
 
-        with transaction.atomic():
-            # Get latest version
-            latest_version = (
-                IssueDescriptionVersion.objects.filter(issue_id=issue_id)
-                .order_by("-last_saved_at")
-                .first()
-            )
+        # Get latest version, the versions are chained by creation time
+        latest_version = (
+            IssueDescriptionVersion.objects.filter(issue_id=issue_id)
+            .order_by("-created_at")
+            .first()
+        )
 
-            # Determine whether to update existing or create new version
-            if should_update_existing_version(version=latest_version, user_id=user_id):
-                update_existing_version(latest_version, issue)
-            else:
-                IssueDescriptionVersion.log_issue_description_version(issue, user_id)
+        # Determine whether to update existing or create new version, the
+        # version writers are serialized by their own lock
+        if should_update_existing_version(version=latest_version, user_id=user_id):
+            update_existing_version(latest_version, issue)
+        else:
+            IssueDescriptionVersion.log_issue_description_version(issue, user_id)
 
-            return
+        return
 
     except Issue.DoesNotExist:
         # Issue no longer exists, skip processing
@@ -84,36 +84,46 @@ def get_removed_mentions(requested_instance, current_instance):
 # Adds mentions as subscribers
 def extract_mentions_as_subscribers(project_id, issue_id, mentions):
     # mentions is an array of User IDs representing the FILTERED set of mentioned users
+    mentions = {str(mention) for mention in mentions}
+    if not mentions:
+        return []
 
-    bulk_mention_subscribers = []
-
-    for mention_id in mentions:
-        # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification
-        if (
-            not IssueSubscriber.objects.filter(
-                issue_id=issue_id, subscriber_id=mention_id, project_id=project_id
-            ).exists()
-            and not IssueAssignee.objects.filter(
-                project_id=project_id, issue_id=issue_id, assignee_id=mention_id
-            ).exists()
-            and not Issue.objects.filter(
-                project_id=project_id, pk=issue_id, created_by_id=mention_id
-            ).exists()
-            and ProjectMember.objects.filter(
-                project_id=project_id, member_id=mention_id, is_active=True
-            ).exists()
-        ):
-            project = Project.objects.get(pk=project_id)
-
-            bulk_mention_subscribers.append(
-                IssueSubscriber(
-                    workspace_id=project.workspace_id,
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber_id=mention_id,
-                )
-            )
-    return bulk_mention_subscribers
+    # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification
+    already_notified = (
+        set(
+            IssueSubscriber.objects.filter(
+                issue_id=issue_id, subscriber_id__in=mentions, project_id=project_id
+            ).values_list("subscriber_id", flat=True)
+        )
+        | set(
+            IssueAssignee.objects.filter(
+                project_id=project_id, issue_id=issue_id, assignee_id__in=mentions
+            ).values_list("assignee_id", flat=True)
+        )
+        | set(
+            Issue.objects.filter(
+                project_id=project_id, pk=issue_id, created_by_id__in=mentions
+            ).values_list("created_by_id", flat=True)
+        )
+    )
+    new_subscribers = set(
+        ProjectMember.objects.filter(
+            project_id=project_id, member_id__in=mentions, is_active=True
+        ).values_list("member_id", flat=True)
+    ) - already_notified
+    if not new_subscribers:
+        return []
+
+    project = Project.objects.get(pk=project_id)
+    return [
+        IssueSubscriber(
+            workspace_id=project.workspace_id,
+            project_id=project_id,
+            issue_id=issue_id,
+            subscriber_id=mention_id,
+        )
+        for mention_id in new_subscribers
+    ]
 
 
 # Parse Issue Description & extracts mentions
@@ -250,6 +260,7 @@ def notifications(
             project_members = ProjectMember.objects.filter(
                 project_id=project_id, is_active=True
             ).values_list("member_id", flat=True)
+            project_member_ids = set(project_members)
 
             # Get new mentions from the newer instance
             new_mentions = get_new_mentions(
@@ -259,7 +270,7 @@ def notifications(
             new_mentions = [
                 str(mention)
                 for mention in new_mentions
-                if mention in set(project_members)
+                if mention in project_member_ids
             ]
             removed_mention = get_removed_mentions(
                 requested_instance=requested_data, current_instance=current_instance
@@ -268,11 +279,7 @@ def notifications(
             comment_mentions = []
             all_comment_mentions = []
 
-            # Get New Subscribers from the mentions of the newer instance
             requested_mentions = extract_mentions(issue_instance=requested_data)
-            mention_subscribers = extract_mentions_as_subscribers(
-                project_id=project_id, issue_id=issue_id, mentions=requested_mentions
-            )
 
             for issue_activity in issue_activities_created:
                 issue_comment = issue_activity.get("issue_comment")
@@ -294,11 +301,14 @@ def notifications(
                     comment_mentions = [
                         mention
                         for mention in comment_mentions
-                        if UUID(mention) in set(project_members)
+                        if UUID(mention) in project_member_ids
                     ]
 
-            comment_mention_subscribers = extract_mentions_as_subscribers(
-                project_id=project_id, issue_id=issue_id, mentions=all_comment_mentions
+            # Get New Subscribers from the mentions of the newer instance and the comments
+            mention_subscribers = extract_mentions_as_subscribers(
+                project_id=project_id,
+                issue_id=issue_id,
+                mentions=requested_mentions + all_comment_mentions,
             )
             """
             We will not send subscription activity notification to the below mentioned user sets
@@ -320,7 +330,11 @@ def notifications(
                 .values_list("subscriber", flat=True)
             )
 
-            issue = Issue.objects.filter(pk=issue_id).first()
+            issue = (
+                Issue.objects.filter(pk=issue_id)
+                .select_related("state", "project__workspace")
+                .first()
+            )
 
             if subscriber:
                 # add the user to issue subscriber
@@ -331,16 +345,52 @@ def notifications(
                 except Exception:
                     pass
 
-            project = Project.objects.get(pk=project_id)
+            project = Project.objects.select_related("workspace").get(pk=project_id)
 
-            issue_assignees = IssueAssignee.objects.filter(
-                issue_id=issue_id,
-                project_id=project_id,
-                assignee__in=Subquery(project_members),
-            ).values_list("assignee", flat=True)
+            issue_assignees = set(
+                IssueAssignee.objects.filter(
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    assignee__in=Subquery(project_members),
+                ).values_list("assignee", flat=True)
+            )
 
             issue_subscribers = list(set(issue_subscribers) - {uuid.UUID(actor_id)})
 
+            # Load the preferences, states and comments of the whole fan-out at once
+            preferences = {
+                str(preference.user_id): preference
+                for preference in UserNotificationPreference.objects.filter(
+                    user_id__in=issue_subscribers + comment_mentions + new_mentions
+                )
+            }
+            completed_states = {
+                str(state_id)
+                for state_id in State.objects.filter(
+                    project_id=project_id,
+                    pk__in=[
+                        issue_activity.get("new_identifier")
+                        for issue_activity in issue_activities_created
+                        if issue_activity.get("field") == "state"
+                        and issue_activity.get("new_identifier")
+                    ],
+                    group="completed",
+                ).values_list("id", flat=True)
+            }
+            issue_comments = {
+                str(issue_comment.id): issue_comment
+                for issue_comment in IssueComment.objects.filter(
+                    id__in=[
+                        issue_activity.get("issue_comment")
+                        for issue_activity in issue_activities_created
+                        if issue_activity.get("issue_comment")
+                    ],
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                )
+            }
+
             for subscriber in issue_subscribers:
                 if issue.created_by_id and issue.created_by_id == subscriber:
                     sender = "in_app:issue_activities:created"
@@ -352,7 +402,7 @@ def notifications(
                 else:
                     sender = "in_app:issue_activities:subscribed"
 
-                preference = UserNotificationPreference.objects.get(user_id=subscriber)
+                preference = preferences[str(subscriber)]
 
                 for issue_activity in issue_activities_created:
                     # If activity done in blocking then blocked by email should not go
@@ -373,11 +423,8 @@ def notifications(
                     elif (
                         issue_activity.get("field") == "state"
                         and preference.issue_completed
-                        and State.objects.filter(
-                            project_id=project_id,
-                            pk=issue_activity.get("new_identifier"),
-                            group="completed",
-                        ).exists()
+                        and str(issue_activity.get("new_identifier"))
+                        in completed_states
                     ):
                         send_email = True
                     elif (
@@ -390,15 +437,8 @@ def notifications(
                         send_email = False
 
                     # If activity is of issue comment fetch the comment
-                    issue_comment = (
-                        IssueComment.objects.filter(
-                            id=issue_activity.get("issue_comment"),
-                            issue_id=issue_id,
-                            project_id=project_id,
-                            workspace_id=project.workspace_id,
-                        ).first()
-                        if issue_activity.get("issue_comment")
-                        else None
+                    issue_comment = issue_comments.get(
+                        str(issue_activity.get("issue_comment"))
                     )
 
                     # Create in app notification
@@ -506,7 +546,7 @@ def notifications(
 
             # Add Mentioned as Issue Subscribers
             IssueSubscriber.objects.bulk_create(
-                mention_subscribers + comment_mention_subscribers,
+                mention_subscribers,
                 batch_size=100,
                 ignore_conflicts=True,
             )
@@ -521,9 +561,7 @@ def notifications(
 
             for mention_id in comment_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences[str(mention_id)]
                     for issue_activity in issue_activities_created:
                         notification = create_mention_notification(
                             project=project,
@@ -594,9 +632,7 @@ def notifications(
 
             for mention_id in new_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences[str(mention_id)]
                     if (
                         last_activity is not None
                         and last_activity.field == "description"
@@ -0,0 +1,92 @@
+# Python imports
+import json
+
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.bgtasks.page_transaction_task import (
+    extract_components,
+    record_page_transactions,
+)
+from plane.bgtasks.page_version_task import create_page_version
+from plane.db.models import Page
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+
+def page_save_key(page_id):
+    return f"page_save:{page_id}"
+
+
+def schedule_page_save(page_id, existing_html, user_id):
+    """
+    Queue the post processing of a page description save
+    Saves of a page within PAGE_SAVE_WINDOW seconds are coalesced into a
+    single job comparing the description before the first save with the
+    description after the last one, without a window every save is processed
+    """
+    if not settings.PAGE_SAVE_WINDOW:
+        process_page_save.delay(
+            page_id=str(page_id), existing_html=existing_html, user_id=str(user_id)
+        )
+        return
+
+    key = page_save_key(page_id)
+    ri = redis_instance()
+    pipeline = ri.pipeline(transaction=True)
+    # The description before the first save of the window is the baseline
+    pipeline.hsetnx(key, "existing_html", json.dumps(existing_html))
+    pipeline.hset(key, "user_id", str(user_id))
+    pipeline.expire(key, settings.PAGE_SAVE_WINDOW * 10)
+    pipeline.execute()
+    # The first save of the window schedules the flush
+    if ri.set(f"{key}:scheduled", "1", nx=True, ex=settings.PAGE_SAVE_WINDOW * 10):
+        flush_page_save.apply_async(
+            kwargs={"page_id": str(page_id)}, countdown=settings.PAGE_SAVE_WINDOW
+        )
+
+
+@shared_task
+def flush_page_save(page_id):
+    key = page_save_key(page_id)
+    ri = redis_instance()
+    # Take the pending save and reopen the window atomically
+    pipeline = ri.pipeline(transaction=True)
+    pipeline.hgetall(key)
+    pipeline.delete(key, f"{key}:scheduled")
+    pending = pipeline.execute()[0]
+    if not pending:
+        return
+
+    process_page_save(
+        page_id=page_id,
+        existing_html=json.loads(pending[b"existing_html"]),
+        user_id=pending[b"user_id"].decode(),
+    )
+
+
+@shared_task
+def process_page_save(page_id, existing_html, user_id):
+    """Record the page transactions and the page version of a save"""
+    try:
+        # The page is loaded and each description parsed once for both
+        page = Page.objects.get(pk=page_id)
+        if existing_html == page.description_html:
+            return
+
+        if page.description_html:
+            record_page_transactions(
+                page,
+                old_components=extract_components(existing_html),
+                new_components=extract_components(page.description_html),
+            )
+        create_page_version(page, user_id)
+    except Page.DoesNotExist:
+        return
+    except Exception as e:
+        log_exception(e)
+        return
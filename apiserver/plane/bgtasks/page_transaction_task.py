@@ -4,77 +4,84 @@ import json
 # Django imports
 from django.utils import timezone
 
-# Third-party imports
-from bs4 import BeautifulSoup
-
 # Module imports
 from plane.db.models import Page, PageLog
 from celery import shared_task
 from plane.utils.exception_logger import log_exception
+from plane.utils.html_processor import parse_html
+
+# TODO - Add "issue-embed-component", "img", "todo" components
+PAGE_COMPONENTS = ["mention-component"]
 
 
-def extract_components(value, tag):
+def extract_components(html):
+    """Return the components of the page html found in a single parse"""
     try:
-        mentions = []
-        html = value.get("description_html")
-        soup = BeautifulSoup(html, "html.parser")
-        mention_tags = soup.find_all(tag)
-
-        for mention_tag in mention_tags:
-            mention = {
-                "id": mention_tag.get("id"),
-                "entity_identifier": mention_tag.get("entity_identifier"),
-                "entity_name": mention_tag.get("entity_name"),
+        _, components = parse_html(html, PAGE_COMPONENTS)
+    except Exception:
+        return {tag: [] for tag in PAGE_COMPONENTS}
+
+    return {
+        tag: [
+            {
+                "id": attrs.get("id"),
+                "entity_identifier": attrs.get("entity_identifier"),
+                "entity_name": attrs.get("entity_name"),
             }
-            mentions.append(mention)
+            for attrs in tag_components
+        ]
+        for tag, tag_components in components.items()
+    }
+
+
+def record_page_transactions(page, old_components, new_components):
+    """Log the components added to the page and drop the removed ones"""
+    new_page_mention = PageLog.objects.filter(page_id=page.id).exists()
+
+    new_transactions = []
+    deleted_transaction_ids = set()
+
+    for component in PAGE_COMPONENTS:
+        old_mentions = old_components[component]
+        new_mentions = new_components[component]
+
+        new_mentions_ids = {mention["id"] for mention in new_mentions}
+        old_mention_ids = {mention["id"] for mention in old_mentions}
+        deleted_transaction_ids.update(old_mention_ids - new_mentions_ids)
+
+        new_transactions.extend(
+            PageLog(
+                transaction=mention["id"],
+                page_id=page.id,
+                entity_identifier=mention["entity_identifier"],
+                entity_name=mention["entity_name"],
+                workspace_id=page.workspace_id,
+                created_at=timezone.now(),
+                updated_at=timezone.now(),
+            )
+            for mention in new_mentions
+            if mention["id"] not in old_mention_ids or not new_page_mention
+        )
 
-        return mentions
-    except Exception:
-        return []
+    # Create new PageLog objects for new transactions
+    PageLog.objects.bulk_create(new_transactions, batch_size=10, ignore_conflicts=True)
+
+    # Delete the removed transactions
+    PageLog.objects.filter(transaction__in=deleted_transaction_ids).delete()
 
 
 @shared_task
 def page_transaction(new_value, old_value, page_id):
     try:
         page = Page.objects.get(pk=page_id)
-        new_page_mention = PageLog.objects.filter(page_id=page_id).exists()
 
         old_value = json.loads(old_value) if old_value else {}
 
-        new_transactions = []
-        deleted_transaction_ids = set()
-
-        # TODO - Add "issue-embed-component", "img", "todo" components
-        components = ["mention-component"]
-        for component in components:
-            old_mentions = extract_components(old_value, component)
-            new_mentions = extract_components(new_value, component)
-
-            new_mentions_ids = {mention["id"] for mention in new_mentions}
-            old_mention_ids = {mention["id"] for mention in old_mentions}
-            deleted_transaction_ids.update(old_mention_ids - new_mentions_ids)
-
-            new_transactions.extend(
-                PageLog(
-                    transaction=mention["id"],
-                    page_id=page_id,
-                    entity_identifier=mention["entity_identifier"],
-                    entity_name=mention["entity_name"],
-                    workspace_id=page.workspace_id,
-                    created_at=timezone.now(),
-                    updated_at=timezone.now(),
-                )
-                for mention in new_mentions
-                if mention["id"] not in old_mention_ids or not new_page_mention
-            )
-
-        # Create new PageLog objects for new transactions
-        PageLog.objects.bulk_create(
-            new_transactions, batch_size=10, ignore_conflicts=True
+        record_page_transactions(
+            page,
+            old_components=extract_components(old_value.get("description_html")),
+            new_components=extract_components(new_value.get("description_html")),
         )
-
-        # Delete the removed transactions
-        PageLog.objects.filter(transaction__in=deleted_transaction_ids).delete()
     except Page.DoesNotExist:
         return
     except Exception as e:
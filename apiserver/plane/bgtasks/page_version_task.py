@@ -6,9 +6,29 @@ from celery import shared_task
 
 # Module imports
 from plane.db.models import Page, PageVersion
+from plane.utils.description_version import add_version, prune_versions
 from plane.utils.exception_logger import log_exception
 
 
+def create_page_version(page, user_id):
+    # Create a new page version, the previous one is kept as a delta
+    add_version(
+        PageVersion,
+        "page_id",
+        page.id,
+        values={
+            "description_html": page.description_html,
+            "description_binary": page.description_binary,
+        },
+        workspace_id=page.workspace_id,
+        owned_by_id=user_id,
+        last_saved_at=page.updated_at,
+    )
+
+    # Keep the latest 20 page versions
+    prune_versions(PageVersion, "page_id", page.id, keep=20)
+
+
 @shared_task
 def page_version(page_id, existing_instance, user_id):
     try:
@@ -22,22 +42,7 @@ def page_version(page_id, existing_instance, user_id):
 
         # Create a version if description_html is updated
         if current_instance.get("description_html") != page.description_html:
-            # Create a new page version
-            PageVersion.objects.create(
-                page_id=page_id,
-                workspace_id=page.workspace_id,
-                description_html=page.description_html,
-                description_binary=page.description_binary,
-                owned_by_id=user_id,
-                last_saved_at=page.updated_at,
-            )
-
-            # If page versions are greater than 20 delete the oldest one
-            if PageVersion.objects.filter(page_id=page_id).count() > 20:
-                # Delete the old page version
-                PageVersion.objects.filter(page_id=page_id).order_by(
-                    "last_saved_at"
-                ).first().delete()
+            create_page_version(page, user_id)
 
         return
     except Page.DoesNotExist:
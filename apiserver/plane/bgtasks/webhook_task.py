@@ -1,10 +1,6 @@
-import hashlib
-import hmac
 import json
 import logging
-import uuid
-
-import requests
+import random
 
 # Third party imports
 from celery import shared_task
@@ -43,7 +39,13 @@ from plane.db.models import (
     IntakeIssue,
 )
 from plane.license.utils.instance_value import get_email_configuration
+from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
+from plane.utils.webhook_delivery import build_request, deliver
+from plane.utils.webhook_subscriptions import (
+    get_event_webhook_ids,
+    invalidate_webhook_index,
+)
 
 SERIALIZER_MAPPER = {
     "project": ProjectSerializer,
@@ -57,6 +59,25 @@ SERIALIZER_MAPPER = {
     "intake_issue": IntakeIssueSerializer,
 }
 
+WEBHOOK_ACTION = {
+    "POST": "create",
+    "PATCH": "update",
+    "PUT": "update",
+    "DELETE": "delete",
+}
+
+# Retry policy of the failed webhook deliveries, the delay doubles on every
+# retry of a delivery
+WEBHOOK_MAX_RETRIES = 5
+WEBHOOK_RETRY_BACKOFF = 600
+
+def webhook_retry_countdown(retries):
+    """Exponential backoff with jitter of a delivery retried retries times"""
+    return WEBHOOK_RETRY_BACKOFF * 2**retries + random.randint(
+        0, WEBHOOK_RETRY_BACKOFF
+    )
+
+
 MODEL_MAPPER = {
     "project": Project,
     "issue": Issue,
@@ -80,108 +101,22 @@ def get_model_data(event, event_id, many=False):
     return serializer(queryset, many=many).data
 
 
-@shared_task(
-    bind=True,
-    autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
-    retry_jitter=True,
-)
-def webhook_task(self, webhook, slug, event, event_data, action, current_site):
-    try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
-        # # Your secret key
-        event_data = (
-            json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
-            if event_data is not None
-            else None
-        )
-
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
-
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-        }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
-
-        # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
-
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
-
-    except Webhook.DoesNotExist:
-        return
-    except requests.RequestException as e:
-        # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
-        )
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
-                )
-            return
-        raise requests.RequestException()
-
-    except Exception as e:
-        if settings.DEBUG:
-            print(e)
-        log_exception(e)
-        return
+@shared_task
+def webhook_task(webhook, slug, event, event_data, action, current_site):
+    """Send a single event through the pooled delivery and its retry policy"""
+    webhook_delivery_task(
+        deliveries=[
+            {
+                "webhook": str(webhook),
+                "event": event,
+                "action": WEBHOOK_ACTION.get(action, action),
+                "payload": json.loads(
+                    json.dumps({"data": event_data}, cls=DjangoJSONEncoder)
+                ),
+            }
+        ],
+        current_site=current_site,
+    )
 
 
 @shared_task
@@ -239,115 +174,27 @@ def send_webhook_deactivation_email(webhook_id, receiver_id, current_site, reaso
         return
 
 
-@shared_task(
-    bind=True,
-    autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
-    retry_jitter=True,
-)
+@shared_task
 def webhook_send_task(
-    self, webhook, slug, event, event_data, action, current_site, activity
+    webhook, slug, event, event_data, action, current_site, activity
 ):
-    try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
-        # # Your secret key
-        event_data = (
-            json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
-            if event_data is not None
-            else None
-        )
-
-        activity = (
-            json.loads(json.dumps(activity, cls=DjangoJSONEncoder))
-            if activity is not None
-            else None
-        )
-
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
-
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-            "activity": activity,
-        }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
-
-        # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
-
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
-
-    except requests.RequestException as e:
-        # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
-        )
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
-                )
-            return
-        raise requests.RequestException()
-
-    except Exception as e:
-        if settings.DEBUG:
-            print(e)
-        log_exception(e)
-        return
+    """Send a single activity through the pooled delivery and its retry policy"""
+    webhook_delivery_task(
+        deliveries=[
+            {
+                "webhook": str(webhook),
+                "event": event,
+                "action": WEBHOOK_ACTION.get(action, action),
+                "payload": json.loads(
+                    json.dumps(
+                        {"data": event_data, "activity": activity},
+                        cls=DjangoJSONEncoder,
+                    )
+                ),
+            }
+        ],
+        current_site=current_site,
+    )
 
 
 @shared_task
@@ -365,40 +212,39 @@ def webhook_activity(
     new_identifier,
 ):
     try:
-        webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
-
-        if event == "project":
-            webhooks = webhooks.filter(project=True)
-
-        if event == "issue":
-            webhooks = webhooks.filter(issue=True)
-
-        if event == "module" or event == "module_issue":
-            webhooks = webhooks.filter(module=True)
-
-        if event == "cycle" or event == "cycle_issue":
-            webhooks = webhooks.filter(cycle=True)
-
-        if event == "issue_comment":
-            webhooks = webhooks.filter(issue_comment=True)
+        webhook_ids = get_event_webhook_ids(slug=slug, event=event)
+        if not webhook_ids:
+            return
 
-        for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook=webhook.id,
-                slug=slug,
-                event=event,
-                event_data=get_model_data(event=event, event_id=event_id),
-                action=verb,
-                current_site=current_site,
-                activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
+        # Serialize the entity and the actor once for all the webhooks
+        payload = json.loads(
+            json.dumps(
+                {
+                    "data": get_model_data(event=event, event_id=event_id),
+                    "activity": {
+                        "field": field,
+                        "new_value": new_value,
+                        "old_value": old_value,
+                        "actor": get_model_data(event="user", event_id=actor_id),
+                        "old_identifier": old_identifier,
+                        "new_identifier": new_identifier,
+                    },
                 },
+                cls=DjangoJSONEncoder,
             )
+        )
+        webhook_delivery_task.delay(
+            deliveries=[
+                {
+                    "webhook": webhook_id,
+                    "event": event,
+                    "action": WEBHOOK_ACTION.get(verb, verb),
+                    "payload": payload,
+                }
+                for webhook_id in webhook_ids
+            ],
+            current_site=current_site,
+        )
         return
     except Exception as e:
         # Return if a does not exist error occurs
@@ -415,8 +261,12 @@ def model_activity(
     model_name, model_id, requested_data, current_instance, actor_id, slug, origin=None
 ):
     """Function takes in two json and computes differences between keys of both the json"""
+    # Skip the diff when no webhook of the workspace is subscribed to the model
+    if not get_event_webhook_ids(slug=slug, event=model_name):
+        return
+
     if current_instance is None:
-        webhook_activity.delay(
+        dispatch_webhook_activity(
             event=model_name,
             verb="created",
             field=None,
@@ -443,7 +293,7 @@ def model_activity(
             current_value = current_instance.get(key, None)
             requested_value = requested_data.get(key, None)
             if current_value != requested_value:
-                webhook_activity.delay(
+                dispatch_webhook_activity(
                     event=model_name,
                     verb="updated",
                     field=key,
@@ -458,3 +308,224 @@ def model_activity(
                 )
 
     return
+
+
+def webhook_batch_key(slug, event):
+    return f"webhook_batch:{slug}:{event}"
+
+
+def dispatch_webhook_activity(**activity):
+    """
+    Send the activity to the webhooks of the workspace
+    Activities are buffered per workspace and event and delivered in batches
+    when WEBHOOK_BATCH_WINDOW is set, otherwise every activity is delivered
+    on its own
+    """
+    # Drop the events no webhook of the workspace is subscribed to
+    if not get_event_webhook_ids(slug=activity["slug"], event=activity["event"]):
+        return
+
+    if not settings.WEBHOOK_BATCH_WINDOW:
+        webhook_activity.delay(**activity)
+        return
+
+    key = webhook_batch_key(activity["slug"], activity["event"])
+    ri = redis_instance()
+    ri.rpush(key, json.dumps(activity, cls=DjangoJSONEncoder))
+    # The first activity of the window schedules the flush
+    if ri.set(f"{key}:scheduled", "1", nx=True, ex=settings.WEBHOOK_BATCH_WINDOW * 10):
+        flush_webhook_batch.apply_async(
+            kwargs={"slug": activity["slug"], "event": activity["event"]},
+            countdown=settings.WEBHOOK_BATCH_WINDOW,
+        )
+
+
+@shared_task
+def flush_webhook_batch(slug, event):
+    try:
+        key = webhook_batch_key(slug, event)
+        ri = redis_instance()
+        # Take the buffered activities and reopen the window atomically
+        pipeline = ri.pipeline(transaction=True)
+        pipeline.lrange(key, 0, -1)
+        pipeline.delete(key, f"{key}:scheduled")
+        activities = [json.loads(activity) for activity in pipeline.execute()[0]]
+        if not activities:
+            return
+
+        webhook_ids = get_event_webhook_ids(slug=slug, event=event)
+        if not webhook_ids:
+            return
+
+        # Serialize every entity and actor once for the whole batch
+        model_data = {
+            str(data["id"]): data
+            for data in get_model_data(
+                event=event,
+                event_id={activity["event_id"] for activity in activities},
+                many=True,
+            )
+        }
+        actors = {
+            str(data["id"]): data
+            for data in get_model_data(
+                event="user",
+                event_id={activity["actor_id"] for activity in activities},
+                many=True,
+            )
+        }
+
+        deliveries = [
+            {
+                "action": activity["verb"],
+                "data": model_data.get(str(activity["event_id"])),
+                "activity": {
+                    "field": activity["field"],
+                    "new_value": activity["new_value"],
+                    "old_value": activity["old_value"],
+                    "actor": actors.get(str(activity["actor_id"])),
+                    "old_identifier": activity["old_identifier"],
+                    "new_identifier": activity["new_identifier"],
+                },
+            }
+            for activity in activities
+            if str(activity["event_id"]) in model_data
+        ]
+
+        deliveries = json.loads(json.dumps(deliveries, cls=DjangoJSONEncoder))
+        batches = [
+            deliveries[index : index + settings.WEBHOOK_BATCH_SIZE]
+            for index in range(0, len(deliveries), settings.WEBHOOK_BATCH_SIZE)
+        ]
+        webhook_delivery_task.delay(
+            deliveries=[
+                {
+                    "webhook": webhook_id,
+                    "event": event,
+                    "action": "batch",
+                    "payload": {"data": batch},
+                    "headers": {"X-Plane-Batch": str(len(batch))},
+                }
+                for webhook_id in webhook_ids
+                for batch in batches
+            ],
+            current_site=activities[-1].get("current_site"),
+        )
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        log_exception(e)
+        return
+
+
+@shared_task
+def webhook_delivery_task(deliveries, current_site):
+    """
+    Send the deliveries concurrently over pooled connections and log them in bulk
+    Deliveries failing with a network error are retried together with a backoff
+    """
+    try:
+        webhooks = {
+            str(webhook.id): webhook
+            for webhook in Webhook.objects.filter(
+                pk__in={delivery["webhook"] for delivery in deliveries},
+                is_active=True,
+            ).select_related("workspace")
+        }
+        deliveries = [
+            delivery for delivery in deliveries if delivery["webhook"] in webhooks
+        ]
+        if not deliveries:
+            return
+
+        requests_ = []
+        for delivery in deliveries:
+            webhook = webhooks[delivery["webhook"]]
+            payload = {
+                "event": delivery["event"],
+                "action": delivery["action"],
+                "webhook_id": str(webhook.id),
+                "workspace_id": str(webhook.workspace_id),
+                **delivery["payload"],
+            }
+            requests_.append(
+                build_request(
+                    url=webhook.url,
+                    event=delivery["event"],
+                    payload=payload,
+                    secret_key=webhook.secret_key,
+                    headers=delivery.get("headers"),
+                )
+            )
+
+        results = deliver(requests_)
+
+        logs = []
+        failed = []
+        for delivery, request, result in zip(deliveries, requests_, results):
+            webhook = webhooks[delivery["webhook"]]
+            retry_count = delivery.get("retry_count", 0)
+            if result is None or result["error"] is not None:
+                error = result["error"] if result else "Delivery failed"
+                failed.append((delivery, error))
+                response = {"status": 500, "headers": "", "body": str(error)}
+            else:
+                response = result
+            logs.append(
+                WebhookLog(
+                    workspace_id=webhook.workspace_id,
+                    webhook_id=webhook.id,
+                    event_type=str(delivery["event"]),
+                    request_method=str(delivery["action"]),
+                    request_headers=str(request["headers"]),
+                    request_body=request["body"],
+                    response_status=str(response["status"]),
+                    response_headers=str(response["headers"]),
+                    response_body=str(response["body"]),
+                    retry_count=retry_count,
+                )
+            )
+
+        # Log all the webhook requests
+        WebhookLog.objects.bulk_create(logs, batch_size=100)
+
+        # Retry logic
+        retries = {}
+        deactivated = {}
+        for delivery, error in failed:
+            retry_count = delivery.get("retry_count", 0)
+            if retry_count >= WEBHOOK_MAX_RETRIES:
+                deactivated.setdefault(delivery["webhook"], error)
+            else:
+                retries.setdefault(retry_count, []).append(
+                    {**delivery, "retry_count": retry_count + 1}
+                )
+
+        # Deliveries failing for the same time are retried together
+        for retry_count, retry_deliveries in retries.items():
+            webhook_delivery_task.apply_async(
+                kwargs={"deliveries": retry_deliveries, "current_site": current_site},
+                countdown=webhook_retry_countdown(retry_count),
+            )
+
+        if deactivated:
+            Webhook.objects.filter(pk__in=deactivated.keys()).update(is_active=False)
+            for slug in {
+                webhooks[webhook_id].workspace.slug for webhook_id in deactivated
+            }:
+                invalidate_webhook_index(slug)
+            for webhook_id, error in deactivated.items():
+                # send email for the deactivation of the webhook
+                send_webhook_deactivation_email(
+                    webhook_id=webhook_id,
+                    receiver_id=webhooks[webhook_id].created_by_id,
+                    reason=str(error),
+                    current_site=current_site,
+                )
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        log_exception(e)
+        return
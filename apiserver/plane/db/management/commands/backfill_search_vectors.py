@@ -0,0 +1,26 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.search import SEARCH_VECTOR_TABLES, backfill_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Fill the search vectors of the issues and pages missing one"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Rows updated per statement"
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild the vectors already filled as well",
+        )
+
+    def handle(self, *args, **options):
+        for table in SEARCH_VECTOR_TABLES:
+            filled = backfill_search_vectors(
+                table, batch_size=options["batch_size"], rebuild=options["all"]
+            )
+            self.stdout.write(f"{table}: {filled} search vectors filled")
@@ -0,0 +1,23 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.cache import get_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show the hit, miss and stale counts of the cached views"
+
+    def handle(self, *args, **options):
+        stats = get_cache_stats()
+        if not stats:
+            self.stdout.write("No cache stats recorded yet")
+            return
+
+        for name, counts in sorted(stats.items()):
+            total = sum(counts.values())
+            hit_rate = (counts["hit"] + counts["stale"]) / total * 100 if total else 0
+            self.stdout.write(
+                f"{name}: hit={counts['hit']} miss={counts['miss']} "
+                f"stale={counts['stale']} hit_rate={hit_rate:.1f}%"
+            )
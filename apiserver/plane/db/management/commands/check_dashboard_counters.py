@@ -0,0 +1,54 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.db.models import DashboardCounter
+from plane.utils.dashboard_counters import (
+    COUNTER_FIELDS,
+    compute_dashboard_counters,
+    is_stale,
+    refresh_dashboard_counters,
+)
+
+
+class Command(BaseCommand):
+    help = "Compare the stored dashboard counters with a full recomputation"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workspace", help="Only check the workspace slug")
+        parser.add_argument(
+            "--fix", action="store_true", help="Store the recomputed counters"
+        )
+
+    def handle(self, *args, **options):
+        counters = DashboardCounter.objects.select_related("workspace", "user")
+        if options["workspace"]:
+            counters = counters.filter(workspace__slug=options["workspace"])
+
+        checked = mismatched = 0
+        for counter in counters.order_by("pk").iterator(chunk_size=500):
+            # Stale counters are recomputed on their next read
+            if is_stale(counter):
+                continue
+            checked += 1
+            expected = compute_dashboard_counters(counter.workspace_id, counter.user_id)
+            differences = {
+                field: (getattr(counter, field), expected[field])
+                for field in COUNTER_FIELDS
+                if getattr(counter, field) != expected[field]
+            }
+            if not differences:
+                continue
+
+            mismatched += 1
+            self.stdout.write(
+                f"{counter.workspace.slug} {counter.user.email}: "
+                + ", ".join(
+                    f"{field} stored={stored} expected={value}"
+                    for field, (stored, value) in differences.items()
+                )
+            )
+            if options["fix"]:
+                refresh_dashboard_counters(counter.workspace_id, counter.user_id)
+
+        self.stdout.write(f"Checked {checked} counters, {mismatched} mismatched")
@@ -0,0 +1,29 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.purge import get_purge_metrics
+
+
+class Command(BaseCommand):
+    help = "Show the rows and rows per second of the last purge of every table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "name",
+            nargs="?",
+            default="hard_delete",
+            help="Purge name, hard_delete or api_logs",
+        )
+
+    def handle(self, *args, **options):
+        metrics = get_purge_metrics(options["name"])
+        if not metrics:
+            self.stdout.write("No purge metrics recorded yet")
+            return
+
+        for label, table in sorted(metrics.items()):
+            self.stdout.write(
+                f"{label}: rows={table['rows']} seconds={table['seconds']} "
+                f"rows_per_second={table['rows_per_second']} cutoff={table['cutoff']}"
+            )
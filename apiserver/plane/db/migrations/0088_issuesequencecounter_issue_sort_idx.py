@@ -0,0 +1,39 @@
+# Generated by Django 4.2.17 on 2026-10-18 03:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0087_remove_issueversion_description_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueSequenceCounter',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='issue_sequence_counter', serialize=False, to='db.project')),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Issue Sequence Counter',
+                'verbose_name_plural': 'Issue Sequence Counters',
+                'db_table': 'issue_sequence_counters',
+            },
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO issue_sequence_counters (project_id, last_sequence)
+            SELECT project_id, MAX(sequence)
+            FROM issue_sequences
+            GROUP BY project_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', 'state', 'sort_order'], name='issue_project_state_sort_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.17 on 2026-10-18 03:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0088_issuesequencecounter_issue_sort_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issuedescriptionversion',
+            name='description_delta',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name='pageversion',
+            name='description_delta',
+            field=models.BinaryField(null=True),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.17 on 2026-10-18 03:41
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0089_description_version_delta'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('assigned_issues_count', models.PositiveIntegerField(default=0)),
+                ('pending_issues_count', models.PositiveIntegerField(default=0)),
+                ('created_issues_count', models.PositiveIntegerField(default=0)),
+                ('completed_issues_count', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_counters', to=settings.AUTH_USER_MODEL)),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_counters', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Dashboard Counter',
+                'verbose_name_plural': 'Dashboard Counters',
+                'db_table': 'dashboard_counters',
+                'ordering': ('-created_at',),
+                'unique_together': {('workspace', 'user')},
+            },
+        ),
+    ]
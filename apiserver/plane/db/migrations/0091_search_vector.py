@@ -0,0 +1,72 @@
+from django.db import migrations
+
+from plane.utils.search import SEARCH_VECTOR_TABLES, backfill_search_vectors
+
+# The search vectors are kept up to date by a trigger on the columns they are
+# built from, existing rows are filled before the index is built
+SEARCH_VECTOR_SQL = """
+ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector;
+CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A')
+        || setweight(
+            to_tsvector('simple', coalesce(NEW.description_stripped, '')), 'B'
+        );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};
+CREATE TRIGGER {table}_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, description_stripped ON {table}
+    FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update();
+"""
+
+REVERSE_SEARCH_VECTOR_SQL = """
+DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};
+DROP FUNCTION IF EXISTS {table}_search_vector_update();
+ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector;
+"""
+
+# Built without blocking the writes to the table
+SEARCH_VECTOR_INDEX_SQL = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_search_vector_idx
+    ON {table} USING GIN (search_vector)
+"""
+
+REVERSE_SEARCH_VECTOR_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS {table}_search_vector_idx
+"""
+
+
+def fill_search_vectors(apps, schema_editor):
+    for table in SEARCH_VECTOR_TABLES:
+        backfill_search_vectors(table, db_connection=schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    # The concurrent index build and the backfill batches run outside of a
+    # transaction
+    atomic = False
+
+    dependencies = [
+        ('db', '0090_dashboard_counter'),
+    ]
+
+    operations = [
+        *(
+            migrations.RunSQL(
+                SEARCH_VECTOR_SQL.format(table=table),
+                reverse_sql=REVERSE_SEARCH_VECTOR_SQL.format(table=table),
+            )
+            for table in SEARCH_VECTOR_TABLES
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+        *(
+            migrations.RunSQL(
+                SEARCH_VECTOR_INDEX_SQL.format(table=table),
+                reverse_sql=REVERSE_SEARCH_VECTOR_INDEX_SQL.format(table=table),
+            )
+            for table in SEARCH_VECTOR_TABLES
+        ),
+    ]
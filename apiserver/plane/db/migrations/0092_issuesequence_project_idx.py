@@ -0,0 +1,20 @@
+# Generated by Django 4.2.17 on 2026-10-18 05:16
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The index is built without blocking the issue creation
+    atomic = False
+
+    dependencies = [
+        ('db', '0091_search_vector'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='issuesequence',
+            index=models.Index(fields=['project', 'sequence'], name='issue_sequence_project_idx'),
+        ),
+    ]
@@ -3,7 +3,7 @@ from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
 from .cycle import Cycle, CycleIssue, CycleUserProperties
-from .dashboard import Dashboard, DashboardWidget, Widget
+from .dashboard import Dashboard, DashboardCounter, DashboardWidget, Widget
 from .deploy_board import DeployBoard
 from .draft import (
     DraftIssue,
@@ -39,6 +39,7 @@ from .issue import (
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    IssueSequenceCounter,
     IssueSubscriber,
     IssueVote,
     IssueVersion,
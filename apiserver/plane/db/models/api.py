@@ -3,6 +3,8 @@ from uuid import uuid4
 
 # Django imports
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.conf import settings
 
 from .base import BaseModel
@@ -51,6 +53,14 @@ class APIToken(BaseModel):
         return str(self.user.id)
 
 
+@receiver([post_save, post_delete], sender=APIToken)
+def invalidate_api_token_cache(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.api_token import invalidate_api_token
+
+    invalidate_api_token(instance.token)
+
+
 class APIActivityLog(BaseModel):
     token_identifier = models.CharField(max_length=255)
 
@@ -90,3 +90,32 @@ class DashboardWidget(BaseModel):
         verbose_name_plural = "Dashboard Widgets"
         db_table = "dashboard_widgets"
         ordering = ("-created_at",)
+
+
+class DashboardCounter(TimeAuditModel):
+    """Overview counts of the issues of a user in a workspace"""
+
+    id = models.UUIDField(
+        default=uuid.uuid4, unique=True, editable=False, db_index=True, primary_key=True
+    )
+    workspace = models.ForeignKey(
+        "db.Workspace", on_delete=models.CASCADE, related_name="dashboard_counters"
+    )
+    user = models.ForeignKey(
+        "db.User", on_delete=models.CASCADE, related_name="dashboard_counters"
+    )
+    assigned_issues_count = models.PositiveIntegerField(default=0)
+    pending_issues_count = models.PositiveIntegerField(default=0)
+    created_issues_count = models.PositiveIntegerField(default=0)
+    completed_issues_count = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.workspace_id} {self.user_id}"
+
+    class Meta:
+        unique_together = ("workspace", "user")
+        verbose_name = "Dashboard Counter"
+        verbose_name_plural = "Dashboard Counters"
+        db_table = "dashboard_counters"
+        ordering = ("-created_at",)
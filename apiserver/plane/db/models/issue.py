@@ -6,7 +6,7 @@ from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models, transaction
+from django.db import connection, models, transaction
 from django.utils import timezone
 from django.db.models import Q
 from django import apps
@@ -15,6 +15,7 @@ from django import apps
 from plane.utils.html_processor import strip_tags
 from plane.db.mixins import SoftDeletionManager
 from plane.utils.exception_logger import log_exception
+from plane.utils.description_version import add_version
 from .base import BaseModel
 from .project import ProjectBaseModel
 
@@ -178,6 +179,12 @@ class Issue(ProjectBaseModel):
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["project", "state", "sort_order"],
+                name="issue_project_state_sort_idx",
+            )
+        ]
 
     def save(self, *args, **kwargs):
         if self.state is None:
@@ -209,23 +216,17 @@ class Issue(ProjectBaseModel):
 
         if self._state.adding:
             with transaction.atomic():
-                last_sequence = (
-                    IssueSequence.objects.filter(project=self.project)
-                    .select_for_update()
-                    .aggregate(largest=models.Max("sequence"))["largest"]
-                )
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
+                # The project counter row is locked until the issue is saved
+                self.sequence_id = reserve_issue_sequences(self.project_id)[0]
                 # Strip the html tags using html parser
                 self.description_stripped = (
                     None
                     if (self.description_html == "" or self.description_html is None)
                     else strip_tags(self.description_html)
                 )
-                largest_sort_order = Issue.objects.filter(
-                    project=self.project, state=self.state
-                ).aggregate(largest=models.Max("sort_order"))["largest"]
-                if largest_sort_order is not None:
-                    self.sort_order = largest_sort_order + 10000
+                sort_orders = reserve_sort_orders(self.project_id, self.state_id)
+                if sort_orders is not None:
+                    self.sort_order = sort_orders[0]
 
                 super(Issue, self).save(*args, **kwargs)
 
@@ -246,6 +247,77 @@ class Issue(ProjectBaseModel):
         return f"{self.name} <{self.project.name}>"
 
 
+def reserve_issue_sequences(project_id, count=1):
+    """
+    Reserve count consecutive sequence ids in the project and return them
+    The counter row is created from the existing sequences on first use and
+    stays locked until the surrounding transaction ends. The counter never
+    falls behind the largest sequence, so sequences written without it (the
+    previous code during a rolling deploy) are skipped instead of reused.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO issue_sequence_counters (project_id, last_sequence)
+            SELECT %(project_id)s, COALESCE(MAX(sequence), 0) + %(count)s
+            FROM issue_sequences
+            WHERE project_id = %(project_id)s
+            ON CONFLICT (project_id) DO UPDATE
+            SET last_sequence = GREATEST(
+                issue_sequence_counters.last_sequence + %(count)s,
+                EXCLUDED.last_sequence
+            )
+            RETURNING last_sequence
+            """,
+            {"project_id": project_id, "count": count},
+        )
+        (last_sequence,) = cursor.fetchone()
+    return range(last_sequence - count + 1, last_sequence + 1)
+
+
+def reserve_sort_orders(project_id, state_id, count=1):
+    """Return count sort orders after the last issue of the state or None if empty"""
+    largest_sort_order = (
+        Issue.objects.filter(project_id=project_id, state_id=state_id)
+        .order_by("-sort_order")
+        .values_list("sort_order", flat=True)
+        .first()
+    )
+    if largest_sort_order is None:
+        return None
+    return [largest_sort_order + 10000 * (index + 1) for index in range(count)]
+
+
+def reserve_issue_numbers(issues):
+    """
+    Set the sequence id and the sort order of the unsaved issues for bulk_create
+    Every project and state of the batch costs a single statement, call it
+    inside the transaction creating the issues
+    """
+    by_project = {}
+    by_state = {}
+    for issue in issues:
+        by_project.setdefault(issue.project_id, []).append(issue)
+        by_state.setdefault((issue.project_id, issue.state_id), []).append(issue)
+
+    for project_id, project_issues in by_project.items():
+        sequences = reserve_issue_sequences(project_id, len(project_issues))
+        for issue, sequence in zip(project_issues, sequences):
+            issue.sequence_id = sequence
+
+    for (project_id, state_id), state_issues in by_state.items():
+        sort_orders = reserve_sort_orders(project_id, state_id, len(state_issues))
+        if sort_orders is None:
+            # Keep the default for the first issue and space the others after it
+            first = Issue._meta.get_field("sort_order").default
+            sort_orders = [
+                first + 10000 * index for index in range(len(state_issues))
+            ]
+        for issue, sort_order in zip(state_issues, sort_orders):
+            issue.sort_order = sort_order
+    return issues
+
+
 class IssueBlocker(ProjectBaseModel):
     block = models.ForeignKey(
         Issue, related_name="blocker_issues", on_delete=models.CASCADE
@@ -532,6 +604,23 @@ class IssueLabel(ProjectBaseModel):
         return f"{self.issue.name} {self.label.name}"
 
 
+class IssueSequenceCounter(models.Model):
+    """Last sequence id handed out in the project"""
+
+    project = models.OneToOneField(
+        "db.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="issue_sequence_counter",
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+
+
 class IssueSequence(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue,
@@ -547,6 +636,13 @@ class IssueSequence(ProjectBaseModel):
         verbose_name_plural = "Issue Sequences"
         db_table = "issue_sequences"
         ordering = ("-created_at",)
+        indexes = [
+            # Largest sequence of a project read by every reservation
+            models.Index(
+                fields=["project", "sequence"],
+                name="issue_sequence_project_idx",
+            )
+        ]
 
 
 class IssueSubscriber(ProjectBaseModel):
@@ -791,6 +887,8 @@ class IssueDescriptionVersion(ProjectBaseModel):
         on_delete=models.CASCADE,
         related_name="issue_description_versions",
     )
+    # Older versions are stored as a delta against the next newer version
+    description_delta = models.BinaryField(null=True)
 
     class Meta:
         verbose_name = "Issue Description Version"
@@ -803,18 +901,22 @@ class IssueDescriptionVersion(ProjectBaseModel):
             """
             Log the issue description version
             """
-            cls.objects.create(
+            add_version(
+                cls,
+                "issue_id",
+                issue.id,
+                values={
+                    "description_binary": issue.description_binary,
+                    "description_html": issue.description_html,
+                    "description_stripped": issue.description_stripped,
+                    "description_json": issue.description,
+                },
                 workspace_id=issue.workspace_id,
                 project_id=issue.project_id,
                 created_by_id=issue.created_by_id,
                 updated_by_id=issue.updated_by_id,
                 owned_by_id=user,
                 last_saved_at=timezone.now(),
-                issue_id=issue.id,
-                description_binary=issue.description_binary,
-                description_html=issue.description_html,
-                description_stripped=issue.description_stripped,
-                description_json=issue.description,
             )
             return True
         except Exception as e:
@@ -172,6 +172,8 @@ class PageVersion(BaseModel):
     description_html = models.TextField(blank=True, default="<p></p>")
     description_stripped = models.TextField(blank=True, null=True)
     description_json = models.JSONField(default=dict, blank=True)
+    # Older versions are stored as a delta against the next newer version
+    description_delta = models.BinaryField(null=True)
 
     class Meta:
         verbose_name = "Page Version"
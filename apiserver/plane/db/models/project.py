@@ -7,6 +7,8 @@ from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.mixins import AuditModel
@@ -237,6 +239,16 @@ class ProjectMember(ProjectBaseModel):
         return f"{self.member.email} <{self.project.name}>"
 
 
+@receiver([post_save, post_delete], sender=ProjectMember)
+def invalidate_project_membership(sender, instance, **kwargs):
+    # Drop the cached roles of the member when membership caching is enabled
+    if settings.MEMBERSHIP_CACHE_TIMEOUT and instance.member_id:
+        # Module imports
+        from plane.app.permissions.membership import invalidate_membership
+
+        invalidate_membership(instance.member_id, instance.workspace.slug)
+
+
 # TODO: Remove workspace relation later
 class ProjectIdentifier(AuditModel):
     workspace = models.ForeignKey(
@@ -3,7 +3,9 @@ from uuid import uuid4
 from urllib.parse import urlparse
 
 # Django imports
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.core.exceptions import ValidationError
 
 # Module imports
@@ -54,6 +56,16 @@ class Webhook(BaseModel):
         ordering = ("-created_at",)
 
 
+@receiver([post_save, post_delete], sender=Webhook)
+def invalidate_webhook_subscriptions(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.webhook_subscriptions import invalidate_webhook_index
+
+    slug = instance.workspace.slug
+    # Drop the routing index once the change is visible to the other workers
+    transaction.on_commit(lambda: invalidate_webhook_index(slug))
+
+
 class WebhookLog(BaseModel):
     workspace = models.ForeignKey(
         "db.Workspace", on_delete=models.CASCADE, related_name="webhook_logs"
@@ -5,6 +5,8 @@ import pytz
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .base import BaseModel
@@ -207,6 +209,16 @@ class WorkspaceMember(BaseModel):
         return f"{self.member.email} <{self.workspace.name}>"
 
 
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+def invalidate_workspace_membership(sender, instance, **kwargs):
+    # Drop the cached roles of the member when membership caching is enabled
+    if settings.MEMBERSHIP_CACHE_TIMEOUT and instance.member_id:
+        # Module imports
+        from plane.app.permissions.membership import invalidate_membership
+
+        invalidate_membership(instance.member_id, instance.workspace.slug)
+
+
 class WorkspaceMemberInvite(BaseModel):
     workspace = models.ForeignKey(
         "db.Workspace", on_delete=models.CASCADE, related_name="workspace_member_invite"
@@ -27,7 +27,7 @@ class InstanceEndpoint(BaseAPIView):
             return [InstanceAdminPermission()]
         return [AllowAny()]
 
-    @cache_response(60 * 60 * 2, user=False)
+    @cache_response(60 * 60 * 2, user=False, single_flight=True, local_timeout=30)
     @method_decorator(cache_control(private=True, max_age=12))
     def get(self, request):
         instance = Instance.objects.first()
@@ -1,4 +1,12 @@
-from plane.db.models import APIActivityLog
+# Python imports
+import random
+
+# Django imports
+from django.conf import settings
+from django.utils import timezone
+
+# Module imports
+from plane.utils.api_activity_log import api_activity_log_buffer, truncate_body
 
 
 class APITokenLogMiddleware:
@@ -7,29 +15,51 @@ class APITokenLogMiddleware:
 
     def __call__(self, request):
         request_body = request.body
+        requested_at = timezone.now()
         response = self.get_response(request)
-        self.process_request(request, response, request_body)
+        self.process_request(request, response, request_body, requested_at)
         return response
 
-    def process_request(self, request, response, request_body):
+    def should_log(self, response):
+        # Failed requests are always logged, the rest are sampled
+        if response.status_code >= 400:
+            return True
+        return random.random() < settings.API_ACTIVITY_LOG_SAMPLE_RATE
+
+    def get_user_id(self, request):
+        # The api token authentication sets the user on the django request
+        user = getattr(request, "user", None)
+        if user is None or user.is_anonymous:
+            return None
+        return str(user.id)
+
+    def process_request(self, request, response, request_body, requested_at):
         api_key_header = "X-Api-Key"
         api_key = request.headers.get(api_key_header)
         # If the API key is present, log the request
-        if api_key:
+        if api_key and self.should_log(response):
             try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
-                    query_params=request.META.get("QUERY_STRING", ""),
-                    headers=str(request.headers),
-                    body=(request_body.decode("utf-8") if request_body else None),
-                    response_body=(
-                        response.content.decode("utf-8") if response.content else None
-                    ),
-                    response_code=response.status_code,
-                    ip_address=request.META.get("REMOTE_ADDR", None),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
+                # The record is written in bulk by the api logs task
+                api_activity_log_buffer.push(
+                    {
+                        "token_identifier": api_key,
+                        "path": request.path,
+                        "method": request.method,
+                        "query_params": request.META.get("QUERY_STRING", ""),
+                        "headers": truncate_body(str(request.headers)),
+                        "body": truncate_body(request_body),
+                        "response_body": (
+                            None
+                            if response.streaming
+                            else truncate_body(response.content)
+                        ),
+                        "response_code": response.status_code,
+                        "ip_address": request.META.get("REMOTE_ADDR", None),
+                        "user_agent": request.META.get("HTTP_USER_AGENT", None),
+                        # The bulk insert bypasses BaseModel.save and crum
+                        "created_at": requested_at.isoformat(),
+                        "created_by_id": self.get_user_id(request),
+                    }
                 )
 
             except Exception as e:
@@ -250,6 +250,9 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_ACCEPT_CONTENT = ["application/json"]
+# Results are only stored for the tasks combined by a chord
+CELERY_RESULT_BACKEND = REDIS_URL
+CELERY_TASK_IGNORE_RESULT = True
 
 
 CELERY_IMPORTS = (
@@ -338,10 +341,70 @@ SPACE_BASE_URL = os.environ.get("SPACE_BASE_URL", None)
 APP_BASE_URL = os.environ.get("APP_BASE_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
+# Rows updated per statement when a soft delete cascades to related objects
+SOFT_DELETE_BATCH_SIZE = int(os.environ.get("SOFT_DELETE_BATCH_SIZE", 1000))
+# Rows deleted per statement by the purges of expired rows
+PURGE_BATCH_SIZE = int(os.environ.get("PURGE_BATCH_SIZE", 1000))
 
 # Instance Changelog URL
 INSTANCE_CHANGELOG_URL = os.environ.get("INSTANCE_CHANGELOG_URL", "")
 
+# Webhook batching window in seconds, 0 delivers every activity on its own
+WEBHOOK_BATCH_WINDOW = int(os.environ.get("WEBHOOK_BATCH_WINDOW", 0))
+# Maximum number of activities in a batched webhook payload
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 100))
+# Concurrent webhook deliveries per worker and per receiving host
+WEBHOOK_MAX_WORKERS = int(os.environ.get("WEBHOOK_MAX_WORKERS", 16))
+WEBHOOK_PER_HOST_CONCURRENCY = int(os.environ.get("WEBHOOK_PER_HOST_CONCURRENCY", 4))
+# Webhook connect and read timeouts in seconds
+WEBHOOK_CONNECT_TIMEOUT = float(os.environ.get("WEBHOOK_CONNECT_TIMEOUT", 5))
+WEBHOOK_READ_TIMEOUT = float(os.environ.get("WEBHOOK_READ_TIMEOUT", 30))
+
+# Share of the successful API key requests logged, failures are always logged
+API_ACTIVITY_LOG_SAMPLE_RATE = float(os.environ.get("API_ACTIVITY_LOG_SAMPLE_RATE", 1))
+# Characters kept of the logged request and response bodies, 0 keeps everything
+API_ACTIVITY_LOG_BODY_LIMIT = int(os.environ.get("API_ACTIVITY_LOG_BODY_LIMIT", 65536))
+# Records buffered per process and in redis before new ones are dropped
+API_ACTIVITY_LOG_BUFFER_SIZE = int(os.environ.get("API_ACTIVITY_LOG_BUFFER_SIZE", 10000))
+API_ACTIVITY_LOG_MAX_PENDING = int(
+    os.environ.get("API_ACTIVITY_LOG_MAX_PENDING", 100000)
+)
+# Records written per insert
+API_ACTIVITY_LOG_BATCH_SIZE = int(os.environ.get("API_ACTIVITY_LOG_BATCH_SIZE", 500))
+
+# Seconds a verified API token is trusted before it is checked again
+API_TOKEN_CACHE_TIMEOUT = int(os.environ.get("API_TOKEN_CACHE_TIMEOUT", 60))
+# Seconds between two last_used writes of an API token
+API_TOKEN_LAST_USED_INTERVAL = int(os.environ.get("API_TOKEN_LAST_USED_INTERVAL", 60))
+
+# Seconds the membership roles of a user are cached, 0 loads them on every request
+MEMBERSHIP_CACHE_TIMEOUT = int(os.environ.get("MEMBERSHIP_CACHE_TIMEOUT", 0))
+
+# Receivers whose pending notification emails are stacked and sent in one batch
+EMAIL_NOTIFICATION_BATCH_SIZE = int(os.environ.get("EMAIL_NOTIFICATION_BATCH_SIZE", 100))
+
+# Page and issue description versions kept in full, one in every interval
+DESCRIPTION_VERSION_SNAPSHOT_INTERVAL = int(
+    os.environ.get("DESCRIPTION_VERSION_SNAPSHOT_INTERVAL", 10)
+)
+# Seconds page description saves are coalesced before their transactions and
+# version are recorded, 0 processes every save on its own
+PAGE_SAVE_WINDOW = int(os.environ.get("PAGE_SAVE_WINDOW", 10))
+# Seconds the dashboard counters of a user are served before being recomputed
+DASHBOARD_COUNTER_TIMEOUT = int(os.environ.get("DASHBOARD_COUNTER_TIMEOUT", 3600))
+# Seconds the default analytics of a workspace are cached, issue writes drop them
+ANALYTICS_CACHE_TIMEOUT = int(os.environ.get("ANALYTICS_CACHE_TIMEOUT", 600))
+# Threads running the entity searches of the global search and the seconds an
+# entity search may take before its results are left out
+GLOBAL_SEARCH_MAX_WORKERS = int(os.environ.get("GLOBAL_SEARCH_MAX_WORKERS", 8))
+GLOBAL_SEARCH_TIMEOUT = float(os.environ.get("GLOBAL_SEARCH_TIMEOUT", 2))
+# Issues fetched per round trip by the exports and bytes per uploaded part of
+# the export archive, S3 parts are at least 5 MB
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", 1000))
+EXPORT_UPLOAD_PART_SIZE = int(
+    os.environ.get("EXPORT_UPLOAD_PART_SIZE", 8 * 1024 * 1024)
+)
+
 ATTACHMENT_MIME_TYPES = [
     # Images
     "image/jpeg",
@@ -0,0 +1,129 @@
+# Python imports
+import uuid
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase, override_settings
+
+# Third party imports
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+# Module imports
+from plane.app.permissions import ROLE
+from plane.app.views.intake.base import IntakeIssueViewSet
+from plane.db.models import Issue
+
+VIEW = "plane.app.views.intake.base"
+
+
+@override_settings(MEMBERSHIP_CACHE_TIMEOUT=0)
+class IntakeIssuePartialUpdateTest(SimpleTestCase):
+    """partial_update run with the models and serializers mocked out"""
+
+    def setUp(self):
+        self.user = mock.Mock(
+            id=uuid.uuid4(),
+            is_anonymous=False,
+            is_authenticated=True,
+            user_timezone="UTC",
+        )
+        self.project_id = uuid.uuid4()
+        self.issue_id = uuid.uuid4()
+        self.mocks = {}
+        for name in [
+            "Intake",
+            "IntakeIssue",
+            "State",
+            "IssueCreateSerializer",
+            "IssueSerializer",
+            "IntakeIssueSerializer",
+            "IntakeIssueDetailSerializer",
+            "issue_activity",
+        ]:
+            patcher = mock.patch(f"{VIEW}.{name}")
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        self.mocks["IssueSerializer"].return_value.data = {}
+        self.mocks["IntakeIssueSerializer"].return_value.data = {"status": 0}
+        self.mocks["IntakeIssueDetailSerializer"].return_value.data = {}
+
+        # The creator check of the decorator and the issue lookup of the view
+        patcher = mock.patch.object(Issue, "objects")
+        self.issues = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.issue = self.issues.annotate.return_value.get.return_value
+        self.issue.name = "Issue"
+        self.issue.description_html = "<p>Issue</p>"
+        self.issue.description = {}
+
+        patcher = mock.patch("plane.app.permissions.membership.WorkspaceMember")
+        workspace_member = patcher.start()
+        self.addCleanup(patcher.stop)
+        queryset = workspace_member.objects.filter.return_value.values.return_value
+        queryset.first.return_value = {"role": ROLE.MEMBER.value, "is_active": True}
+        patcher = mock.patch("plane.app.permissions.membership.ProjectMember")
+        self.project_member = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def partial_update(self, role, creator):
+        self.project_member.objects.filter.return_value.values_list.return_value = (
+            [] if role is None else [(self.project_id, "PLN", role)]
+        )
+        self.issues.filter.return_value.exists.return_value = creator
+        intake_issue = self.mocks["IntakeIssue"].objects.get.return_value
+        intake_issue.created_by_id = self.user.id if creator else uuid.uuid4()
+
+        request = APIRequestFactory().patch(
+            "/",
+            {"issue": {"name": "Renamed", "priority": "high"}, "status": 1},
+            format="json",
+        )
+        force_authenticate(request, user=self.user)
+        view = IntakeIssueViewSet.as_view({"patch": "partial_update"})
+        with mock.patch.object(IntakeIssueViewSet, "permission_classes", []):
+            return view(
+                request, slug="plane", project_id=self.project_id, pk=self.issue_id
+            )
+
+    def updated_issue_data(self):
+        return self.mocks["IssueCreateSerializer"].call_args.kwargs["data"]
+
+    def test_guest_creator_only_edits_the_name_and_description(self):
+        response = self.partial_update(ROLE.GUEST.value, creator=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.updated_issue_data(),
+            {
+                "name": "Renamed",
+                "description_html": "<p>Issue</p>",
+                "description": {},
+            },
+        )
+        self.mocks["IntakeIssueSerializer"].assert_not_called()
+
+    def test_creator_without_membership_is_treated_as_a_guest(self):
+        response = self.partial_update(None, creator=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("priority", self.updated_issue_data())
+        self.mocks["IntakeIssueSerializer"].assert_not_called()
+
+    def test_admin_edits_the_issue_and_the_intake_status(self):
+        response = self.partial_update(ROLE.ADMIN.value, creator=False)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.updated_issue_data(), {"name": "Renamed", "priority": "high"}
+        )
+        self.assertEqual(
+            self.mocks["IntakeIssueSerializer"].call_args_list[0].kwargs["data"],
+            {"status": 1},
+        )
+        self.mocks["issue_activity"].delay.assert_called()
+
+    def test_guest_cannot_edit_an_issue_of_someone_else(self):
+        response = self.partial_update(ROLE.GUEST.value, creator=False)
+
+        self.assertEqual(response.status_code, 403)
+        self.mocks["IssueCreateSerializer"].assert_not_called()
@@ -0,0 +1,137 @@
+# Python imports
+import csv
+import io
+import time
+import uuid
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.analytic_plot_export import (
+    ASSIGNEE_ID,
+    LABEL_ID,
+    MODULE_ID,
+    STATE_ID,
+    generate_csv_from_rows,
+    generate_non_segmented_rows,
+    generate_segmented_rows,
+)
+
+
+def build_labels(count):
+    return [
+        {"labels__id": uuid.uuid4(), "labels__name": f"Label {index}"}
+        for index in range(count)
+    ]
+
+
+class AnalyticRowsTest(SimpleTestCase):
+    def test_segmented_rows_are_named_and_pivoted(self):
+        states = [
+            {"state_id": uuid.uuid4(), "state__name": name}
+            for name in ["Todo", "Done"]
+        ]
+        labels = build_labels(2)
+        distribution = {
+            states[0]["state_id"]: [
+                {"segment": labels[0]["labels__id"], "count": 2},
+                {"segment": labels[1]["labels__id"], "count": 3},
+            ],
+            states[1]["state_id"]: [{"segment": labels[1]["labels__id"], "count": 4}],
+        }
+
+        rows = list(
+            generate_segmented_rows(
+                distribution,
+                STATE_ID,
+                "issue_count",
+                LABEL_ID,
+                "count",
+                {STATE_ID: states, LABEL_ID: labels},
+            )
+        )
+
+        self.assertEqual(
+            rows,
+            [
+                ("X-Axis", "Issue Count", "Label 0", "Label 1"),
+                ("Todo", 5, 2, 3),
+                ("Done", 4, "0", 4),
+            ],
+        )
+
+    def test_module_segments_are_named_from_the_modules(self):
+        module_id = uuid.uuid4()
+        rows = list(
+            generate_segmented_rows(
+                {"high": [{"segment": module_id, "count": 1}]},
+                "priority",
+                "issue_count",
+                MODULE_ID,
+                "count",
+                {
+                    MODULE_ID: [
+                        {
+                            "issue_module__module_id": module_id,
+                            "issue_module__module__name": "Module",
+                        }
+                    ]
+                },
+            )
+        )
+        self.assertEqual(rows[0], ("Priority", "Issue Count", "Module"))
+
+    def test_unknown_ids_are_kept(self):
+        user_id = uuid.uuid4()
+        rows = list(
+            generate_non_segmented_rows(
+                {user_id: [{"count": 1}], "none": [{"count": 2}]},
+                ASSIGNEE_ID,
+                "issue_count",
+                "count",
+                {ASSIGNEE_ID: []},
+            )
+        )
+        self.assertEqual(
+            rows,
+            [("Assignee Name", "Issue Count"), (user_id, 1), ("none", 2)],
+        )
+
+
+class AnalyticExportBenchmarkTest(SimpleTestCase):
+    """Segmented export of 5000 labels by 200 states"""
+
+    def test_large_segmented_export(self):
+        labels = build_labels(5000)
+        states = [
+            {"state_id": uuid.uuid4(), "state__name": f"State {index}"}
+            for index in range(200)
+        ]
+        distribution = {
+            label["labels__id"]: [
+                {"segment": state["state_id"], "count": index % 7}
+                for index, state in enumerate(states)
+            ]
+            for label in labels
+        }
+
+        start = time.monotonic()
+        csv_buffer = generate_csv_from_rows(
+            generate_segmented_rows(
+                distribution,
+                LABEL_ID,
+                "issue_count",
+                STATE_ID,
+                "count",
+                {LABEL_ID: labels, STATE_ID: states},
+            )
+        )
+        elapsed = time.monotonic() - start
+
+        rows = list(csv.reader(io.StringIO(csv_buffer.getvalue())))
+        self.assertEqual(len(rows), 5001)
+        self.assertEqual(len(rows[0]), 202)
+        self.assertEqual(rows[0][2], "State 0")
+        self.assertEqual(rows[5000][:3], ["Label 4999", "594", "0"])
+        self.assertLess(elapsed, 5)
@@ -0,0 +1,67 @@
+# Python imports
+import json
+from datetime import datetime, timezone
+from unittest import mock
+
+# Django imports
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.bgtasks.api_logs_task import flush_api_activity_logs
+from plane.db.models import APIActivityLog, User
+from plane.tests.fakes import FakeRedis
+from plane.utils.api_activity_log import API_ACTIVITY_LOG_KEY
+
+
+@override_settings(API_ACTIVITY_LOG_BATCH_SIZE=2)
+class FlushAPIActivityLogsTest(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch(
+            "plane.bgtasks.api_logs_task.redis_instance", return_value=self.redis
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = User.objects.create(email="user@plane.so", username="user")
+
+    def push(self, **record):
+        self.redis.rpush(
+            API_ACTIVITY_LOG_KEY,
+            json.dumps(
+                {
+                    "token_identifier": "key",
+                    "path": "/api/v1/users/me/",
+                    "method": "GET",
+                    "response_code": 200,
+                    **record,
+                }
+            ),
+        )
+
+    def test_logs_keep_the_request_time_and_user(self):
+        requested_at = datetime(2024, 1, 1, 10, 30, 15, 123456, tzinfo=timezone.utc)
+        for _ in range(3):
+            self.push(
+                created_at=requested_at.isoformat(), created_by_id=str(self.user.id)
+            )
+        # Records queued before the request time was captured
+        self.push()
+
+        with CaptureQueriesContext(connection) as queries:
+            flush_api_activity_logs()
+
+        # Each batch is written by a single insert
+        self.assertEqual(
+            [query["sql"].split()[0] for query in queries], ["INSERT", "INSERT"]
+        )
+        self.assertEqual(self.redis.data[API_ACTIVITY_LOG_KEY], [])
+        logs = APIActivityLog.objects.order_by("created_at")
+        self.assertEqual(len(logs), 4)
+        for log in logs[:3]:
+            self.assertEqual(log.created_at, requested_at)
+            self.assertEqual(log.updated_at, requested_at)
+            self.assertEqual(log.created_by, self.user)
+        self.assertGreater(logs[3].created_at, requested_at)
+        self.assertIsNone(logs[3].created_by)
@@ -0,0 +1,126 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.db.models import (
+    Issue,
+    IssueActivity,
+    IssueComment,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+
+
+@override_settings(SOFT_DELETE_BATCH_SIZE=1000)
+class SoftDeleteCascadeTest(TestCase):
+    def setUp(self):
+        patcher = mock.patch("plane.bgtasks.deletion_task.redis_instance")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.actor = User.objects.create(email="actor@plane.so", username="actor")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.actor
+        )
+
+    def create_project(self, identifier, issues):
+        """Synthetic project with sub issues, comments and activities per issue"""
+        project = Project.objects.create(
+            name=identifier, identifier=identifier, workspace=self.workspace
+        )
+        state = State.objects.create(
+            name="Todo", color="#000000", project=project, workspace=self.workspace
+        )
+        for _ in range(issues):
+            issue = Issue.objects.create(
+                name="Issue", project=project, workspace=self.workspace, state=state
+            )
+            Issue.objects.create(
+                name="Sub issue",
+                parent=issue,
+                project=project,
+                workspace=self.workspace,
+                state=state,
+            )
+            IssueComment.objects.bulk_create(
+                [
+                    IssueComment(
+                        issue=issue,
+                        actor=self.actor,
+                        project=project,
+                        workspace=self.workspace,
+                    )
+                    for _ in range(3)
+                ]
+            )
+            IssueActivity.objects.bulk_create(
+                [
+                    IssueActivity(
+                        issue=issue,
+                        actor=self.actor,
+                        project=project,
+                        workspace=self.workspace,
+                    )
+                    for _ in range(5)
+                ]
+            )
+        return project
+
+    def delete_project(self, project):
+        Project.objects.filter(pk=project.pk).update(deleted_at=timezone.now())
+        with CaptureQueriesContext(connection) as queries:
+            soft_delete_related_objects("db", "project", project.pk)
+        return len(queries)
+
+    def assert_deleted(self, project):
+        for model in [Issue, IssueComment, IssueActivity, State]:
+            self.assertFalse(
+                model.all_objects.filter(
+                    project=project, deleted_at__isnull=True
+                ).exists()
+            )
+        deleted_at = Project.all_objects.get(pk=project.pk).deleted_at
+        self.assertFalse(
+            Issue.all_objects.filter(project=project)
+            .exclude(deleted_at=deleted_at)
+            .exists()
+        )
+
+    def test_queries_do_not_grow_with_the_project(self):
+        small = self.create_project("SML", issues=2)
+        large = self.create_project("LRG", issues=50)
+
+        small_queries = self.delete_project(small)
+        large_queries = self.delete_project(large)
+
+        self.assert_deleted(small)
+        self.assert_deleted(large)
+        self.assertEqual(small_queries, large_queries)
+
+    def test_interrupted_cascade_resumes(self):
+        project = self.create_project("RSM", issues=3)
+        deleted_at = timezone.now()
+        # The first level went through before the worker stopped
+        Project.objects.filter(pk=project.pk).update(deleted_at=deleted_at)
+        Issue.all_objects.filter(project=project, parent__isnull=True).update(
+            deleted_at=deleted_at
+        )
+
+        soft_delete_related_objects("db", "project", project.pk)
+
+        self.assert_deleted(project)
+        self.assertEqual(
+            IssueComment.all_objects.filter(
+                project=project, deleted_at=deleted_at
+            ).count(),
+            9,
+        )
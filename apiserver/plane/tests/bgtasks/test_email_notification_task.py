@@ -0,0 +1,174 @@
+# Python imports
+import uuid
+from unittest import mock
+
+# Django imports
+from django.core.mail import EmailMessage
+from django.core.mail.backends.base import BaseEmailBackend
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.email_notification_task import (
+    get_email_notification_digests,
+    send_email_notification_batch,
+)
+
+TASK = "plane.bgtasks.email_notification_task"
+
+
+class CountingBackend(BaseEmailBackend):
+    """Email backend opening and closing its session like the SMTP one"""
+
+    def __init__(self, fail_on=None, **kwargs):
+        super().__init__(**kwargs)
+        self.session = None
+        self.opens = 0
+        self.sent = []
+        self.fail_on = fail_on
+
+    def open(self):
+        if self.session:
+            return False
+        self.session = object()
+        self.opens += 1
+        return True
+
+    def close(self):
+        self.session = None
+
+    def send_messages(self, email_messages):
+        new_session = self.open()
+        try:
+            for message in email_messages:
+                if message.to == [self.fail_on]:
+                    raise ConnectionError
+                self.sent.append(message.to)
+        finally:
+            if new_session:
+                self.close()
+        return len(email_messages)
+
+
+class EmailNotificationDigestTestCase(SimpleTestCase):
+    def notification(self, receiver_id, issue_id, actor_id, data):
+        return {
+            "id": uuid.uuid4(),
+            "receiver_id": receiver_id,
+            "triggered_by_id": actor_id,
+            "entity_identifier": issue_id,
+            "data": data,
+        }
+
+    def test_rows_are_grouped_per_receiver_and_issue(self):
+        receivers = [uuid.uuid4(), uuid.uuid4()]
+        issues = [uuid.uuid4(), uuid.uuid4()]
+        actors = [uuid.uuid4(), uuid.uuid4()]
+        rows = [
+            self.notification(receivers[0], issues[0], actors[0], {"n": 1}),
+            self.notification(receivers[1], issues[0], actors[0], {"n": 2}),
+            self.notification(receivers[0], issues[1], actors[1], {"n": 3}),
+            self.notification(receivers[0], issues[0], actors[1], {"n": 4}),
+            self.notification(receivers[0], issues[0], actors[0], {"n": 5}),
+        ]
+
+        digests = {
+            (digest["receiver_id"], digest["issue_id"]): digest
+            for digest in get_email_notification_digests(rows)
+        }
+
+        self.assertEqual(len(digests), 3)
+        digest = digests[(str(receivers[0]), str(issues[0]))]
+        self.assertEqual(
+            digest["notification_data"],
+            {
+                str(actors[0]): [{"n": 1}, {"n": 5}],
+                str(actors[1]): [{"n": 4}],
+            },
+        )
+        # Only the rows of the digest are marked as sent with its email
+        self.assertEqual(
+            digest["email_notification_ids"],
+            [str(rows[0]["id"]), str(rows[3]["id"]), str(rows[4]["id"])],
+        )
+        self.assertEqual(
+            digests[(str(receivers[1]), str(issues[0]))]["email_notification_ids"],
+            [str(rows[1]["id"])],
+        )
+
+    def test_no_rows(self):
+        self.assertEqual(get_email_notification_digests([]), [])
+
+
+class EmailNotificationBatchTestCase(SimpleTestCase):
+    def setUp(self):
+        self.issue_id = str(uuid.uuid4())
+        self.actor_id = str(uuid.uuid4())
+        self.receivers = [str(uuid.uuid4()) for _ in range(5)]
+        users = {
+            user_id: mock.Mock(email=f"{user_id}@plane.so")
+            for user_id in [self.actor_id, *self.receivers]
+        }
+
+        patches = {
+            "Issue": mock.Mock(),
+            "User": mock.Mock(),
+            "EmailNotificationLog": mock.Mock(),
+            "redis_instance": mock.Mock(),
+            "acquire_lock": mock.Mock(return_value=True),
+            "release_lock": mock.Mock(),
+            "get_email_configuration": mock.Mock(
+                return_value=("smtp", "", "", "587", "1", "0", "from@plane.so")
+            ),
+            "get_email_notification_message": mock.Mock(
+                side_effect=lambda receiver, connection, **kwargs: EmailMessage(
+                    to=[receiver.email], connection=connection
+                )
+            ),
+        }
+        patches["Issue"].objects.select_related.return_value.in_bulk.return_value = {
+            self.issue_id: mock.Mock()
+        }
+        patches["User"].objects.in_bulk.return_value = users
+        patches["redis_instance"].return_value.mget.return_value = [b"https://plane"]
+        self.logs = patches["EmailNotificationLog"].objects
+        for name, value in patches.items():
+            patcher = mock.patch(f"{TASK}.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def digests(self):
+        return [
+            {
+                "issue_id": self.issue_id,
+                "receiver_id": receiver_id,
+                "email_notification_ids": [str(index)],
+                "notification_data": {self.actor_id: [{}]},
+            }
+            for index, receiver_id in enumerate(self.receivers)
+        ]
+
+    def send(self, backend):
+        with mock.patch(f"{TASK}.get_connection", return_value=backend):
+            send_email_notification_batch(self.digests())
+
+    def test_batch_is_sent_over_one_connection(self):
+        backend = CountingBackend()
+        self.send(backend)
+
+        self.assertEqual(backend.opens, 1)
+        self.assertEqual(len(backend.sent), 5)
+        self.assertIsNone(backend.session)
+        self.assertEqual(
+            self.logs.filter.call_args.kwargs["pk__in"], ["0", "1", "2", "3", "4"]
+        )
+
+    def test_failed_email_reopens_the_connection(self):
+        backend = CountingBackend(fail_on=f"{self.receivers[1]}@plane.so")
+        with mock.patch(f"{TASK}.log_exception"):
+            self.send(backend)
+
+        self.assertEqual(backend.opens, 2)
+        self.assertEqual(len(backend.sent), 4)
+        self.assertEqual(
+            self.logs.filter.call_args.kwargs["pk__in"], ["0", "2", "3", "4"]
+        )
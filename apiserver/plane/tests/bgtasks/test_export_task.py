@@ -0,0 +1,280 @@
+# Python imports
+import csv
+import hashlib
+import io
+import json
+import tracemalloc
+import zipfile
+from datetime import date, datetime, timezone
+from unittest import mock
+
+# Third party imports
+from openpyxl import load_workbook
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.export_task import (
+    EXPORT_HEADER,
+    EXPORTER_MAPPER,
+    S3MultipartWriter,
+    assemble_export,
+    export_project_file,
+    get_export_progress,
+    issue_export_task,
+)
+from plane.bgtasks.issue_activities_task import issue_activity
+from plane.tests.fakes import FakeRedis
+
+
+class FakeS3Client:
+    """Multipart upload commands of the S3 client, parts are kept or counted"""
+
+    def __init__(self, keep=True):
+        self.keep = keep
+        self.parts = []
+        self.size = 0
+        self.completed = False
+        self.aborted = False
+
+    def create_multipart_upload(self, **kwargs):
+        return {"UploadId": "upload"}
+
+    def upload_part(self, Body, PartNumber, **kwargs):
+        self.size += len(Body)
+        if self.keep:
+            self.parts.append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, MultipartUpload, **kwargs):
+        self.completed = len(MultipartUpload["Parts"])
+
+    def abort_multipart_upload(self, **kwargs):
+        self.aborted = True
+
+
+class FakeBucket:
+    """S3 client keeping the objects of the completed multipart uploads"""
+
+    def __init__(self):
+        self.uploads = {}
+        self.objects = {}
+        self.aborted = []
+
+    def create_multipart_upload(self, Key, **kwargs):
+        self.uploads[Key] = []
+        return {"UploadId": Key}
+
+    def upload_part(self, Body, PartNumber, UploadId, **kwargs):
+        self.uploads[UploadId].append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Key, UploadId, **kwargs):
+        self.objects[Key] = b"".join(self.uploads.pop(UploadId))
+
+    def abort_multipart_upload(self, Key, UploadId, **kwargs):
+        self.uploads.pop(UploadId)
+        self.aborted.append(Key)
+
+    def get_object(self, Key, **kwargs):
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def delete_objects(self, Delete, **kwargs):
+        # Missing keys are ignored like S3 does
+        for entry in Delete["Objects"]:
+            self.objects.pop(entry["Key"], None)
+
+
+def build_issues(count):
+    for sequence_id in range(1, count + 1):
+        yield {
+            "project__identifier": "WEB",
+            "project__name": "Web",
+            "sequence_id": sequence_id,
+            "name": f"Issue {sequence_id}",
+            "description_stripped": hashlib.sha256(str(sequence_id).encode())
+            .hexdigest()
+            * 4,
+            "priority": "high",
+            "start_date": date(2024, 1, 1),
+            "target_date": None,
+            "state__name": "Todo",
+            "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            "completed_at": None,
+            "archived_at": None,
+            "created_by__first_name": "Jane",
+            "created_by__last_name": "Doe",
+            "assignee_names": ["Jane Doe", "John Roe"],
+            "label_names": ["bug"],
+            "cycle_name": "Cycle 1",
+            "cycle_start_date": date(2024, 1, 1),
+            "cycle_end_date": date(2024, 1, 14),
+            "module_name": None,
+            "module_start_date": None,
+            "module_target_date": None,
+        }
+
+
+def export(client, provider, count, part_size=1024):
+    upload = S3MultipartWriter(client, "export.zip", part_size=part_size)
+    with zipfile.ZipFile(upload, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        with zip_file.open(f"export.{provider}", "w", force_zip64=True) as stream:
+            EXPORTER_MAPPER[provider](stream, build_issues(count))
+    upload.close()
+
+
+class StreamingExportTest(SimpleTestCase):
+    def read_export(self, provider, count):
+        client = FakeS3Client()
+        export(client, provider, count)
+        self.assertGreater(client.completed, 1)
+        with zipfile.ZipFile(io.BytesIO(b"".join(client.parts))) as zip_file:
+            return zip_file.read(f"export.{provider}")
+
+    def test_csv_export(self):
+        rows = list(csv.reader(io.StringIO(self.read_export("csv", 50).decode())))
+        self.assertEqual(rows[0], EXPORT_HEADER)
+        self.assertEqual(len(rows), 51)
+        self.assertEqual(rows[1][:3], ["WEB-1", "Web", "Issue 1"])
+        self.assertEqual(rows[1][9:12], ["Jane Doe, John Roe", "bug", "Cycle 1"])
+
+    def test_json_export(self):
+        rows = json.loads(self.read_export("json", 50))
+        self.assertEqual(len(rows), 50)
+        self.assertEqual(rows[0]["ID"], "WEB-1")
+        self.assertEqual(rows[0]["Assignee"], "Jane Doe, John Roe")
+        self.assertEqual(rows[0]["Cycle End Date"], "Sun, 14 Jan 2024")
+
+    def test_xlsx_export(self):
+        workbook = load_workbook(io.BytesIO(self.read_export("xlsx", 50)))
+        rows = list(workbook.active.values)
+        self.assertEqual(list(rows[0]), EXPORT_HEADER)
+        self.assertEqual(len(rows), 51)
+        self.assertEqual(rows[50][0], "WEB-50")
+
+    def test_failed_export_aborts_the_upload(self):
+        client = FakeS3Client()
+        upload = S3MultipartWriter(client, "export.zip")
+        upload.abort()
+        self.assertTrue(client.aborted)
+        self.assertFalse(client.completed)
+
+    def test_peak_memory_does_not_grow_with_the_issue_count(self):
+        peaks = []
+        for count in [5000, 20000]:
+            client = FakeS3Client(keep=False)
+            tracemalloc.start()
+            export(client, "csv", count, part_size=64 * 1024)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        # Four times the issues and parts, about the same peak
+        self.assertGreater(client.completed, 10)
+        self.assertLess(peaks[1], peaks[0] * 1.5)
+
+
+class ProjectExportTest(SimpleTestCase):
+    def setUp(self):
+        self.bucket = FakeBucket()
+        self.redis = FakeRedis()
+        for name, value in [
+            ("get_s3_client", self.bucket),
+            ("redis_instance", self.redis),
+        ]:
+            patcher = mock.patch(
+                f"plane.bgtasks.export_task.{name}", return_value=value
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def export_project(self, project_id, get_export_issues):
+        with mock.patch(
+            "plane.bgtasks.export_task.get_export_issues", get_export_issues
+        ), mock.patch("plane.bgtasks.export_task.fail_export") as fail_export:
+            result = export_project_file.apply(
+                args=["csv", "workspace", project_id, "token", "member"]
+            )
+        return result, fail_export
+
+    def test_failed_project_is_retried_on_its_own(self):
+        attempts = []
+
+        def get_export_issues(workspace_id, project_ids, member_id):
+            attempts.append(project_ids)
+            if len(attempts) == 1:
+                raise ConnectionError
+            issues = mock.Mock()
+            issues.iterator.return_value = build_issues(10)
+            return issues
+
+        result, fail_export = self.export_project("web", get_export_issues)
+
+        part_name = "workspace/export-parts/token/web.csv"
+        self.assertEqual(result.get(), part_name)
+        self.assertEqual(attempts, [["web"], ["web"]])
+        self.assertEqual(self.bucket.aborted, [part_name])
+        self.assertEqual(len(self.bucket.objects[part_name].splitlines()), 11)
+        self.assertEqual(get_export_progress("token"), {"web": "completed"})
+        fail_export.assert_not_called()
+
+    def test_export_fails_once_the_retries_are_exhausted(self):
+        result, fail_export = self.export_project(
+            "web", mock.Mock(side_effect=ConnectionError)
+        )
+
+        self.assertTrue(result.failed())
+        self.assertEqual(len(self.bucket.aborted), 4)
+        self.assertEqual(get_export_progress("token"), {"web": "failed"})
+        fail_export.assert_called_once()
+
+    def test_final_failure_removes_the_files_of_the_other_projects(self):
+        self.redis.hset(
+            "export:token", mapping={"web": "completed", "api": "processing"}
+        )
+        self.bucket.objects["workspace/export-parts/token/web.csv"] = b"web"
+        self.bucket.objects["workspace/other.zip"] = b"other"
+
+        result, _ = self.export_project(
+            "api", mock.Mock(side_effect=ConnectionError)
+        )
+
+        self.assertTrue(result.failed())
+        self.assertEqual(list(self.bucket.objects), ["workspace/other.zip"])
+
+    def test_project_finishing_after_a_final_failure_removes_its_file(self):
+        self.redis.hset("export:token", mapping={"api": "failed"})
+        issues = mock.Mock()
+        issues.iterator.return_value = build_issues(10)
+
+        result, _ = self.export_project("web", mock.Mock(return_value=issues))
+
+        self.assertTrue(result.successful())
+        self.assertEqual(self.bucket.objects, {})
+        self.assertEqual(
+            get_export_progress("token"), {"api": "failed", "web": "cancelled"}
+        )
+
+    def test_only_the_chord_header_stores_its_result(self):
+        self.assertFalse(export_project_file.ignore_result)
+        self.assertTrue(assemble_export.ignore_result)
+        self.assertTrue(issue_export_task.ignore_result)
+        self.assertTrue(issue_activity.ignore_result)
+
+    def test_project_files_are_zipped_and_removed(self):
+        part_names = []
+        for project_id in ["web", "api"]:
+            part_name = f"workspace/export-parts/token/{project_id}.csv"
+            self.bucket.objects[part_name] = project_id.encode() * 1000
+            part_names.append(part_name)
+
+        with mock.patch(
+            "plane.bgtasks.export_task.complete_export"
+        ) as complete_export:
+            assemble_export(part_names, "workspace", "token", "plane")
+
+        file_name = complete_export.call_args.args[0]
+        self.assertEqual(list(self.bucket.objects), [file_name])
+        with zipfile.ZipFile(io.BytesIO(self.bucket.objects[file_name])) as zip_file:
+            self.assertEqual(zip_file.namelist(), ["web.csv", "api.csv"])
+            self.assertEqual(zip_file.read("api.csv"), b"api" * 1000)
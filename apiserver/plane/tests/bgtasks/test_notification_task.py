@@ -0,0 +1,104 @@
+# Python imports
+import json
+import uuid
+
+# Django imports
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.bgtasks.notification_task import notifications
+from plane.db.models import (
+    Issue,
+    IssueSubscriber,
+    Notification,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+)
+
+
+class NotificationFanOutTest(TestCase):
+    def setUp(self):
+        self.actor = User.objects.create(email="actor@plane.so", username="actor")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.actor
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        self.state = State.objects.create(
+            name="Done",
+            color="#000000",
+            group="completed",
+            project=self.project,
+            workspace=self.workspace,
+        )
+        ProjectMember.objects.create(
+            project=self.project, workspace=self.workspace, member=self.actor, role=20
+        )
+
+    def create_issue(self, subscribers):
+        issue = Issue.objects.create(
+            name="Issue",
+            project=self.project,
+            workspace=self.workspace,
+            state=self.state,
+        )
+        for _ in range(subscribers):
+            user = User.objects.create(
+                email=f"{uuid.uuid4().hex}@plane.so", username=uuid.uuid4().hex
+            )
+            ProjectMember.objects.create(
+                project=self.project, workspace=self.workspace, member=user, role=15
+            )
+            IssueSubscriber.objects.create(
+                issue=issue,
+                subscriber=user,
+                project=self.project,
+                workspace=self.workspace,
+            )
+        return issue
+
+    def notify(self, issue):
+        activities = [
+            {
+                "id": str(uuid.uuid4()),
+                "verb": "updated",
+                "field": field,
+                "comment": f"updated the {field}",
+                "actor_id": str(self.actor.id),
+                "issue_detail": {"id": str(issue.id)},
+                "issue_comment": None,
+                "old_value": "old",
+                "new_value": "new",
+                "old_identifier": None,
+                "new_identifier": str(self.state.id) if field == "state" else None,
+            }
+            for field in ["state", "priority", "name"]
+        ]
+        with CaptureQueriesContext(connection) as context:
+            notifications(
+                type="issue.activity.updated",
+                issue_id=str(issue.id),
+                project_id=str(self.project.id),
+                actor_id=str(self.actor.id),
+                subscriber=False,
+                issue_activities_created=json.dumps(activities),
+                requested_data=json.dumps({"description_html": "<p></p>"}),
+                current_instance=json.dumps({"description_html": "<p></p>"}),
+            )
+        return len(context.captured_queries)
+
+    def test_queries_do_not_grow_with_subscribers(self):
+        few = self.notify(self.create_issue(subscribers=2))
+        many = self.notify(self.create_issue(subscribers=20))
+
+        self.assertEqual(few, many)
+        self.assertEqual(
+            Notification.objects.filter(entity_identifier__isnull=False).count(),
+            (2 + 20) * 3,
+        )
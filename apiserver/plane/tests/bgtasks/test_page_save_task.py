@@ -0,0 +1,71 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.bgtasks.page_save_task import flush_page_save, schedule_page_save
+from plane.bgtasks.page_transaction_task import extract_components
+from plane.tests.fakes import FakeRedis
+
+
+@override_settings(PAGE_SAVE_WINDOW=10)
+class PageSaveWindowTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patchers = {
+            "redis_instance": mock.patch(
+                "plane.bgtasks.page_save_task.redis_instance", return_value=self.redis
+            ),
+            "apply_async": mock.patch(
+                "plane.bgtasks.page_save_task.flush_page_save.apply_async"
+            ),
+            "process": mock.patch("plane.bgtasks.page_save_task.process_page_save"),
+        }
+        for name, patcher in patchers.items():
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_burst_of_saves_is_processed_once_against_the_first_description(self):
+        schedule_page_save("page", "<p>first</p>", "user-1")
+        schedule_page_save("page", "<p>second</p>", "user-1")
+        schedule_page_save("page", "<p>third</p>", "user-2")
+
+        self.apply_async.assert_called_once_with(
+            kwargs={"page_id": "page"}, countdown=10
+        )
+
+        flush_page_save("page")
+        self.process.assert_called_once_with(
+            page_id="page", existing_html="<p>first</p>", user_id="user-2"
+        )
+
+        # The next save opens a new window
+        self.assertEqual(self.redis.data, {})
+        schedule_page_save("page", "<p>fourth</p>", "user-1")
+        self.assertEqual(self.apply_async.call_count, 2)
+
+    def test_flush_without_pending_save_does_nothing(self):
+        flush_page_save("page")
+        self.process.assert_not_called()
+
+
+class ExtractComponentsTest(SimpleTestCase):
+    def test_mentions_are_extracted(self):
+        html = (
+            '<p>Hi <mention-component id="1" entity_identifier="u1" '
+            'entity_name="mention"></mention-component> and '
+            '<mention-component id="2" entity_identifier="u2" '
+            'entity_name="mention"/></p>'
+        )
+        self.assertEqual(
+            extract_components(html),
+            {
+                "mention-component": [
+                    {"id": "1", "entity_identifier": "u1", "entity_name": "mention"},
+                    {"id": "2", "entity_identifier": "u2", "entity_name": "mention"},
+                ]
+            },
+        )
+        self.assertEqual(extract_components(None), {"mention-component": []})
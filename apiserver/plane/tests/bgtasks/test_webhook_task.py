@@ -0,0 +1,233 @@
+# Python imports
+import json
+from unittest import mock
+
+# Django imports
+from django.test import TestCase, override_settings
+
+# Module imports
+from plane.bgtasks.webhook_task import (
+    dispatch_webhook_activity,
+    flush_webhook_batch,
+    webhook_batch_key,
+    webhook_retry_countdown,
+    webhook_task,
+)
+from plane.db.models import (
+    Issue,
+    Project,
+    State,
+    User,
+    Webhook,
+    WebhookLog,
+    Workspace,
+)
+from plane.tests.fakes import FakeRedis
+
+TASK = "plane.bgtasks.webhook_task"
+
+
+class WebhookTaskTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        self.redis = FakeRedis()
+        self.webhook_ids = ["webhook-1", "webhook-2"]
+        patchers = {
+            "redis_instance": mock.patch(
+                f"{TASK}.redis_instance", return_value=self.redis
+            ),
+            "get_event_webhook_ids": mock.patch(
+                f"{TASK}.get_event_webhook_ids",
+                side_effect=lambda slug, event: self.webhook_ids,
+            ),
+            "webhook_activity": mock.patch(f"{TASK}.webhook_activity"),
+            "flush": mock.patch(f"{TASK}.flush_webhook_batch.apply_async"),
+            "delivery": mock.patch(f"{TASK}.webhook_delivery_task.delay"),
+            "retry": mock.patch(f"{TASK}.webhook_delivery_task.apply_async"),
+        }
+        for name, patcher in patchers.items():
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def create_issues(self, count):
+        state = State.objects.create(
+            name="Todo", project=self.project, workspace=self.workspace
+        )
+        return Issue.objects.bulk_create(
+            Issue(
+                name=f"Issue {index}",
+                sequence_id=index + 1,
+                state=state,
+                project=self.project,
+                workspace=self.workspace,
+            )
+            for index in range(count)
+        )
+
+    def dispatch(self, issue, field="name"):
+        dispatch_webhook_activity(
+            event="issue",
+            verb="updated",
+            field=field,
+            old_value="old",
+            new_value="new",
+            actor_id=str(self.user.id),
+            slug="plane",
+            current_site="https://plane.so",
+            event_id=str(issue.id),
+            old_identifier=None,
+            new_identifier=None,
+        )
+
+
+class WebhookBatchWindowTest(WebhookTaskTestCase):
+    @override_settings(WEBHOOK_BATCH_WINDOW=0)
+    def test_activities_are_sent_one_by_one_without_a_window(self):
+        (issue,) = self.create_issues(1)
+        self.dispatch(issue)
+
+        self.webhook_activity.delay.assert_called_once()
+        self.flush.assert_not_called()
+        self.assertEqual(self.redis.data, {})
+
+    @override_settings(WEBHOOK_BATCH_WINDOW=10)
+    def test_first_activity_of_the_window_schedules_the_flush(self):
+        (issue,) = self.create_issues(1)
+        for field in ("name", "priority", "state"):
+            self.dispatch(issue, field=field)
+
+        key = webhook_batch_key("plane", "issue")
+        self.assertEqual(
+            [json.loads(activity)["field"] for activity in self.redis.data[key]],
+            ["name", "priority", "state"],
+        )
+        self.flush.assert_called_once_with(
+            kwargs={"slug": "plane", "event": "issue"}, countdown=10
+        )
+        self.webhook_activity.delay.assert_not_called()
+
+    @override_settings(WEBHOOK_BATCH_WINDOW=10)
+    def test_unsubscribed_events_are_dropped(self):
+        self.webhook_ids = []
+        (issue,) = self.create_issues(1)
+        self.dispatch(issue)
+
+        self.assertEqual(self.redis.data, {})
+        self.flush.assert_not_called()
+
+
+@override_settings(WEBHOOK_BATCH_WINDOW=10, WEBHOOK_BATCH_SIZE=2)
+class FlushWebhookBatchTest(WebhookTaskTestCase):
+    def test_flush_sends_the_window_in_batches_to_every_webhook(self):
+        issues = self.create_issues(3)
+        for issue in issues:
+            self.dispatch(issue)
+
+        flush_webhook_batch("plane", "issue")
+
+        # The window is open again
+        key = webhook_batch_key("plane", "issue")
+        self.assertNotIn(key, self.redis.data)
+        self.assertNotIn(f"{key}:scheduled", self.redis.data)
+
+        kwargs = self.delivery.call_args.kwargs
+        self.assertEqual(kwargs["current_site"], "https://plane.so")
+        deliveries = kwargs["deliveries"]
+        self.assertEqual(
+            [
+                (delivery["webhook"], delivery["headers"]["X-Plane-Batch"])
+                for delivery in deliveries
+            ],
+            [
+                ("webhook-1", "2"),
+                ("webhook-1", "1"),
+                ("webhook-2", "2"),
+                ("webhook-2", "1"),
+            ],
+        )
+        activities = [
+            activity
+            for delivery in deliveries[:2]
+            for activity in delivery["payload"]["data"]
+        ]
+        self.assertEqual(
+            [activity["data"]["id"] for activity in activities],
+            [str(issue.id) for issue in issues],
+        )
+        self.assertEqual(activities[0]["activity"]["actor"]["id"], str(self.user.id))
+        self.assertEqual(activities[0]["action"], "updated")
+
+    def test_flush_of_an_empty_window_sends_nothing(self):
+        flush_webhook_batch("plane", "issue")
+        self.delivery.assert_not_called()
+
+    def test_deleted_entities_are_skipped(self):
+        issues = self.create_issues(2)
+        for issue in issues:
+            self.dispatch(issue)
+        Issue.all_objects.filter(pk=issues[0].pk).delete()
+
+        flush_webhook_batch("plane", "issue")
+
+        deliveries = self.delivery.call_args.kwargs["deliveries"]
+        self.assertEqual(
+            [activity["data"]["id"] for activity in deliveries[0]["payload"]["data"]],
+            [str(issues[1].id)],
+        )
+
+
+class WebhookSendTaskTest(WebhookTaskTestCase):
+    def setUp(self):
+        super().setUp()
+        self.webhook = Webhook.objects.create(
+            workspace=self.workspace, url="https://example.com/webhook", issue=True
+        )
+
+    def send(self, results):
+        with mock.patch(f"{TASK}.deliver", return_value=results) as deliver:
+            webhook_task(
+                webhook=str(self.webhook.id),
+                slug="plane",
+                event="issue",
+                event_data={"id": "issue-1"},
+                action="PATCH",
+                current_site="https://plane.so",
+            )
+        return deliver
+
+    def test_event_is_signed_and_sent_through_the_pooled_delivery(self):
+        deliver = self.send(
+            [{"status": 200, "headers": {}, "body": "ok", "error": None}]
+        )
+
+        (request,) = deliver.call_args.args[0]
+        self.assertEqual(request["url"], "https://example.com/webhook")
+        self.assertIn("X-Plane-Signature", request["headers"])
+        body = json.loads(request["body"])
+        self.assertEqual(body["action"], "update")
+        self.assertEqual(body["data"], {"id": "issue-1"})
+        self.assertEqual(WebhookLog.objects.get().response_status, "200")
+        self.retry.assert_not_called()
+
+    def test_failed_event_is_retried_with_the_delivery_policy(self):
+        self.send(
+            [{"status": None, "headers": None, "body": None, "error": "timeout"}]
+        )
+
+        (delivery,) = self.retry.call_args.kwargs["kwargs"]["deliveries"]
+        self.assertEqual(delivery["retry_count"], 1)
+        self.assertTrue(600 <= self.retry.call_args.kwargs["countdown"] <= 1200)
+        self.assertEqual(WebhookLog.objects.get().response_status, "500")
+
+    def test_retry_delay_doubles_on_every_retry(self):
+        with mock.patch(f"{TASK}.random.randint", return_value=0):
+            self.assertEqual(
+                [webhook_retry_countdown(retries) for retries in range(5)],
+                [600, 1200, 2400, 4800, 9600],
+            )
@@ -0,0 +1,140 @@
+# Python imports
+import json
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks.issue_description_version_task import (
+    issue_description_version_task,
+)
+from plane.db.models import (
+    Issue,
+    IssueDescriptionVersion,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+from plane.utils import description_version
+from plane.utils.description_version import (
+    add_version,
+    get_version_content,
+    update_latest_version,
+)
+
+
+def build_values(paragraphs):
+    html = "".join(f"<p>Paragraph {index} of the issue</p>" for index in paragraphs)
+    return {
+        "description_html": html,
+        "description_binary": html.encode(),
+        "description_json": {"type": "doc", "paragraphs": len(paragraphs)},
+        "description_stripped": html.replace("<p>", "").replace("</p>", " "),
+    }
+
+
+class DescriptionVersionTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        state = State.objects.create(
+            name="Todo", project=self.project, workspace=self.workspace
+        )
+        self.issue = Issue.objects.create(
+            name="Issue", project=self.project, state=state
+        )
+
+    def add_version(self, values, **fields):
+        return add_version(
+            IssueDescriptionVersion,
+            "issue_id",
+            self.issue.id,
+            values=values,
+            workspace_id=self.workspace.id,
+            project_id=self.project.id,
+            owned_by_id=self.user.id,
+            **fields,
+        )
+
+    def content(self, version):
+        version.refresh_from_db()
+        return get_version_content(version, "issue_id")
+
+
+class AddVersionTest(DescriptionVersionTestCase):
+    def test_writers_do_not_lock_the_parent_row(self):
+        first = self.add_version(build_values(range(40)))
+        with CaptureQueriesContext(connection) as queries:
+            self.add_version(build_values(range(1, 41)))
+
+        statements = [query["sql"] for query in queries]
+        self.assertFalse(any("FOR UPDATE" in sql for sql in statements))
+        self.assertTrue(any("pg_advisory_xact_lock" in sql for sql in statements))
+
+        first.refresh_from_db()
+        self.assertIsNotNone(first.description_delta)
+        self.assertEqual(self.content(first), build_values(range(40)))
+
+    def test_delta_is_dropped_when_the_newer_version_is_rewritten(self):
+        first = self.add_version(build_values(range(40)))
+        compute_delta = description_version.compute_delta
+
+        def rewrite_while_computing(source, target):
+            # Another writer saves the latest version meanwhile
+            latest = IssueDescriptionVersion.objects.order_by("-created_at").first()
+            update_latest_version(latest, build_values(range(2, 42)), "issue_id")
+            return compute_delta(source, target)
+
+        with mock.patch.object(
+            description_version, "compute_delta", rewrite_while_computing
+        ):
+            second = self.add_version(build_values(range(1, 41)))
+
+        first.refresh_from_db()
+        self.assertIsNone(first.description_delta)
+        self.assertEqual(self.content(first), build_values(range(40)))
+        self.assertEqual(self.content(second), build_values(range(2, 42)))
+
+    def test_delta_rows_are_not_overwritten(self):
+        first = self.add_version(build_values(range(40)))
+        self.add_version(build_values(range(1, 41)))
+        first.refresh_from_db()
+
+        with self.assertRaises(ValueError):
+            update_latest_version(first, build_values(range(5)), "issue_id")
+        self.assertEqual(self.content(first), build_values(range(40)))
+
+
+class IssueDescriptionVersionTaskTest(DescriptionVersionTestCase):
+    def test_the_latest_created_version_is_updated(self):
+        first = self.add_version(
+            build_values(range(40)), last_saved_at=timezone.now() + timedelta(1)
+        )
+        second = self.add_version(build_values(range(1, 41)))
+        first.refresh_from_db()
+        self.assertIsNotNone(first.description_delta)
+
+        self.issue.description_html = "<p>Rewritten</p>"
+        self.issue.save()
+        issue_description_version_task(
+            json.dumps({"description_html": "<p>Old</p>"}),
+            self.issue.id,
+            self.user.id,
+        )
+
+        self.assertEqual(IssueDescriptionVersion.objects.count(), 2)
+        self.assertEqual(
+            self.content(second)["description_html"], "<p>Rewritten</p>"
+        )
+        self.assertEqual(self.content(first), build_values(range(40)))
@@ -0,0 +1,196 @@
+# Python imports
+import importlib
+
+# Django imports
+from django.db import connection, migrations
+from django.test import TestCase
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    IssueSequence,
+    IssueSequenceCounter,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+from plane.db.models.issue import (
+    reserve_issue_numbers,
+    reserve_issue_sequences,
+    reserve_sort_orders,
+)
+
+
+class IssueSequenceTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = self.create_project("WEB")
+        self.todo = self.create_state(self.project, "Todo")
+
+    def create_project(self, identifier):
+        return Project.objects.create(
+            name=identifier, identifier=identifier, workspace=self.workspace
+        )
+
+    def create_state(self, project, name):
+        return State.objects.create(
+            name=name, project=project, workspace=self.workspace
+        )
+
+    def create_existing_issues(self, project, state, count, sort_order=65535):
+        """Issues created before the counters, with their sequence rows only"""
+        issues = Issue.objects.bulk_create(
+            Issue(
+                name=f"Issue {index}",
+                sequence_id=index + 1,
+                sort_order=sort_order + 10000 * index,
+                state=state,
+                project=project,
+                workspace=self.workspace,
+            )
+            for index in range(count)
+        )
+        IssueSequence.objects.bulk_create(
+            IssueSequence(
+                issue=issue,
+                sequence=issue.sequence_id,
+                project=project,
+                workspace=self.workspace,
+            )
+            for issue in issues
+        )
+        return issues
+
+
+class ReserveIssueSequencesTest(IssueSequenceTestCase):
+    def test_first_use_continues_after_the_existing_issues(self):
+        self.create_existing_issues(self.project, self.todo, 5)
+        self.assertFalse(IssueSequenceCounter.objects.exists())
+
+        self.assertEqual(list(reserve_issue_sequences(self.project.id)), [6])
+        self.assertEqual(
+            IssueSequenceCounter.objects.get(project=self.project).last_sequence, 6
+        )
+
+    def test_first_use_of_an_empty_project_starts_at_one(self):
+        self.assertEqual(list(reserve_issue_sequences(self.project.id, 3)), [1, 2, 3])
+
+    def test_bulk_reservation_is_one_consecutive_range(self):
+        self.create_existing_issues(self.project, self.todo, 2)
+
+        # Creating the counter and reserving are a single statement
+        with self.assertNumQueries(1):
+            sequences = reserve_issue_sequences(self.project.id, 100)
+        self.assertEqual(list(sequences), list(range(3, 103)))
+        with self.assertNumQueries(1):
+            self.assertEqual(list(reserve_issue_sequences(self.project.id)), [103])
+
+    def test_sequences_written_without_the_counter_are_skipped(self):
+        self.assertEqual(list(reserve_issue_sequences(self.project.id, 2)), [1, 2])
+        # The previous code takes the largest sequence during a rolling deploy
+        IssueSequence.objects.create(
+            sequence=3, project=self.project, workspace=self.workspace
+        )
+
+        self.assertEqual(list(reserve_issue_sequences(self.project.id, 2)), [4, 5])
+        self.assertEqual(list(reserve_issue_sequences(self.project.id)), [6])
+
+    def test_consecutive_reservations_do_not_overlap(self):
+        other = self.create_project("API")
+        reserved = {self.project.id: [], other.id: []}
+        for count in (1, 4, 1, 10, 2):
+            for project_id in reserved:
+                reserved[project_id].extend(reserve_issue_sequences(project_id, count))
+
+        for sequences in reserved.values():
+            self.assertEqual(sequences, list(range(1, 19)))
+
+    def test_saved_issues_take_the_next_sequence(self):
+        self.create_existing_issues(self.project, self.todo, 3)
+
+        issues = [
+            Issue.objects.create(name=name, project=self.project, state=self.todo)
+            for name in ("First", "Second")
+        ]
+
+        self.assertEqual([issue.sequence_id for issue in issues], [4, 5])
+        self.assertEqual(
+            list(
+                IssueSequence.objects.filter(project=self.project)
+                .order_by("sequence")
+                .values_list("sequence", flat=True)
+            ),
+            [1, 2, 3, 4, 5],
+        )
+
+
+class ReserveIssueNumbersTest(IssueSequenceTestCase):
+    def test_sort_orders_follow_the_last_issue_of_the_state(self):
+        self.assertIsNone(reserve_sort_orders(self.project.id, self.todo.id))
+
+        self.create_existing_issues(self.project, self.todo, 2, sort_order=1000)
+        self.assertEqual(
+            reserve_sort_orders(self.project.id, self.todo.id, 2), [21000, 31000]
+        )
+
+    def test_bulk_issues_are_numbered_per_project_and_state(self):
+        done = self.create_state(self.project, "Done")
+        other = self.create_project("API")
+        other_state = self.create_state(other, "Todo")
+        self.create_existing_issues(self.project, self.todo, 2, sort_order=1000)
+
+        issues = reserve_issue_numbers(
+            [
+                Issue(name=name, project=project, state=state)
+                for name, project, state in [
+                    ("A", self.project, self.todo),
+                    ("B", self.project, done),
+                    ("C", other, other_state),
+                    ("D", self.project, self.todo),
+                    ("E", self.project, done),
+                ]
+            ]
+        )
+
+        self.assertEqual(
+            [(issue.name, issue.sequence_id, issue.sort_order) for issue in issues],
+            [
+                ("A", 3, 21000),
+                ("B", 4, 65535),
+                ("C", 1, 65535),
+                ("D", 5, 31000),
+                ("E", 6, 75535),
+            ],
+        )
+        self.assertEqual(list(reserve_issue_sequences(self.project.id)), [7])
+
+
+class SequenceCounterBackfillTest(IssueSequenceTestCase):
+    def test_migration_starts_the_counters_at_the_last_sequence(self):
+        other = self.create_project("API")
+        self.create_existing_issues(self.project, self.todo, 4)
+        self.create_existing_issues(other, self.create_state(other, "Todo"), 2)
+        empty = self.create_project("DOC")
+
+        migration = importlib.import_module(
+            "plane.db.migrations.0088_issuesequencecounter_issue_sort_idx"
+        ).Migration
+        (backfill,) = [
+            operation
+            for operation in migration.operations
+            if isinstance(operation, migrations.RunSQL)
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(backfill.sql)
+
+        self.assertEqual(
+            dict(IssueSequenceCounter.objects.values_list("project", "last_sequence")),
+            {self.project.id: 4, other.id: 2},
+        )
+        # Projects without issues get their counter on first use
+        self.assertEqual(list(reserve_issue_sequences(empty.id)), [1])
+        self.assertEqual(list(reserve_issue_sequences(self.project.id)), [5])
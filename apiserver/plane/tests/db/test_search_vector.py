@@ -0,0 +1,46 @@
+# Django imports
+from django.db import connection
+from django.test import TestCase
+
+# Module imports
+from plane.db.models import Issue, Project, State, User, Workspace
+from plane.utils.issue_search import search_issues
+from plane.utils.search import backfill_search_vectors
+
+
+class SearchVectorTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        state = State.objects.create(
+            name="Todo", project=self.project, workspace=self.workspace
+        )
+        self.issues = [
+            Issue.objects.create(name=name, project=self.project, state=state)
+            for name in ("Login fails", "Signup page", "Logout button")
+        ]
+
+    def search(self, query, slug="plane"):
+        return list(
+            search_issues(query, Issue.issue_objects.all(), slug).values_list(
+                "name", flat=True
+            )
+        )
+
+    def test_rows_created_before_the_trigger_are_filled(self):
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE issues SET search_vector = NULL")
+        self.assertEqual(self.search("log"), [])
+
+        self.assertEqual(backfill_search_vectors("issues", batch_size=2), 3)
+        self.assertEqual(backfill_search_vectors("issues"), 0)
+        self.assertEqual(sorted(self.search("log")), ["Login fails", "Logout button"])
+
+    def test_project_identifiers_are_matched_within_the_workspace(self):
+        self.assertEqual(len(self.search("WEB")), 3)
+        self.assertEqual(self.search("WEB", slug="other"), [])
@@ -0,0 +1,139 @@
+# Python imports
+import functools
+import json
+
+
+def command(method):
+    """Record the name of the redis command on every call"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.commands.append(method.__name__.upper())
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class FakeRedis:
+    """
+    In memory redis with the commands used by the tasks and the cache
+    Hash fields and values are returned as bytes like the redis client does,
+    keyspace scans are rejected
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.commands = []
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    @command
+    def set(self, name, value, nx=False, ex=None):
+        if nx and name in self.data:
+            return None
+        self.data[name] = value
+        return True
+
+    @command
+    def delete(self, *names):
+        for name in names:
+            self.data.pop(name, None)
+
+    @command
+    def expire(self, name, time):
+        pass
+
+    @command
+    def incr(self, name):
+        return self.incrby(name, 1)
+
+    @command
+    def incrby(self, name, amount):
+        self.data[name] = self.data.get(name, 0) + amount
+        return self.data[name]
+
+    @command
+    def hset(self, name, key=None, value=None, mapping=None):
+        mapping = dict(mapping or {})
+        if key is not None:
+            mapping[key] = value
+        self.data.setdefault(name, {}).update(
+            {str(key).encode(): str(value).encode() for key, value in mapping.items()}
+        )
+
+    @command
+    def hsetnx(self, name, key, value):
+        values = self.data.setdefault(name, {})
+        if key.encode() in values:
+            return 0
+        values[key.encode()] = str(value).encode()
+        return 1
+
+    @command
+    def hgetall(self, name):
+        return dict(self.data.get(name, {}))
+
+    @command
+    def zadd(self, name, mapping):
+        self.data.setdefault(name, {}).update(mapping)
+
+    @command
+    def zremrangebyscore(self, name, min, max):
+        # Only the open lower bound used to prune expired members is supported
+        members = self.data.get(name, {})
+        for member, score in list(members.items()):
+            if score <= float(max):
+                del members[member]
+
+    @command
+    def zrange(self, name, start, end):
+        members = sorted(self.data.get(name, {}), key=self.data.get(name, {}).get)
+        return members[start:] if end == -1 else members[start : end + 1]
+
+    @command
+    def rpush(self, name, *values):
+        self.data.setdefault(name, []).extend(values)
+        return len(self.data[name])
+
+    @command
+    def lrange(self, name, start, end):
+        values = self.data.get(name, [])
+        return values[start:] if end == -1 else values[start : end + 1]
+
+    @command
+    def ltrim(self, name, start, end):
+        self.data[name] = self.lrange(name, start, end)
+
+    @command
+    def publish(self, channel, message):
+        self.published.append(json.loads(message))
+
+    def keys(self, *args, **kwargs):
+        raise AssertionError("KEYS must not be issued")
+
+    def scan(self, *args, **kwargs):
+        raise AssertionError("SCAN must not be issued")
+
+    scan_iter = scan
+
+
+class FakePipeline:
+    """Queue the commands and run them on the fake redis on execute"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.calls.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
@@ -0,0 +1,93 @@
+# Python imports
+import json
+import time
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Module imports
+from plane.middleware.api_log_middleware import APITokenLogMiddleware
+from plane.tests.fakes import FakeRedis
+from plane.utils.api_activity_log import (
+    API_ACTIVITY_LOG_DROPPED_KEY,
+    API_ACTIVITY_LOG_KEY,
+    APIActivityLogBuffer,
+    truncate_body,
+)
+
+
+@override_settings(
+    API_ACTIVITY_LOG_BODY_LIMIT=8,
+    API_ACTIVITY_LOG_MAX_PENDING=3,
+    API_ACTIVITY_LOG_BATCH_SIZE=100,
+)
+class APIActivityLogBufferTestCase(SimpleTestCase):
+    def test_truncates_bodies(self):
+        self.assertEqual(truncate_body(b'{"name": "issue"}'), '{"name":')
+        self.assertEqual(truncate_body("short"), "short")
+        self.assertIsNone(truncate_body(b""))
+
+    def test_drops_records_when_full(self):
+        buffer = APIActivityLogBuffer(max_size=2)
+        with mock.patch.object(buffer, "ensure_worker"):
+            results = [buffer.push({"path": str(index)}) for index in range(3)]
+        self.assertEqual(results, [True, True, False])
+
+        # The redis list is capped and the overflow is counted as dropped
+        ri = FakeRedis()
+        buffer.write(ri, [{"path": str(index)} for index in range(5)])
+        self.assertEqual(
+            [json.loads(record)["path"] for record in ri.data[API_ACTIVITY_LOG_KEY]],
+            ["0", "1", "2"],
+        )
+        self.assertEqual(ri.data[API_ACTIVITY_LOG_DROPPED_KEY], 3)
+
+    @override_settings(API_ACTIVITY_LOG_SAMPLE_RATE=0)
+    def test_middleware_samples_successful_requests(self):
+        factory = RequestFactory()
+        pushed = []
+
+        for status in (200, 500):
+            middleware = APITokenLogMiddleware(
+                lambda request: HttpResponse(status=status)
+            )
+            request = factory.post(
+                "/api/v1/workspaces/", data={}, HTTP_X_API_KEY="plane_api_key"
+            )
+            with mock.patch(
+                "plane.middleware.api_log_middleware.api_activity_log_buffer.push",
+                side_effect=pushed.append,
+            ):
+                middleware(request)
+
+        self.assertEqual([record["response_code"] for record in pushed], [500])
+
+    @override_settings(API_ACTIVITY_LOG_SAMPLE_RATE=1)
+    def test_middleware_records_the_request_time_and_user(self):
+        pushed = []
+        request = RequestFactory().get("/api/v1/users/me/", HTTP_X_API_KEY="key")
+        request.user = mock.Mock(id="user-1", is_anonymous=False)
+
+        def get_response(request):
+            # The api token authentication happens inside the view
+            time.sleep(0.01)
+            return HttpResponse()
+
+        before = timezone.now()
+        with mock.patch(
+            "plane.middleware.api_log_middleware.api_activity_log_buffer.push",
+            side_effect=pushed.append,
+        ):
+            APITokenLogMiddleware(get_response)(request)
+
+        (record,) = pushed
+        self.assertEqual(record["created_by_id"], "user-1")
+        created_at = parse_datetime(record["created_at"])
+        self.assertLess(created_at - before, timedelta(seconds=0.01))
+        # Records go to redis as json
+        self.assertEqual(json.loads(json.dumps(record)), record)
@@ -0,0 +1,66 @@
+# Python imports
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+# Module imports
+from plane.utils.api_token import (
+    get_api_token_details,
+    invalidate_api_token,
+    touch_api_token,
+)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    API_TOKEN_CACHE_TIMEOUT=60,
+    API_TOKEN_LAST_USED_INTERVAL=60,
+)
+class APITokenCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch("plane.utils.api_token.APIToken")
+        self.api_token = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def set_token(self, expired_at=None):
+        queryset = self.api_token.objects.filter.return_value.values.return_value
+        queryset.first.return_value = {
+            "id": uuid.uuid4(),
+            "user_id": uuid.uuid4(),
+            "expired_at": expired_at,
+            "is_service": True,
+        }
+
+    def test_verified_token_is_cached_until_invalidated(self):
+        self.set_token()
+
+        details = get_api_token_details("plane_api_token")
+        self.assertEqual(get_api_token_details("plane_api_token"), details)
+        self.assertEqual(self.api_token.objects.filter.call_count, 1)
+
+        invalidate_api_token("plane_api_token")
+        get_api_token_details("plane_api_token")
+        self.assertEqual(self.api_token.objects.filter.call_count, 2)
+
+    def test_cached_token_expires(self):
+        self.set_token(expired_at=timezone.now() + timedelta(seconds=1))
+        self.assertIsNotNone(get_api_token_details("plane_api_token"))
+
+        with mock.patch(
+            "plane.utils.api_token.timezone.now",
+            return_value=timezone.now() + timedelta(seconds=5),
+        ):
+            self.assertIsNone(get_api_token_details("plane_api_token"))
+
+    def test_last_used_is_written_once_per_interval(self):
+        token_id = str(uuid.uuid4())
+        for _ in range(5):
+            touch_api_token(token_id)
+
+        self.api_token.objects.filter.assert_called_once_with(pk=token_id)
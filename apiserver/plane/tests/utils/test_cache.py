@@ -0,0 +1,183 @@
+# Python imports
+import time
+from unittest import mock
+
+# Django imports
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+# Third party imports
+from rest_framework.response import Response
+
+# Module imports
+from plane.tests.fakes import FakeRedis
+from plane.utils.cache import (
+    WORKSPACE_TAG,
+    cache_response,
+    cache_tag,
+    invalidate_cache_directly,
+    local_cache,
+    tag_cache_key,
+)
+
+
+class CachedView:
+    calls = 0
+
+    @cache_response(60, tags=[WORKSPACE_TAG])
+    def get(self, request, slug):
+        CachedView.calls += 1
+        return Response({"slug": slug})
+
+
+class StaleView:
+    calls = 0
+
+    @cache_response(60, stale_timeout=60)
+    def get(self, request, slug):
+        StaleView.calls += 1
+        return Response({"calls": StaleView.calls})
+
+
+class LocalView:
+    calls = 0
+
+    @cache_response(60, user=False, local_timeout=10)
+    def get(self, request):
+        LocalView.calls += 1
+        return Response({"calls": LocalView.calls})
+
+
+@override_settings(DEBUG=False)
+class TagInvalidationTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.cache = LocMemCache("tag-invalidation", {})
+        self.cache.clear()
+        patches = [
+            mock.patch("plane.utils.cache.redis_instance", return_value=self.redis),
+            mock.patch("plane.utils.cache.cache", self.cache),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.factory = RequestFactory()
+        self.user = mock.Mock(is_anonymous=False, id="user-1")
+        CachedView.calls = 0
+
+    def get(self, path):
+        request = self.factory.get(path)
+        request.user = self.user
+        return CachedView().get(request, slug="plane")
+
+    def invalidate(self, **kwargs):
+        request = self.factory.post("/")
+        request.user = self.user
+        request.resolver_match = mock.Mock(kwargs={"slug": "plane"})
+        invalidate_cache_directly(request=request, **kwargs)
+
+    def test_path_invalidation_without_scanning(self):
+        self.get("/api/workspaces/plane/states/")
+        self.get("/api/workspaces/plane/states/?per_page=10")
+        self.get("/api/workspaces/plane/states/")
+        self.assertEqual(CachedView.calls, 2)
+
+        self.invalidate(
+            path="/api/workspaces/:slug/states/",
+            url_params=True,
+            user=False,
+            multiple=True,
+        )
+        self.get("/api/workspaces/plane/states/")
+        self.get("/api/workspaces/plane/states/?per_page=10")
+        self.assertEqual(CachedView.calls, 4)
+        self.assertNotIn("KEYS", self.redis.commands)
+        self.assertNotIn("SCAN", self.redis.commands)
+
+    def test_path_invalidation_covers_the_sub_paths(self):
+        self.get("/api/workspaces/plane/states/")
+        self.get("/api/workspaces/other/states/")
+        self.assertEqual(CachedView.calls, 2)
+
+        self.invalidate(
+            path="/api/workspaces/:slug/", url_params=True, user=False, multiple=True
+        )
+        self.get("/api/workspaces/plane/states/")
+        self.get("/api/workspaces/other/states/")
+        self.assertEqual(CachedView.calls, 3)
+
+    def test_expired_keys_are_pruned_from_the_tags(self):
+        tag = cache_tag(WORKSPACE_TAG, "plane")
+        with mock.patch("plane.utils.cache.time.time", return_value=1000):
+            tag_cache_key("first", [tag], 60)
+            tag_cache_key("second", [tag], 120)
+        with mock.patch("plane.utils.cache.time.time", return_value=1090):
+            tag_cache_key("third", [tag], 60)
+
+        self.assertEqual(list(self.redis.data[tag]), ["second", "third"])
+
+    def test_workspace_tag_invalidation(self):
+        self.get("/api/workspaces/plane/states/")
+        self.get("/api/workspaces/plane/labels/")
+        self.assertEqual(CachedView.calls, 2)
+
+        self.invalidate(path="/api/workspaces/plane/", tags=["workspace"])
+        self.get("/api/workspaces/plane/states/")
+        self.get("/api/workspaces/plane/labels/")
+        self.assertEqual(CachedView.calls, 4)
+
+    def test_only_tagged_views_are_tracked_under_the_request_tags(self):
+        self.get("/api/workspaces/plane/states/")
+        request = self.factory.get("/api/workspaces/plane/members/")
+        request.user = self.user
+        StaleView().get(request, slug="plane")
+
+        self.assertEqual(
+            list(self.redis.data[cache_tag(WORKSPACE_TAG, "plane")]),
+            ["/api/workspaces/plane/states/:user-1"],
+        )
+        self.assertNotIn(cache_tag("user", "user-1"), self.redis.data)
+
+    def test_stale_value_served_while_refreshing(self):
+        request = self.factory.get("/api/workspaces/plane/members/")
+        request.user = self.user
+        StaleView.calls = 0
+        self.assertEqual(StaleView().get(request, slug="plane").data, {"calls": 1})
+
+        # Expire the soft ttl and hold the refresh lock from another worker
+        key = "/api/workspaces/plane/members/:user-1"
+        cached = self.cache.get(key)
+        cached["fresh_until"] = time.time() - 1
+        self.cache.set(key, cached)
+        self.cache.add(f"{key}:lock", 1)
+        self.assertEqual(StaleView().get(request, slug="plane").data, {"calls": 1})
+
+        # The lock holder refreshes the value
+        self.cache.delete(f"{key}:lock")
+        self.assertEqual(StaleView().get(request, slug="plane").data, {"calls": 2})
+        self.assertEqual(StaleView().get(request, slug="plane").data, {"calls": 2})
+
+    def test_local_cache_evicted_by_published_invalidation(self):
+        patch = mock.patch.object(local_cache, "ensure_listener")
+        patch.start()
+        self.addCleanup(patch.stop)
+        local_cache.subscribed.set()
+        self.addCleanup(local_cache.subscribed.clear)
+        self.addCleanup(local_cache.clear)
+
+        request = self.factory.get("/api/instances/")
+        request.user = self.user
+        LocalView.calls = 0
+        LocalView().get(request)
+
+        # Served from the process memory without touching redis
+        self.cache.clear()
+        self.assertEqual(LocalView().get(request).data, {"calls": 1})
+
+        # Invalidations are published and applied by every worker
+        self.invalidate(path="/api/instances/", user=False)
+        self.assertEqual(self.redis.published[-1]["keys"], ["/api/instances/"])
+        local_cache.set("/api/instances/", {"data": {}, "status": 200}, 10)
+        local_cache.apply(self.redis.published[-1])
+        self.assertEqual(LocalView().get(request).data, {"calls": 2})
@@ -0,0 +1,107 @@
+# Python imports
+import json
+from datetime import timedelta
+
+# Django imports
+from django.test import TestCase
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    DashboardCounter,
+    Issue,
+    IssueAssignee,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+)
+from plane.utils.dashboard_counters import (
+    get_dashboard_counters,
+    refresh_issue_dashboard_counters,
+)
+
+
+class DashboardCountersTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        ProjectMember.objects.create(
+            project=self.project, workspace=self.workspace, member=self.user, role=20
+        )
+        self.todo = State.objects.create(
+            name="Todo", color="#000000", project=self.project, workspace=self.workspace
+        )
+        self.done = State.objects.create(
+            name="Done",
+            color="#000000",
+            group="completed",
+            project=self.project,
+            workspace=self.workspace,
+        )
+
+    def create_issue(self, state, assigned=False, created=False, overdue=False):
+        issue = Issue.objects.create(
+            name="Issue",
+            project=self.project,
+            workspace=self.workspace,
+            state=state,
+            target_date=timezone.now().date() - timedelta(days=1) if overdue else None,
+        )
+        if created:
+            Issue.objects.filter(pk=issue.pk).update(created_by=self.user)
+        if assigned:
+            IssueAssignee.objects.create(
+                issue=issue,
+                assignee=self.user,
+                project=self.project,
+                workspace=self.workspace,
+            )
+        return issue
+
+    def test_counters_are_computed_and_refreshed_by_issue_activity(self):
+        self.create_issue(self.todo, assigned=True, overdue=True)
+        self.create_issue(self.done, assigned=True, overdue=True)
+        issue = self.create_issue(self.todo, created=True)
+
+        expected = {
+            "assigned_issues_count": 2,
+            "pending_issues_count": 1,
+            "created_issues_count": 1,
+            "completed_issues_count": 1,
+        }
+        counters = get_dashboard_counters(self.workspace.id, self.user.id)
+        self.assertEqual(counters, expected)
+
+        # Served from the stored counters until an issue activity refreshes them
+        IssueAssignee.objects.create(
+            issue=issue,
+            assignee=self.user,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        with self.assertNumQueries(1):
+            get_dashboard_counters(self.workspace.id, self.user.id)
+
+        refresh_issue_dashboard_counters(
+            "issue.activity.updated",
+            json.dumps({"assignee_ids": [str(self.user.id)]}),
+            issue.id,
+        )
+        expected["assigned_issues_count"] = 3
+        counters = get_dashboard_counters(self.workspace.id, self.user.id)
+        self.assertEqual(counters, expected)
+
+    def test_stale_counters_are_recomputed(self):
+        get_dashboard_counters(self.workspace.id, self.user.id)
+        self.create_issue(self.todo, assigned=True)
+        DashboardCounter.objects.update(computed_at=timezone.now() - timedelta(days=1))
+
+        counters = get_dashboard_counters(self.workspace.id, self.user.id)
+        self.assertEqual(counters["assigned_issues_count"], 1)
@@ -0,0 +1,64 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.utils.default_analytics import (
+    analytics_cache_tag,
+    default_analytics_cache_key,
+    get_default_analytics,
+    invalidate_analytics_cache,
+)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    ANALYTICS_CACHE_TIMEOUT=600,
+)
+class DefaultAnalyticsCacheTest(SimpleTestCase):
+    def setUp(self):
+        patchers = {
+            "compute": mock.patch(
+                "plane.utils.default_analytics.compute_default_analytics",
+                return_value={"total_issues": 3},
+            ),
+            "tag_cache_key": mock.patch(
+                "plane.utils.default_analytics.tag_cache_key"
+            ),
+            "invalidate_cache_tags": mock.patch(
+                "plane.utils.default_analytics.invalidate_cache_tags"
+            ),
+        }
+        for name, patcher in patchers.items():
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_analytics_are_cached_per_workspace_and_filters(self):
+        filters = {"priority__in": ["high"], "state__group__in": ["started"]}
+        self.assertEqual(get_default_analytics("plane", filters), {"total_issues": 3})
+        self.assertEqual(get_default_analytics("plane", filters), {"total_issues": 3})
+        self.assertEqual(self.compute.call_count, 1)
+
+        key = default_analytics_cache_key("plane", filters)
+        self.tag_cache_key.assert_called_once_with(
+            key, [analytics_cache_tag("plane")], 600
+        )
+        # The same filters in another order share the key
+        self.assertEqual(
+            default_analytics_cache_key("plane", dict(reversed(filters.items()))), key
+        )
+
+        get_default_analytics("plane", {"priority__in": ["low"]})
+        get_default_analytics("other", filters)
+        self.assertEqual(self.compute.call_count, 3)
+
+    def test_issue_writes_invalidate_the_workspace_analytics(self):
+        invalidate_analytics_cache("comment.activity.created", "plane")
+        self.invalidate_cache_tags.assert_not_called()
+
+        invalidate_analytics_cache("issue.activity.updated", "plane")
+        self.invalidate_cache_tags.assert_called_once_with(
+            analytics_cache_tag("plane")
+        )
@@ -0,0 +1,113 @@
+# Python imports
+import os
+import random
+import time
+import zlib
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.description_version import (
+    apply_delta,
+    compute_delta,
+    decode_document,
+    encode_document,
+)
+
+
+def build_document(paragraphs):
+    html = "".join(paragraphs)
+    return {
+        "description_html": html,
+        "description_binary": html.encode(),
+        "description_json": {"type": "doc", "paragraphs": len(paragraphs)},
+        "description_stripped": html.replace("<p>", "").replace("</p>", " "),
+    }
+
+
+class DescriptionDeltaTest(SimpleTestCase):
+    def assertRoundTrip(self, source, target):
+        self.assertEqual(apply_delta(source, compute_delta(source, target)), target)
+
+    def test_document_round_trip(self):
+        values = build_document(["<p>one</p>", "<p>two</p>"])
+        values["description_binary"] = os.urandom(64)
+        self.assertEqual(decode_document(encode_document(values)), values)
+
+        values = {
+            "description_html": "",
+            "description_binary": None,
+            "description_json": {},
+            "description_stripped": None,
+        }
+        self.assertEqual(decode_document(encode_document(values)), values)
+
+    def test_delta_round_trip(self):
+        self.assertRoundTrip(b"", b"")
+        self.assertRoundTrip(b"", b"<p>new</p>")
+        self.assertRoundTrip(b"<p>old</p>", b"")
+        self.assertRoundTrip(b"<p>a</p><p>a</p>", b"<p>a</p>")
+        self.assertRoundTrip(b"<p>a</p>", b"<p>a</p><p>a</p>")
+        self.assertRoundTrip(b"aaaa", b"aaaaaaaa")
+        self.assertRoundTrip(os.urandom(4096), os.urandom(4096))
+
+    def test_scattered_edits_round_trip(self):
+        rng = random.Random(7)
+        paragraphs = [
+            f"<p>paragraph {i}\n{'x' * rng.randint(0, 50)}</p>" for i in range(500)
+        ]
+        source = encode_document(build_document(paragraphs))
+        for _ in range(20):
+            index = rng.randrange(len(paragraphs))
+            operation = rng.choice(["edit", "insert", "delete"])
+            if operation == "edit":
+                paragraphs[index] = f"<p>edited {rng.random()}</p>"
+            elif operation == "insert":
+                paragraphs.insert(index, "<p>inserted</p>")
+            else:
+                paragraphs.pop(index)
+            target = encode_document(build_document(paragraphs))
+            self.assertRoundTrip(source, target)
+            self.assertRoundTrip(target, source)
+
+
+class DescriptionDeltaBenchmarkTest(SimpleTestCase):
+    """Storage size and reconstruction latency of the versions of a large page"""
+
+    versions = 10
+
+    def test_storage_and_reconstruction_of_a_multi_megabyte_page(self):
+        rng = random.Random(1)
+        words = ["plane", "issue", "cycle", "module", "page", "state", "label"]
+        paragraphs = [
+            f"<p>{' '.join(rng.choice(words) for _ in range(rng.randint(5, 40)))}</p>"
+            for _ in range(6000)
+        ]
+
+        documents = []
+        for version in range(self.versions):
+            for _ in range(5):
+                index = rng.randrange(len(paragraphs))
+                paragraphs[index] = f"<p>edited {version} {rng.random()}</p>"
+            paragraphs.insert(rng.randrange(len(paragraphs)), "<p>new</p>")
+            documents.append(encode_document(build_document(paragraphs)))
+        self.assertGreater(len(documents[0]), 2 * 1024 * 1024)
+
+        # The latest version is kept in full and each older one as a delta
+        deltas = [
+            compute_delta(documents[index + 1], documents[index])
+            for index in range(self.versions - 1)
+        ]
+        full_size = sum(len(zlib.compress(document)) for document in documents)
+        delta_size = len(zlib.compress(documents[-1])) + sum(map(len, deltas))
+        self.assertLess(delta_size * 5, full_size)
+
+        start = time.monotonic()
+        document = documents[-1]
+        for delta in reversed(deltas):
+            document = apply_delta(document, delta)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(document, documents[0])
+        self.assertLess(elapsed, 2)
@@ -0,0 +1,113 @@
+# Python imports
+import uuid
+from unittest import mock
+
+# Django imports
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+# Third party imports
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+# Module imports
+from plane.app.permissions import (
+    ROLE,
+    ProjectEntityPermission,
+    ProjectLitePermission,
+    WorkspaceEntityPermission,
+    allow_permission,
+    get_membership,
+    invalidate_memberships,
+)
+
+
+class FakeView:
+    def __init__(self, slug, project_id):
+        self.workspace_slug = slug
+        self.project_id = project_id
+
+
+class MembershipTestCase(SimpleTestCase):
+    def setUp(self):
+        self.project_id = uuid.uuid4()
+        self.user = mock.Mock(id=uuid.uuid4(), is_anonymous=False)
+
+        patcher = mock.patch("plane.app.permissions.membership.WorkspaceMember")
+        self.workspace_member = patcher.start()
+        self.addCleanup(patcher.stop)
+        queryset = self.workspace_member.objects.filter.return_value.values.return_value
+        queryset.first.return_value = {"role": ROLE.MEMBER.value, "is_active": True}
+
+        patcher = mock.patch("plane.app.permissions.membership.ProjectMember")
+        self.project_member = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.project_member.objects.filter.return_value.values_list.return_value = [
+            (self.project_id, "PLN", ROLE.GUEST.value)
+        ]
+
+    def make_request(self):
+        request = Request(RequestFactory().get("/"))
+        request.user = self.user
+        return request
+
+
+@override_settings(MEMBERSHIP_CACHE_TIMEOUT=0)
+class MembershipResolverTestCase(MembershipTestCase):
+    def test_roles_are_loaded_once_per_request(self):
+        request = self.make_request()
+        view = FakeView("plane", str(self.project_id))
+
+        # Permission classes, the decorator and the guest filter of the view
+        self.assertTrue(WorkspaceEntityPermission().has_permission(request, view))
+        self.assertTrue(ProjectEntityPermission().has_permission(request, view))
+        self.assertTrue(ProjectLitePermission().has_permission(request, view))
+
+        @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+        def list(instance, request, slug, project_id):
+            return Response(
+                get_membership(request, slug).is_project_guest(project_id)
+            )
+
+        response = list(None, request, slug="plane", project_id=self.project_id)
+        self.assertTrue(response.data)
+
+        self.assertEqual(self.workspace_member.objects.filter.call_count, 1)
+        self.assertEqual(self.project_member.objects.filter.call_count, 1)
+
+        # A new request loads the roles again
+        ProjectLitePermission().has_permission(self.make_request(), view)
+        self.assertEqual(self.project_member.objects.filter.call_count, 2)
+
+    def test_denies_roles_outside_the_allowed_ones(self):
+        request = self.make_request()
+
+        @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
+        def update(instance, request, slug, project_id):
+            return Response(status=200)
+
+        response = update(None, request, slug="plane", project_id=self.project_id)
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(
+            get_membership(request, "plane").is_project_member(uuid.uuid4())
+        )
+
+
+@override_settings(
+    MEMBERSHIP_CACHE_TIMEOUT=60,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class CachedMembershipTestCase(MembershipTestCase):
+    def test_bulk_member_writes_drop_the_cached_roles(self):
+        view = FakeView("plane", str(self.project_id))
+        ProjectLitePermission().has_permission(self.make_request(), view)
+        ProjectLitePermission().has_permission(self.make_request(), view)
+        self.assertEqual(self.project_member.objects.filter.call_count, 1)
+
+        # Other workspaces of the user keep their cached roles
+        invalidate_memberships([self.user.id], ["other"])
+        ProjectLitePermission().has_permission(self.make_request(), view)
+        self.assertEqual(self.project_member.objects.filter.call_count, 1)
+
+        invalidate_memberships([uuid.uuid4(), self.user.id], ["other", "plane"])
+        ProjectLitePermission().has_permission(self.make_request(), view)
+        self.assertEqual(self.project_member.objects.filter.call_count, 2)
@@ -0,0 +1,396 @@
+# Python imports
+import datetime
+import time
+
+# Django imports
+from django.db import connection
+from django.db.models import F, Q
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+# Third party imports
+from rest_framework.exceptions import ParseError
+
+# Module imports
+from plane.app.views.issue.base import IssueViewSet
+from plane.utils.global_paginator import keyset_paginate
+from plane.db.models import (
+    Issue,
+    IssueLabel,
+    Label,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+from plane.utils.grouper import issue_on_results, issue_queryset_grouper
+from plane.utils.order_queryset import order_issue_queryset
+from plane.utils.paginator import (
+    COUNT_ESTIMATED,
+    COUNT_EXACT,
+    COUNT_NONE,
+    Cursor,
+    GroupedOffsetPaginator,
+    KeysetCursor,
+    OffsetPaginator,
+    SubGroupedOffsetPaginator,
+    get_total_count,
+    keyset_filter,
+)
+
+
+class PaginatorTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+
+    def create_states(self, count):
+        return State.objects.bulk_create(
+            State(
+                name=f"State {index}",
+                color="#000000",
+                project=self.project,
+                workspace=self.workspace,
+            )
+            for index in range(count)
+        )
+
+    def create_labels(self, count):
+        return Label.objects.bulk_create(
+            Label(name=f"Label {index}", project=self.project, workspace=self.workspace)
+            for index in range(count)
+        )
+
+    def create_issues(self, states, labels=()):
+        """Create an issue per state, with the labels given for each issue"""
+        issues = Issue.objects.bulk_create(
+            Issue(
+                name=f"Issue {index}",
+                sequence_id=index + 1,
+                state=state,
+                project=self.project,
+                workspace=self.workspace,
+            )
+            for index, state in enumerate(states)
+        )
+        IssueLabel.objects.bulk_create(
+            IssueLabel(
+                issue=issue,
+                label=label,
+                project=self.project,
+                workspace=self.workspace,
+            )
+            for issue, issue_labels in zip(issues, labels)
+            for label in issue_labels
+        )
+        return issues
+
+    def issues(self):
+        return Issue.issue_objects.filter(project=self.project)
+
+    def board_paginator(self, paginator_cls, group_by, sub_group_by=False, **kwargs):
+        """Paginator over the issues as built by the issue list view"""
+        view = IssueViewSet(kwargs={"slug": "plane", "project_id": self.project.id})
+        queryset, order_by = order_issue_queryset(
+            issue_queryset=view.get_queryset(), order_by_param="-created_at"
+        )
+        return paginator_cls(
+            queryset=issue_queryset_grouper(
+                queryset=queryset, group_by=group_by, sub_group_by=sub_group_by
+            ),
+            order_by=order_by,
+            on_results=lambda issues: issue_on_results(
+                group_by=group_by, issues=issues, sub_group_by=sub_group_by
+            ),
+            group_by_field_name=group_by,
+            count_filter=Q(
+                Q(issue_intake__status=1)
+                | Q(issue_intake__status=-1)
+                | Q(issue_intake__status=2)
+                | Q(issue_intake__isnull=True),
+                archived_at__isnull=True,
+                is_draft=False,
+            ),
+            **kwargs,
+        )
+
+
+class GroupedOffsetPaginatorTest(PaginatorTestCase):
+    def paginate(self, group_by, group_by_fields, cursor=None, limit=2):
+        paginator = GroupedOffsetPaginator(
+            self.issues(),
+            group_by,
+            group_by_fields,
+            None,
+            order_by="-created_at",
+            on_results=lambda issues: issues.values("id", "name"),
+        )
+        result = paginator.get_result(limit=limit, cursor=cursor)
+        return result, paginator.process_results(results=result.results)
+
+    def test_group_totals_and_empty_groups(self):
+        todo, done, empty = self.create_states(3)
+        self.create_issues([todo] * 3 + [done])
+
+        result, groups = self.paginate("state_id", [todo.id, done.id, empty.id])
+
+        self.assertEqual(result.hits, 4)
+        self.assertEqual(
+            {group: value["total_results"] for group, value in groups.items()},
+            {str(todo.id): 3, str(done.id): 1, str(empty.id): 0},
+        )
+        self.assertEqual(len(groups[str(todo.id)]["results"]), 2)
+        self.assertEqual(groups[str(empty.id)]["results"], [])
+
+    def test_next_and_prev_cursors(self):
+        todo, done = self.create_states(2)
+        self.create_issues([todo] * 5 + [done])
+
+        result, groups = self.paginate("state_id", [todo.id, done.id])
+        self.assertTrue(result.next)
+        self.assertFalse(result.prev)
+
+        result, groups = self.paginate(
+            "state_id", [todo.id, done.id], cursor=result.next
+        )
+        self.assertTrue(result.next)
+        self.assertTrue(result.prev)
+        # The smaller group keeps its total when none of its rows are on the page
+        self.assertEqual(groups[str(done.id)], {"results": [], "total_results": 1})
+        self.assertEqual(len(groups[str(todo.id)]["results"]), 2)
+
+        result, groups = self.paginate(
+            "state_id", [todo.id, done.id], cursor=Cursor(2, 2, False)
+        )
+        self.assertFalse(result.next)
+        self.assertEqual(len(groups[str(todo.id)]["results"]), 1)
+
+    def test_many_to_many_rows_are_counted_once_per_group(self):
+        (state,) = self.create_states(1)
+        bug, feature = self.create_labels(2)
+        both, bug_only, unlabelled = self.create_issues(
+            [state] * 3, labels=[[bug, feature], [bug], []]
+        )
+
+        result, groups = self.paginate(
+            "labels__id", [bug.id, feature.id, "None"], limit=10
+        )
+
+        self.assertEqual(
+            {group: value["total_results"] for group, value in groups.items()},
+            {str(bug.id): 2, str(feature.id): 1, "None": 1},
+        )
+        self.assertEqual(
+            sorted(issue["id"] for issue in groups[str(bug.id)]["results"]),
+            sorted([both.id, bug_only.id]),
+        )
+        label_ids = groups[str(feature.id)]["results"][0]["label_ids"]
+        self.assertEqual(sorted(label_ids), sorted([str(bug.id), str(feature.id)]))
+        self.assertEqual(groups["None"]["results"][0]["label_ids"], [])
+
+    def test_issue_view_board(self):
+        todo, done = self.create_states(2)
+        bug, feature = self.create_labels(2)
+        issues = self.create_issues(
+            [todo, todo, done], labels=[[bug, feature], [bug], []]
+        )
+
+        paginator = self.board_paginator(
+            GroupedOffsetPaginator,
+            "labels__id",
+            group_by_fields=[bug.id, feature.id, "None"],
+        )
+        result = paginator.get_result(limit=10)
+        groups = paginator.process_results(results=result.results)
+
+        self.assertEqual(
+            {group: value["total_results"] for group, value in groups.items()},
+            {str(bug.id): 2, str(feature.id): 1, "None": 1},
+        )
+        issue = groups[str(feature.id)]["results"][0]
+        self.assertEqual(issue["id"], issues[0].id)
+        self.assertEqual(
+            sorted(issue["label_ids"]), sorted([str(bug.id), str(feature.id)])
+        )
+
+
+class SubGroupedOffsetPaginatorTest(PaginatorTestCase):
+    def paginate(self, states, labels, limit=10):
+        paginator = self.board_paginator(
+            SubGroupedOffsetPaginator,
+            "state_id",
+            "labels__id",
+            group_by_fields=[state.id for state in states],
+            sub_group_by_field_name="labels__id",
+            sub_group_by_fields=[label.id for label in labels] + ["None"],
+        )
+        result = paginator.get_result(limit=limit)
+        return result, paginator.process_results(results=result.results)
+
+    def test_group_totals_count_distinct_issues(self):
+        todo, done = self.create_states(2)
+        bug, feature = self.create_labels(2)
+        self.create_issues([todo, todo, done], labels=[[bug, feature], [bug], []])
+
+        result, groups = self.paginate([todo, done], [bug, feature])
+
+        # The issue with two labels is one issue of its state
+        self.assertEqual(groups[str(todo.id)]["total_results"], 2)
+        self.assertEqual(groups[str(done.id)]["total_results"], 1)
+        sub_groups = groups[str(todo.id)]["results"]
+        self.assertEqual(sub_groups[str(bug.id)]["total_results"], 2)
+        self.assertEqual(sub_groups[str(feature.id)]["total_results"], 1)
+        self.assertEqual(len(sub_groups[str(bug.id)]["results"]), 2)
+        self.assertEqual(groups[str(done.id)]["results"]["None"]["total_results"], 1)
+
+
+class GroupedPaginationBenchmarkTest(PaginatorTestCase):
+    """Kanban board of 50 states by 50 labels"""
+
+    def test_board_page_is_one_query(self):
+        states = self.create_states(50)
+        labels = self.create_labels(50)
+        # Two issues in every cell of the board
+        cells = [(state, label) for state in states for label in labels] * 2
+        self.create_issues(
+            [state for state, _ in cells], labels=[[label] for _, label in cells]
+        )
+        # Plan the query on the statistics of the board instead of an empty table
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        paginator = self.board_paginator(
+            SubGroupedOffsetPaginator,
+            "state_id",
+            "labels__id",
+            group_by_fields=[state.id for state in states],
+            sub_group_by_field_name="labels__id",
+            sub_group_by_fields=[label.id for label in labels] + ["None"],
+        )
+        start = time.monotonic()
+        with CaptureQueriesContext(connection) as context:
+            result = paginator.get_result(limit=1)
+        elapsed = time.monotonic() - start
+        groups = paginator.process_results(results=result.results)
+
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(len(result.results), 50 * 50)
+        self.assertEqual(result.hits, 50 * 50 * 2)
+        self.assertTrue(result.next)
+        self.assertEqual(groups[str(states[0].id)]["total_results"], 100)
+        self.assertEqual(
+            groups[str(states[0].id)]["results"][str(labels[0].id)]["total_results"],
+            2,
+        )
+        self.assertLess(elapsed, 5)
+
+
+class KeysetPaginationTest(PaginatorTestCase):
+    def setUp(self):
+        super().setUp()
+        (state,) = self.create_states(1)
+        self.create_issues([state] * 7)
+        # Null target dates and rows sharing both the key and created_at
+        first, second = datetime.date(2024, 1, 1), datetime.date(2024, 2, 1)
+        for issue, target_date in zip(
+            self.issues(), [first, first, first, second, None, None, second]
+        ):
+            issue.target_date = target_date
+            issue.save(update_fields=["target_date"])
+        self.issues().update(created_at=timezone.now())
+
+    def ordered(self, order_key="target_date", desc=False):
+        key = F(order_key).desc(nulls_last=True) if desc else F(order_key).asc(
+            nulls_last=True
+        )
+        return list(self.issues().order_by(key, "-created_at", "-id"))
+
+    def test_filter_seeks_past_every_position(self):
+        for desc in (False, True):
+            issues = self.ordered(desc=desc)
+            for index, issue in enumerate(issues):
+                position = (issue.target_date, issue.created_at, issue.id)
+                after = self.issues().filter(
+                    keyset_filter(position, order_key="target_date", desc=desc)
+                )
+                before = self.issues().filter(
+                    keyset_filter(
+                        position, order_key="target_date", desc=desc, forward=False
+                    )
+                )
+                self.assertEqual(set(after), set(issues[index + 1 :]))
+                self.assertEqual(set(before), set(issues[:index]))
+
+    def test_filter_breaks_created_at_ties_by_id(self):
+        issues = self.ordered(order_key="created_at", desc=True)
+        for index, issue in enumerate(issues):
+            position = (None, issue.created_at, issue.id)
+            after = self.issues().filter(keyset_filter(position))
+            before = self.issues().filter(keyset_filter(position, forward=False))
+            self.assertEqual(set(after), set(issues[index + 1 :]))
+            self.assertEqual(set(before), set(issues[:index]))
+
+    def test_keyset_result_walks_forward_and_back(self):
+        for order_by in ("target_date", "-target_date", "-created_at"):
+            paginator = OffsetPaginator(self.issues(), order_by=order_by)
+            ids, cursor, pages = [], KeysetCursor(2), []
+            while True:
+                result = paginator.get_keyset_result(limit=2, cursor=cursor)
+                pages.append([issue.id for issue in result.results])
+                ids.extend(pages[-1])
+                if not result.next:
+                    break
+                # Cursors go through the query string
+                cursor = KeysetCursor.from_string(str(result.next))
+
+            key = order_by.lstrip("-")
+            expected = self.ordered(order_key=key, desc=order_by.startswith("-"))
+            self.assertEqual(ids, [issue.id for issue in expected])
+            self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+            self.assertEqual(result.hits, 7)
+
+            # Back from the last page
+            for page in reversed(pages[:-1]):
+                cursor = KeysetCursor.from_string(str(result.prev))
+                result = paginator.get_keyset_result(limit=2, cursor=cursor)
+                self.assertEqual([issue.id for issue in result.results], page)
+            self.assertFalse(result.prev)
+
+    def test_global_keyset_paginate(self):
+        issues = self.ordered(order_key="updated_at")
+        response = keyset_paginate(
+            self.issues(), self.issues(), "4:k:0", None, "updated_at"
+        )
+        self.assertEqual(list(response["results"]), issues[:4])
+        self.assertTrue(response["next_page_results"])
+
+        response = keyset_paginate(
+            self.issues(), self.issues(), response["next_cursor"], None, "updated_at"
+        )
+        self.assertEqual(list(response["results"]), issues[4:])
+        self.assertFalse(response["next_page_results"])
+        self.assertEqual(response["total_results"], 7)
+
+    def test_global_keyset_paginate_rejects_invalid_cursors(self):
+        for cursor in ("4:kbm90LWpzb24:0", "4:0:0", "four:k:0"):
+            with self.assertRaises(ParseError):
+                keyset_paginate(
+                    self.issues(), self.issues(), cursor, None, "updated_at"
+                )
+
+    def test_count_modes(self):
+        self.assertEqual(get_total_count(self.issues(), COUNT_EXACT), 7)
+        self.assertIsNone(get_total_count(self.issues(), COUNT_NONE))
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        # The table statistics for unfiltered querysets
+        self.assertEqual(get_total_count(Issue.all_objects.all(), COUNT_ESTIMATED), 7)
+        # The plan estimate for filtered ones
+        self.assertGreater(get_total_count(self.issues(), COUNT_ESTIMATED), 0)
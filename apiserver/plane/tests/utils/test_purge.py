@@ -0,0 +1,80 @@
+# Python imports
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    APIActivityLog,
+    Issue,
+    IssueActivity,
+    IssueComment,
+    Project,
+    Workspace,
+)
+from plane.tests.fakes import FakeRedis
+from plane.utils.purge import get_purge_metrics, get_soft_delete_models, purge
+
+
+class PurgeOrderTest(SimpleTestCase):
+    def test_children_come_before_the_models_they_reference(self):
+        models = get_soft_delete_models()
+        for child, parent in [
+            (IssueComment, Issue),
+            (IssueActivity, Issue),
+            (Issue, Project),
+            (Project, Workspace),
+        ]:
+            self.assertLess(models.index(child), models.index(parent))
+
+
+class PurgeCheckpointTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch(
+            "plane.utils.purge.redis_instance", return_value=self.redis
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_interrupted_purge_resumes_with_the_same_cutoff(self):
+        cutoff = timezone.now() - timedelta(days=30)
+        models = [IssueComment, Issue]
+        deleted = []
+
+        def interrupted(queryset, batch_size):
+            if queryset.model is Issue:
+                raise TimeoutError
+            deleted.append(queryset.model)
+            return 10
+
+        with mock.patch("plane.utils.purge.delete_in_batches", interrupted):
+            with self.assertRaises(TimeoutError):
+                purge("test", models, "deleted_at", cutoff, batch_size=100)
+
+        querysets = []
+
+        def completed(queryset, batch_size):
+            querysets.append(queryset)
+            return 5
+
+        with mock.patch("plane.utils.purge.delete_in_batches", completed):
+            purge("test", models, "deleted_at", timezone.now(), batch_size=100)
+
+        # The comments are not purged again and the issues use the first cutoff
+        self.assertEqual(deleted, [IssueComment])
+        self.assertEqual([queryset.model for queryset in querysets], [Issue])
+        self.assertEqual(querysets[0].query.where.children[0].rhs, cutoff)
+        metrics = get_purge_metrics("test")
+        self.assertEqual(metrics["db.issuecomment"]["rows"], 10)
+        self.assertEqual(metrics["db.issue"]["rows"], 5)
+        self.assertNotIn("purge:test", self.redis.data)
+
+    def test_concurrent_purge_is_skipped(self):
+        self.redis.set("purge:test:lock", "true")
+        with mock.patch("plane.utils.purge.delete_in_batches") as delete:
+            purge("test", [APIActivityLog], "created_at", timezone.now())
+        delete.assert_not_called()
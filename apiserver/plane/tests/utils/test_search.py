@@ -0,0 +1,104 @@
+# Python imports
+import threading
+import time
+import uuid
+from unittest import mock
+
+# Django imports
+from django.db import OperationalError
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.db.models import Issue
+from plane.utils.issue_search import search_issues
+from plane.utils.search import run_searches, search_query
+
+
+class SearchQueryTest(SimpleTestCase):
+    def test_every_word_is_matched_as_a_prefix(self):
+        query = search_query("login  bug's")
+        self.assertEqual(query.source_expressions[1].value, "login:* & bug:* & s:*")
+        # Operators of the tsquery syntax are not passed through
+        query = search_query("a|b & !c")
+        self.assertEqual(query.source_expressions[1].value, "a:* & b:* & c:*")
+        self.assertIsNone(search_query("!?"))
+
+    def test_issues_are_searched_on_the_search_vector(self):
+        project_id = uuid.uuid4()
+        with mock.patch("plane.utils.issue_search.Project") as project:
+            project.objects.filter.return_value.values_list.return_value = [
+                project_id
+            ]
+            sql = str(search_issues("WEB 42", Issue.issue_objects.all(), "plane").query)
+
+        project.objects.filter.assert_called_once_with(
+            workspace__slug="plane", identifier__icontains="WEB 42"
+        )
+        self.assertIn('"issues"."search_vector") @@', sql)
+        self.assertIn('"issues"."sequence_id" = 42', sql)
+        # The matching projects are constants, not a subquery on the projects
+        self.assertIn(f'"issues"."project_id" IN ({project_id})', sql)
+        self.assertEqual(sql.count("SELECT"), 1)
+        self.assertIn('AS "search_rank"', sql)
+
+
+def slow_search(seconds, results):
+    def search():
+        time.sleep(seconds)
+        return results
+
+    return search
+
+
+class RunSearchesTest(SimpleTestCase):
+    def test_slow_and_failing_searches_are_left_out(self):
+        def cancelled():
+            raise OperationalError("canceling statement due to statement timeout")
+
+        results, timed_out = run_searches(
+            {
+                "issue": slow_search(0, ["issue"]),
+                "page": slow_search(1, ["page"]),
+                "cycle": cancelled,
+            },
+            timeout=0.2,
+        )
+        self.assertEqual(results, {"issue": ["issue"], "page": [], "cycle": []})
+        self.assertEqual(sorted(timed_out), ["cycle", "page"])
+
+
+class GlobalSearchConcurrencyTest(SimpleTestCase):
+    """The seven entity searches run on the pool at the same time"""
+
+    def test_entity_searches_run_concurrently(self):
+        entities = [
+            "workspace",
+            "project",
+            "issue",
+            "cycle",
+            "module",
+            "issue_view",
+            "page",
+        ]
+        # The issue and page searches only return once both are running, a
+        # pool running the searches one by one breaks the barrier instead
+        barrier = threading.Barrier(2, timeout=5)
+        threads = {}
+
+        def search(name):
+            def run():
+                threads[name] = threading.current_thread().name
+                if name in ("issue", "page"):
+                    barrier.wait()
+                return [name]
+
+            return run
+
+        results, timed_out = run_searches(
+            {name: search(name) for name in entities}, timeout=10
+        )
+
+        self.assertEqual(results, {name: [name] for name in entities})
+        self.assertEqual(timed_out, [])
+        self.assertNotEqual(threads["issue"], threads["page"])
+        self.assertTrue(all(name.startswith("search") for name in threads.values()))
@@ -0,0 +1,102 @@
+# Python imports
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.webhook_delivery import build_request, deliver
+
+
+class StandInServer:
+    """Local webhook receiver answering every request after the given latency"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.connections = set()
+        self.handled_at = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                with server.lock:
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    server.connections.add(self.client_address)
+                time.sleep(server.latency)
+                with server.lock:
+                    server.in_flight -= 1
+                    server.handled_at.append(time.monotonic())
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Length", "2")
+                    self.end_headers()
+                    self.wfile.write(b"ok")
+                except ConnectionError:
+                    # The client gave up waiting
+                    return
+
+            def log_message(self, *args):
+                return
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/webhook"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class WebhookDeliveryTestCase(SimpleTestCase):
+    def setUp(self):
+        self.slow = StandInServer(latency=0.5)
+        self.fast = StandInServer(latency=0)
+
+    def tearDown(self):
+        self.slow.close()
+        self.fast.close()
+
+    def make_requests(self, url, count):
+        return [
+            build_request(url, "issue", {"id": index}, secret_key="secret")
+            for index in range(count)
+        ]
+
+    def test_slow_host_does_not_block_other_hosts(self):
+        requests_ = self.make_requests(self.slow.url, 4) + self.make_requests(
+            self.fast.url, 20
+        )
+
+        start = time.monotonic()
+        results = deliver(requests_, max_workers=8, per_host=2, timeout=(1, 5))
+
+        self.assertTrue(all(result["status"] == 200 for result in results))
+        # The slow host is capped while the fast host finishes right away
+        self.assertEqual(self.slow.max_in_flight, 2)
+        self.assertLessEqual(self.fast.max_in_flight, 2)
+        self.assertLess(max(self.fast.handled_at), min(self.slow.handled_at))
+        self.assertGreaterEqual(max(self.slow.handled_at) - start, 1)
+        # Requests to a host reuse the keep-alive connections of the pool
+        self.assertLessEqual(len(self.fast.connections), 2)
+
+    def test_read_timeout_is_returned_as_error(self):
+        results = deliver(
+            self.make_requests(self.slow.url, 1) + self.make_requests(self.fast.url, 1),
+            timeout=(1, 0.1),
+        )
+
+        self.assertIsNotNone(results[0]["error"])
+        self.assertEqual(results[1]["status"], 200)
+        self.assertIsNone(results[1]["error"])
@@ -0,0 +1,75 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import TestCase, override_settings
+
+# Module imports
+from plane.db.models import User, Webhook, Workspace
+from plane.utils.webhook_subscriptions import get_event_webhook_ids
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class WebhookSubscriptionIndexTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.issues = self.create_webhook("issues", issue=True, project=True)
+            self.modules = self.create_webhook("modules", module=True)
+            self.create_webhook("inactive", issue=True, is_active=False)
+
+    def create_webhook(self, name, **flags):
+        return Webhook.objects.create(
+            workspace=self.workspace, url=f"https://example.com/{name}", **flags
+        )
+
+    def subscribers(self, event):
+        return set(get_event_webhook_ids(slug="plane", event=event))
+
+    def test_events_are_routed_by_the_subscription_flags(self):
+        self.assertEqual(self.subscribers("issue"), {str(self.issues.id)})
+        self.assertEqual(self.subscribers("project"), {str(self.issues.id)})
+        self.assertEqual(self.subscribers("module_issue"), {str(self.modules.id)})
+        self.assertEqual(self.subscribers("cycle"), set())
+        # Events without a flag go to every active webhook
+        self.assertEqual(
+            self.subscribers("intake_issue"),
+            {str(self.issues.id), str(self.modules.id)},
+        )
+
+    def test_index_is_cached(self):
+        self.subscribers("issue")
+        with self.assertNumQueries(0):
+            self.subscribers("issue")
+            self.subscribers("module")
+
+    def test_index_is_invalidated_once_the_change_is_committed(self):
+        self.assertEqual(self.subscribers("cycle"), set())
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.modules.cycle = True
+            self.modules.save()
+        # Other workers can not see the change before the commit
+        self.assertEqual(self.subscribers("cycle"), set())
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.subscribers("cycle"), {str(self.modules.id)})
+
+    @mock.patch("plane.db.mixins.soft_delete_related_objects")
+    def test_deleted_webhooks_are_unsubscribed(self, soft_delete_related_objects):
+        self.assertEqual(self.subscribers("issue"), {str(self.issues.id)})
+        self.assertEqual(self.subscribers("module"), {str(self.modules.id)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.issues.delete()
+        self.assertEqual(self.subscribers("issue"), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.modules.delete(soft=False)
+        self.assertEqual(self.subscribers("module"), set())
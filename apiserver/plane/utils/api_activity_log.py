@@ -0,0 +1,115 @@
+# Python imports
+import json
+import queue
+import threading
+
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+# Redis list holding the records waiting to be written
+API_ACTIVITY_LOG_KEY = "api_activity_logs:pending"
+# Number of records dropped by the overload policy
+API_ACTIVITY_LOG_DROPPED_KEY = "api_activity_logs:dropped"
+# Set while a flush is queued so bursts enqueue a single flush task
+API_ACTIVITY_LOG_FLUSH_KEY = "api_activity_logs:flush_scheduled"
+API_ACTIVITY_LOG_FLUSH_LOCK_TIMEOUT = 60
+
+
+def truncate_body(value, limit=None):
+    """Decode the body keeping at most limit characters, 0 keeps everything"""
+    if not value:
+        return None
+    limit = settings.API_ACTIVITY_LOG_BODY_LIMIT if limit is None else limit
+    if isinstance(value, bytes):
+        value = value[: limit * 4] if limit else value
+        value = value.decode("utf-8", errors="replace")
+    return value[:limit] if limit else value
+
+
+class APIActivityLogBuffer:
+    """
+    Bounded in process queue handing the log records to redis from a thread
+    Records are dropped instead of blocking the request when the queue or the
+    redis list is full, or when redis can not be reached
+    """
+
+    def __init__(self, max_size=None):
+        self.queue = queue.Queue(
+            maxsize=max_size or settings.API_ACTIVITY_LOG_BUFFER_SIZE
+        )
+        self.lock = threading.Lock()
+        self.thread = None
+        self.dropped = 0
+
+    def push(self, record):
+        self.ensure_worker()
+        try:
+            self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def ensure_worker(self):
+        # Forked workers do not inherit the thread, start it on first use
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+    def drain(self):
+        """Wait for the next record and take the queued ones along with it"""
+        records = [self.queue.get()]
+        while len(records) < settings.API_ACTIVITY_LOG_BATCH_SIZE:
+            try:
+                records.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return records
+
+    def run(self):
+        ri = redis_instance()
+        while True:
+            self.write(ri, self.drain())
+
+    def write(self, ri, records):
+        max_pending = settings.API_ACTIVITY_LOG_MAX_PENDING
+        dropped, self.dropped = self.dropped, 0
+        try:
+            pipeline = ri.pipeline(transaction=True)
+            pipeline.rpush(API_ACTIVITY_LOG_KEY, *[json.dumps(r) for r in records])
+            # Keep the oldest records when the writer falls behind
+            pipeline.ltrim(API_ACTIVITY_LOG_KEY, 0, max_pending - 1)
+            pending = pipeline.execute()[0]
+            dropped += max(pending - max_pending, 0)
+            if dropped:
+                ri.incrby(API_ACTIVITY_LOG_DROPPED_KEY, dropped)
+        except Exception:
+            # Redis is unavailable, the records are dropped
+            self.dropped += dropped + len(records)
+            return
+
+        try:
+            if pending >= settings.API_ACTIVITY_LOG_BATCH_SIZE:
+                schedule_flush(ri)
+        except Exception:
+            # The periodic flush picks the records up
+            return
+
+
+def schedule_flush(ri):
+    # Module imports
+    from plane.bgtasks.api_logs_task import flush_api_activity_logs
+
+    if ri.set(
+        API_ACTIVITY_LOG_FLUSH_KEY, "1", nx=True, ex=API_ACTIVITY_LOG_FLUSH_LOCK_TIMEOUT
+    ):
+        flush_api_activity_logs.delay()
+
+
+api_activity_log_buffer = APIActivityLogBuffer()
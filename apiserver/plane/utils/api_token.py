@@ -0,0 +1,68 @@
+# Python imports
+import hashlib
+from datetime import datetime
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import APIToken
+
+
+def api_token_cache_key(token):
+    # Only the digest of the token ends up in the key names
+    return f"api_token:{hashlib.sha256(token.encode('utf-8')).hexdigest()}"
+
+
+def get_api_token_details(token):
+    """
+    Return the details of the active and unexpired token or None
+    Verified tokens are cached for API_TOKEN_CACHE_TIMEOUT seconds which bounds
+    the delay of a revocation not going through the model
+    """
+    key = api_token_cache_key(token)
+    details = cache.get(key)
+    if details is None:
+        api_token = (
+            APIToken.objects.filter(
+                Q(Q(expired_at__gt=timezone.now()) | Q(expired_at__isnull=True)),
+                token=token,
+                is_active=True,
+            )
+            .values("id", "user_id", "expired_at", "is_service")
+            .first()
+        )
+        if api_token is None:
+            return None
+        details = {
+            "id": str(api_token["id"]),
+            "user_id": str(api_token["user_id"]),
+            "expired_at": (
+                api_token["expired_at"].isoformat() if api_token["expired_at"] else None
+            ),
+            "is_service": api_token["is_service"],
+        }
+        cache.set(key, details, settings.API_TOKEN_CACHE_TIMEOUT)
+
+    # The token can expire while it is cached
+    if details["expired_at"] and datetime.fromisoformat(
+        details["expired_at"]
+    ) <= timezone.now():
+        return None
+    return details
+
+
+def touch_api_token(token_id):
+    """Record the token usage, writing last_used at most once per interval"""
+    if cache.add(
+        f"api_token:last_used:{token_id}", 1, settings.API_TOKEN_LAST_USED_INTERVAL
+    ):
+        # Update skips the model signals so the cached token stays valid
+        APIToken.objects.filter(pk=token_id).update(last_used=timezone.now())
+
+
+def invalidate_api_token(token):
+    cache.delete(api_token_cache_key(token))
@@ -1,4 +1,9 @@
 # Python imports
+import json
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
 from functools import wraps
 
 # Django imports
@@ -8,6 +13,35 @@ from django.core.cache import cache
 # Third party imports
 from rest_framework.response import Response
 
+# Module imports
+from plane.settings.redis import redis_instance
+
+# Tags are redis sorted sets of the cache keys stored under them, scored by
+# the expiry of the key so that the expired ones are pruned on write
+CACHE_TAG_PREFIX = "cache_tag"
+# Tag sets outlive the longest cached response so no key is left untracked
+CACHE_TAG_TIMEOUT = 60 * 60 * 24
+
+# Single flight locks expire on their own if the refreshing worker dies
+CACHE_LOCK_TIMEOUT = 30
+# How long a request waits for another worker to fill a missing key
+CACHE_LOCK_WAIT = 5
+CACHE_LOCK_POLL_INTERVAL = 0.05
+
+# Hit, miss and stale counters are flushed to this redis hash
+CACHE_STATS_KEY = "cache_response:stats"
+CACHE_STATS_FLUSH_INTERVAL = 10
+
+# Invalidated keys are published on this channel to the local caches
+LOCAL_CACHE_CHANNEL = "cache_response:invalidations"
+LOCAL_CACHE_VERSION_KEY = "cache_response:invalidation_version"
+LOCAL_CACHE_MAX_ENTRIES = 1024
+
+# Tag kinds resolved from the request
+WORKSPACE_TAG = "workspace"
+PROJECT_TAG = "project"
+USER_TAG = "user"
+
 
 def generate_cache_key(custom_path, auth_header=None):
     """Generate a cache key with the given params"""
@@ -18,10 +52,305 @@ def generate_cache_key(custom_path, auth_header=None):
     return key_data
 
 
-def cache_response(timeout=60 * 60, path=None, user=True):
-    """decorator to create cache per user"""
+def cache_tag(kind, value):
+    """Generate the name of the tag set for the given kind and value"""
+    return f"{CACHE_TAG_PREFIX}:{kind}:{value}"
+
+
+def path_cache_tag(path, auth_header=None):
+    """
+    Tag holding every cached variant (query params, users) of a path and,
+    without an auth header, of its sub paths
+    """
+    path = path if path.startswith("/") else f"/{path}"
+    return cache_tag("path", generate_cache_key(path, auth_header))
+
+
+def path_cache_tags(path, auth_header=None):
+    """Resolve the tags of a cached path, its parent paths included"""
+    path = path if path.startswith("/") else f"/{path}"
+    parents = [
+        path[: index + 1] for index in range(1, len(path) - 1) if path[index] == "/"
+    ]
+    return [
+        *(path_cache_tag(parent) for parent in parents),
+        path_cache_tag(path),
+        *([path_cache_tag(path, auth_header)] if auth_header else []),
+    ]
+
+
+def request_cache_tags(request, kwargs, kinds=()):
+    """Resolve the workspace, project and user tags of the request"""
+    tags = []
+    if WORKSPACE_TAG in kinds and kwargs.get("slug"):
+        tags.append(cache_tag(WORKSPACE_TAG, kwargs.get("slug")))
+    if PROJECT_TAG in kinds and kwargs.get("project_id"):
+        tags.append(cache_tag(PROJECT_TAG, kwargs.get("project_id")))
+    if USER_TAG in kinds and request and not request.user.is_anonymous:
+        tags.append(cache_tag(USER_TAG, request.user.id))
+    return tags
+
+
+def tag_cache_key(key, tags, timeout=CACHE_TAG_TIMEOUT):
+    """Add the cache key to the tag sets, pruning the expired keys of the sets"""
+    if not tags:
+        return
+    now = time.time()
+    ri = redis_instance()
+    pipeline = ri.pipeline()
+    for tag in tags:
+        pipeline.zremrangebyscore(tag, "-inf", now)
+        pipeline.zadd(tag, {key: now + timeout})
+        pipeline.expire(tag, max(timeout, CACHE_TAG_TIMEOUT))
+    pipeline.execute()
+
+
+def invalidate_cache_tags(*tags):
+    """Delete every cache key stored under the tags without scanning the keyspace"""
+    if not tags:
+        return
+    ri = redis_instance()
+    # Read and drop the tag sets atomically so no key added meanwhile is lost
+    pipeline = ri.pipeline(transaction=True)
+    for tag in tags:
+        pipeline.zrange(tag, 0, -1)
+    pipeline.delete(*tags)
+    members = pipeline.execute()[:-1]
+
+    keys = {
+        key.decode() if isinstance(key, bytes) else key
+        for tag_keys in members
+        for key in tag_keys
+    }
+    if keys:
+        cache.delete_many(keys=list(keys))
+        publish_invalidation(keys)
+
+
+class CacheStats:
+    """
+    Per process hit, miss and stale counters of cached views
+    The counters are flushed to a redis hash periodically to keep the
+    request path free of extra round trips
+    """
+
+    def __init__(self, flush_interval=CACHE_STATS_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self.counters = Counter()
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+    def record(self, name, event):
+        with self.lock:
+            self.counters[f"{name}:{event}"] += 1
+            if time.monotonic() - self.last_flush < self.flush_interval:
+                return
+            counters, self.counters = self.counters, Counter()
+            self.last_flush = time.monotonic()
+        self.flush(counters)
+
+    def flush(self, counters=None):
+        if counters is None:
+            with self.lock:
+                counters, self.counters = self.counters, Counter()
+        if not counters:
+            return
+        try:
+            pipeline = redis_instance().pipeline()
+            for field, count in counters.items():
+                pipeline.hincrby(CACHE_STATS_KEY, field, count)
+            pipeline.execute()
+        except Exception:
+            # Stats are best effort and must never fail the request
+            return
+
+
+cache_stats = CacheStats()
+
+
+def get_cache_stats():
+    """Return the hit, miss and stale counts of every cached view"""
+    cache_stats.flush()
+    stats = {}
+    for field, count in redis_instance().hgetall(CACHE_STATS_KEY).items():
+        field = field.decode() if isinstance(field, bytes) else field
+        name, _, event = field.rpartition(":")
+        stats.setdefault(name, {"hit": 0, "miss": 0, "stale": 0})[event] = int(count)
+    return stats
+
+
+class LocalCache:
+    """
+    Bounded per process LRU cache with ttl in front of redis
+    Every invalidation is published with an increasing version and a listener
+    thread evicts the published keys. Entries are only served while the
+    listener is subscribed and the whole cache is dropped when a version is
+    missed, so a worker never serves a value invalidated elsewhere for longer
+    than it takes to deliver the message.
+    """
+
+    def __init__(self, max_entries=LOCAL_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.version = None
+        self.subscribed = threading.Event()
+        self.listener = None
+
+    def get(self, key):
+        self.ensure_listener()
+        if not self.subscribed.is_set():
+            return None
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout):
+        if not self.subscribed.is_set():
+            return
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + timeout)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def evict(self, keys):
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def apply(self, message):
+        """Apply a published invalidation to the local entries"""
+        version, keys = message["version"], message["keys"]
+        # A skipped version means an invalidation was missed
+        if self.version is not None and version > self.version + 1:
+            self.clear()
+        else:
+            self.evict(keys)
+        self.version = max(version, self.version or 0)
+
+    def ensure_listener(self):
+        if self.listener is not None and self.listener.is_alive():
+            return
+        with self.lock:
+            if self.listener is not None and self.listener.is_alive():
+                return
+            self.listener = threading.Thread(
+                target=self.listen, name="local-cache-invalidations", daemon=True
+            )
+            self.listener.start()
+
+    def listen(self):
+        logger = logging.getLogger("plane")
+        while True:
+            try:
+                pubsub = redis_instance().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(LOCAL_CACHE_CHANNEL)
+                # Entries cached before subscribing may have missed invalidations
+                self.clear()
+                self.version = None
+                self.subscribed.set()
+                for message in pubsub.listen():
+                    self.apply(json.loads(message["data"]))
+            except Exception as e:
+                logger.warning(f"Local cache invalidation listener failed: {e}")
+            finally:
+                self.subscribed.clear()
+                self.clear()
+            time.sleep(1)
+
+
+local_cache = LocalCache()
+
+
+def publish_invalidation(keys):
+    """Publish the invalidated keys to the local caches of every worker"""
+    if not keys:
+        return
+    ri = redis_instance()
+    version = ri.incr(LOCAL_CACHE_VERSION_KEY)
+    ri.publish(
+        LOCAL_CACHE_CHANNEL, json.dumps({"version": version, "keys": list(keys)})
+    )
+    local_cache.evict(keys)
+
+
+def acquire_cache_lock(key):
+    """Acquire the single flight lock of the cache key"""
+    return cache.add(f"{key}:lock", 1, CACHE_LOCK_TIMEOUT)
+
+
+def release_cache_lock(key):
+    cache.delete(f"{key}:lock")
+
+
+def wait_for_cache(key):
+    """Wait for the worker holding the lock to fill the cache key"""
+    deadline = time.monotonic() + CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(CACHE_LOCK_POLL_INTERVAL)
+        cached_result = cache.get(key)
+        if cached_result is not None:
+            return cached_result
+    return None
+
+
+def cache_response(
+    timeout=60 * 60,
+    path=None,
+    user=True,
+    single_flight=False,
+    stale_timeout=None,
+    local_timeout=None,
+    tags=None,
+):
+    """
+    decorator to create cache per user
+    single_flight lets only one request compute a missing key while the others
+    wait for it, stale_timeout keeps serving the expired value for that long
+    while a single request refreshes it and local_timeout keeps the response
+    in the in process cache for that long in front of redis. tags lists the
+    workspace, project or user tags the response is also tracked under, for
+    the writes invalidating them with invalidate_cache(tags=...)
+    """
 
     def decorator(view_func):
+        name = view_func.__qualname__
+
+        def store(instance, request, key, auth_header, *args, **kwargs):
+            response = view_func(instance, request, *args, **kwargs)
+            if response.status_code == 200 and not settings.DEBUG:
+                cached_result = {
+                    "data": response.data,
+                    "status": response.status_code,
+                    "fresh_until": time.time() + timeout,
+                }
+                cache.set(key, cached_result, timeout + (stale_timeout or 0))
+                if local_timeout:
+                    local_cache.set(key, cached_result, local_timeout)
+                # Track the key under its paths and the tags of the view
+                request_path = path if path is not None else request.path
+                tag_cache_key(
+                    key,
+                    [
+                        *path_cache_tags(request_path, auth_header),
+                        *request_cache_tags(request, kwargs, kinds=tags or ()),
+                    ],
+                    timeout + (stale_timeout or 0),
+                )
+            return response
+
         @wraps(view_func)
         def _wrapped_view(instance, request, *args, **kwargs):
             # Function to generate cache key
@@ -34,19 +363,52 @@ def cache_response(timeout=60 * 60, path=None, user=True):
             )
             custom_path = path if path is not None else request.get_full_path()
             key = generate_cache_key(custom_path, auth_header)
+
+            # Serve the small hot responses from the process memory
+            if local_timeout:
+                local_result = local_cache.get(key)
+                if local_result is not None:
+                    cache_stats.record(name, "hit")
+                    return Response(local_result["data"], status=local_result["status"])
+
             cached_result = cache.get(key)
 
-            if cached_result is not None:
+            if cached_result is not None and (
+                stale_timeout is None
+                or cached_result.get("fresh_until", float("inf")) > time.time()
+            ):
+                cache_stats.record(name, "hit")
+                if local_timeout:
+                    local_cache.set(key, cached_result, local_timeout)
                 return Response(cached_result["data"], status=cached_result["status"])
-            response = view_func(instance, request, *args, **kwargs)
-            if response.status_code == 200 and not settings.DEBUG:
-                cache.set(
-                    key,
-                    {"data": response.data, "status": response.status_code},
-                    timeout,
-                )
 
-            return response
+            if cached_result is None and not single_flight and stale_timeout is None:
+                cache_stats.record(name, "miss")
+                return store(instance, request, key, auth_header, *args, **kwargs)
+
+            # Only the request holding the lock computes the value
+            if not acquire_cache_lock(key):
+                # Serve the stale value while the lock holder refreshes it
+                if cached_result is not None:
+                    cache_stats.record(name, "stale")
+                    return Response(
+                        cached_result["data"], status=cached_result["status"]
+                    )
+
+                cached_result = wait_for_cache(key)
+                if cached_result is not None:
+                    cache_stats.record(name, "hit")
+                    return Response(
+                        cached_result["data"], status=cached_result["status"]
+                    )
+                cache_stats.record(name, "miss")
+                return store(instance, request, key, auth_header, *args, **kwargs)
+
+            cache_stats.record(name, "miss")
+            try:
+                return store(instance, request, key, auth_header, *args, **kwargs)
+            finally:
+                release_cache_lock(key)
 
         return _wrapped_view
 
@@ -54,7 +416,7 @@ def cache_response(timeout=60 * 60, path=None, user=True):
 
 
 def invalidate_cache_directly(
-    path=None, url_params=False, user=True, request=None, multiple=False
+    path=None, url_params=False, user=True, request=None, multiple=False, tags=None
 ):
     if url_params and path:
         path_with_values = path
@@ -73,13 +435,25 @@ def invalidate_cache_directly(
     )
     key = generate_cache_key(custom_path, auth_header)
 
+    # Invalidate the tagged keys of the workspace, project or user
+    invalidation_tags = (
+        request_cache_tags(request, request.resolver_match.kwargs, kinds=tags)
+        if tags and request and request.resolver_match
+        else []
+    )
     if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
+        # Every cached variant (query params, users) of the path is tracked
+        # under the path tag, and so are its sub paths without an auth header
+        invalidation_tags.append(path_cache_tag(custom_path, auth_header))
     else:
         cache.delete(key)
+        publish_invalidation([key])
+    invalidate_cache_tags(*invalidation_tags)
 
 
-def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
+def invalidate_cache(
+    path=None, url_params=False, user=True, multiple=False, tags=None
+):
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped_view(instance, request, *args, **kwargs):
@@ -90,6 +464,7 @@ def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
                 user=user,
                 request=request,
                 multiple=multiple,
+                tags=tags,
             )
             return view_func(instance, request, *args, **kwargs)
 
@@ -0,0 +1,153 @@
+# Python imports
+import json
+from datetime import timedelta
+
+# Django imports
+from django.conf import settings
+from django.db.models import Count, Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import DashboardCounter, Issue, IssueAssignee
+
+COUNTER_FIELDS = (
+    "assigned_issues_count",
+    "pending_issues_count",
+    "created_issues_count",
+    "completed_issues_count",
+)
+
+# Issue fields whose update can change a counter
+COUNTED_ISSUE_FIELDS = {
+    "assignee_ids",
+    "state_id",
+    "target_date",
+    "archived_at",
+    "is_draft",
+    "project_id",
+}
+
+COUNTED_ACTIVITIES = {
+    "issue.activity.created",
+    "issue.activity.updated",
+    "issue.activity.deleted",
+    "intake.activity.created",
+}
+
+
+def compute_dashboard_counters(workspace_id, user_id):
+    """Count the overview issues of a user in a workspace in a single query"""
+    assigned = Q(assignees__in=[user_id])
+    return Issue.issue_objects.filter(
+        Q(
+            project__project_projectmember__role=5,
+            project__guest_view_all_features=True,
+        )
+        | Q(
+            project__project_projectmember__role=5,
+            project__guest_view_all_features=False,
+            created_by_id=user_id,
+        )
+        |
+        # For other roles (role < 5), show all issues
+        Q(project__project_projectmember__role__gt=5),
+        workspace_id=workspace_id,
+        project__project_projectmember__is_active=True,
+        project__project_projectmember__member_id=user_id,
+    ).aggregate(
+        assigned_issues_count=Count("id", filter=assigned, distinct=True),
+        pending_issues_count=Count(
+            "id",
+            filter=assigned
+            & ~Q(state__group__in=["completed", "cancelled"])
+            & Q(target_date__lt=timezone.now().date()),
+            distinct=True,
+        ),
+        created_issues_count=Count(
+            "id", filter=Q(created_by_id=user_id), distinct=True
+        ),
+        completed_issues_count=Count(
+            "id", filter=assigned & Q(state__group="completed"), distinct=True
+        ),
+    )
+
+
+def refresh_dashboard_counters(workspace_id, user_id):
+    """Recompute and store the counters of a user in a workspace"""
+    computed_at = timezone.now()
+    counters = compute_dashboard_counters(workspace_id, user_id)
+    DashboardCounter.objects.bulk_create(
+        [
+            DashboardCounter(
+                workspace_id=workspace_id,
+                user_id=user_id,
+                computed_at=computed_at,
+                **counters,
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["workspace", "user"],
+        update_fields=[*COUNTER_FIELDS, "computed_at", "updated_at"],
+    )
+    return counters
+
+
+def is_stale(counter):
+    now = timezone.now()
+    # The pending count depends on the current date
+    return counter.computed_at.date() != now.date() or (
+        now - counter.computed_at
+        > timedelta(seconds=settings.DASHBOARD_COUNTER_TIMEOUT)
+    )
+
+
+def get_dashboard_counters(workspace_id, user_id):
+    """
+    Return the counters of a user in a workspace, recomputed when missing or
+    stale
+
+    Issue changes refresh the stored counters of the affected users, the
+    timeout bounds the drift of the changes outside of issues such as roles
+    and project settings.
+    """
+    counter = DashboardCounter.objects.filter(
+        workspace_id=workspace_id, user_id=user_id
+    ).first()
+    if counter is None or is_stale(counter):
+        return refresh_dashboard_counters(workspace_id, user_id)
+    return {field: getattr(counter, field) for field in COUNTER_FIELDS}
+
+
+def refresh_issue_dashboard_counters(type, requested_data, issue_id):
+    """
+    Refresh the stored counters of the users an issue activity can change
+    the counts of, its current and former assignees and its creator
+    """
+    if type not in COUNTED_ACTIVITIES or issue_id is None:
+        return
+
+    if type == "issue.activity.updated":
+        requested_data = json.loads(requested_data) if requested_data else {}
+        if not COUNTED_ISSUE_FIELDS.intersection(requested_data):
+            return
+
+    issue = (
+        Issue.all_objects.filter(pk=issue_id)
+        .values("workspace_id", "created_by_id")
+        .first()
+    )
+    if issue is None:
+        return
+
+    user_ids = set(
+        IssueAssignee.all_objects.filter(issue_id=issue_id).values_list(
+            "assignee_id", flat=True
+        )
+    )
+    user_ids.add(issue["created_by_id"])
+
+    # Counters not stored yet are computed on their first read
+    for user_id in DashboardCounter.objects.filter(
+        workspace_id=issue["workspace_id"], user_id__in=user_ids
+    ).values_list("user_id", flat=True):
+        refresh_dashboard_counters(issue["workspace_id"], user_id)
@@ -0,0 +1,192 @@
+# Python imports
+import hashlib
+import json
+from collections import Counter
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models import Case, Count, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import Concat, ExtractMonth
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue
+from plane.utils.cache import cache_tag, invalidate_cache_tags, tag_cache_key
+
+OPEN_STATE_GROUPS = ["backlog", "unstarted", "started"]
+
+# Cached analytics of a workspace are tracked under this tag kind
+ANALYTICS_TAG = "analytics"
+
+# Activities of these kinds can change the analytics of a workspace
+ANALYTICS_ACTIVITY_KINDS = {"issue", "issue_draft", "intake", "cycle", "module"}
+
+USER_DETAILS = [
+    "created_by__first_name",
+    "created_by__last_name",
+    "created_by__display_name",
+    "created_by__id",
+]
+
+USER_ASSIGNEE_DETAILS = [
+    "assignees__first_name",
+    "assignees__last_name",
+    "assignees__display_name",
+    "assignees__id",
+]
+
+
+def avatar_url(user_field):
+    return Case(
+        # If `avatar_asset` exists, use it to generate the asset URL
+        When(
+            **{f"{user_field}__avatar_asset__isnull": False},
+            then=Concat(
+                Value("/api/assets/v2/static/"),
+                f"{user_field}__avatar_asset",
+                Value("/"),
+            ),
+        ),
+        # If `avatar_asset` is None, fall back to using `avatar` field directly
+        When(
+            **{f"{user_field}__avatar_asset__isnull": True},
+            then=f"{user_field}__avatar",
+        ),
+        default=Value(None),
+        output_field=models.CharField(),
+    )
+
+
+def add_points(total, points):
+    if points is None:
+        return total
+    return (total or 0) + points
+
+
+def compute_default_analytics(base_issues):
+    """
+    Compute the default analytics of the issues
+
+    The counts, estimate sums and month wise completions come out of a single
+    query grouped by state group and completion month, the user rankings out
+    of one query on the creators and one on the assignees.
+    """
+    current_year = timezone.now().year
+    groups = (
+        base_issues.annotate(
+            state_group=F("state__group"),
+            completed_month=Case(
+                When(
+                    completed_at__year=current_year,
+                    then=ExtractMonth("completed_at"),
+                ),
+                default=None,
+                output_field=IntegerField(),
+            ),
+        )
+        .values("state_group", "completed_month")
+        .annotate(count=Count("id"), points=Sum("point"))
+        .order_by()
+    )
+
+    total_issues = open_issues = 0
+    total_estimate_sum = open_estimate_sum = None
+    state_counts = Counter()
+    month_counts = Counter()
+    for group in groups:
+        total_issues += group["count"]
+        total_estimate_sum = add_points(total_estimate_sum, group["points"])
+        state_counts[group["state_group"]] += group["count"]
+        if group["state_group"] in OPEN_STATE_GROUPS:
+            open_issues += group["count"]
+            open_estimate_sum = add_points(open_estimate_sum, group["points"])
+        if group["completed_month"] is not None:
+            month_counts[group["completed_month"]] += group["count"]
+
+    most_issue_created_user = list(
+        base_issues.exclude(created_by=None)
+        .values(*USER_DETAILS)
+        .annotate(count=Count("id"))
+        .annotate(created_by__avatar_url=avatar_url("created_by"))
+        .order_by("-count")[:5]
+    )
+
+    assignees = list(
+        base_issues.values(*USER_ASSIGNEE_DETAILS)
+        .annotate(
+            closed=Count("id", filter=Q(completed_at__isnull=False)),
+            pending=Count("id", filter=Q(completed_at__isnull=True)),
+        )
+        .annotate(assignees__avatar_url=avatar_url("assignees"))
+        .order_by()
+    )
+
+    def assignee_ranking(count_field, rows):
+        return [
+            {
+                **{field: row[field] for field in USER_ASSIGNEE_DETAILS},
+                "assignees__avatar_url": row["assignees__avatar_url"],
+                "count": row[count_field],
+            }
+            for row in sorted(rows, key=lambda row: -row[count_field])
+            if row[count_field]
+        ]
+
+    return {
+        "total_issues": total_issues,
+        "total_issues_classified": [
+            {"state_group": state_group, "state_count": count}
+            for state_group, count in sorted(state_counts.items())
+        ],
+        "open_issues": open_issues,
+        "open_issues_classified": [
+            {"state_group": state_group, "state_count": count}
+            for state_group, count in sorted(state_counts.items())
+            if state_group in OPEN_STATE_GROUPS
+        ],
+        "issue_completed_month_wise": [
+            {"month": month, "count": count}
+            for month, count in sorted(month_counts.items())
+        ],
+        "most_issue_created_user": most_issue_created_user,
+        "most_issue_closed_user": assignee_ranking(
+            "closed", [row for row in assignees if row["assignees__id"] is not None]
+        )[:5],
+        "pending_issue_user": assignee_ranking("pending", assignees),
+        "open_estimate_sum": open_estimate_sum,
+        "total_estimate_sum": total_estimate_sum,
+    }
+
+
+def analytics_cache_tag(slug):
+    return cache_tag(ANALYTICS_TAG, slug)
+
+
+def default_analytics_cache_key(slug, filters):
+    filters_hash = hashlib.sha256(
+        json.dumps(filters, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"analytics:default:{slug}:{filters_hash}"
+
+
+def get_default_analytics(slug, filters):
+    """Return the default analytics of the workspace issues matching the filters"""
+    key = default_analytics_cache_key(slug, filters)
+    analytics = cache.get(key)
+    if analytics is None:
+        analytics = compute_default_analytics(
+            Issue.issue_objects.filter(workspace__slug=slug, **filters)
+        )
+        cache.set(key, analytics, settings.ANALYTICS_CACHE_TIMEOUT)
+        tag_cache_key(
+            key, [analytics_cache_tag(slug)], settings.ANALYTICS_CACHE_TIMEOUT
+        )
+    return analytics
+
+
+def invalidate_analytics_cache(type, slug):
+    """Drop the cached analytics of the workspace after an issue write"""
+    if type.split(".")[0] in ANALYTICS_ACTIVITY_KINDS:
+        invalidate_cache_tags(analytics_cache_tag(slug))
@@ -0,0 +1,395 @@
+# Python imports
+import json
+import re
+import struct
+import zlib
+from bisect import bisect_left
+
+# Django imports
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import BooleanField, ExpressionWrapper, Q, Subquery
+
+VERSION_FIELDS = (
+    "description_html",
+    "description_binary",
+    "description_json",
+    "description_stripped",
+)
+
+# Column values of a version stored as a delta
+EMPTY_VERSION = {
+    "description_html": "",
+    "description_binary": None,
+    "description_json": {},
+    "description_stripped": None,
+}
+
+# Tokens of at least 16 bytes ending after a space, tag, line or nul byte, so
+# that a local edit of a html or binary document leaves the tokens around it
+# unchanged
+TOKEN = re.compile(rb".{16,}?[ >\n\x00]|.+", re.DOTALL)
+
+# Consecutive tokens a copied range has to start with
+DELTA_ANCHOR_TOKENS = 4
+
+COPY = b"C"
+INSERT = b"I"
+
+
+def encode_document(values):
+    """Serialize the description fields of a version to a single byte string"""
+    parts = []
+    for field in VERSION_FIELDS:
+        value = values.get(field)
+        if value is None:
+            parts.append(struct.pack(">i", -1))
+            continue
+        if field == "description_json":
+            # jsonb reorders the keys, sorted a document read back encodes the same
+            value = json.dumps(value, sort_keys=True).encode()
+        elif isinstance(value, str):
+            value = value.encode()
+        else:
+            value = bytes(value)
+        parts.append(struct.pack(">i", len(value)))
+        parts.append(value)
+    return b"".join(parts)
+
+
+def decode_document(data):
+    values = {}
+    offset = 0
+    for field in VERSION_FIELDS:
+        (length,) = struct.unpack_from(">i", data, offset)
+        offset += 4
+        if length < 0:
+            values[field] = None
+            continue
+        value = data[offset : offset + length]
+        offset += length
+        if field == "description_json":
+            values[field] = json.loads(value)
+        elif field == "description_binary":
+            values[field] = value
+        else:
+            values[field] = value.decode()
+    return values
+
+
+def common_prefix_length(source, target):
+    # Binary search on slice comparisons keeps the scan in C
+    low, high = 0, min(len(source), len(target))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if source[:middle] == target[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def tokenize(data):
+    return TOKEN.findall(data)
+
+
+def match_tokens(source_tokens, target_tokens):
+    """
+    Yield the (target start, target end, source start, source end) token ranges
+    copied from the source
+
+    Copies start on runs of DELTA_ANCHOR_TOKENS tokens. A run found several
+    times in the source is taken at the occurrence closest to where the last
+    copy left off, so that repeated text does not scatter the copies, and
+    copies are then extended both ways.
+    """
+    positions = {}
+    for j in range(len(source_tokens) - DELTA_ANCHOR_TOKENS + 1):
+        positions.setdefault(
+            b"".join(source_tokens[j : j + DELTA_ANCHOR_TOKENS]), []
+        ).append(j)
+
+    i = 0
+    copied = 0
+    # Source position following the last copy, shifted by the skipped tokens
+    expected = 0
+    while i < len(target_tokens):
+        anchor = target_tokens[i : i + DELTA_ANCHOR_TOKENS]
+        if source_tokens[expected : expected + DELTA_ANCHOR_TOKENS] == anchor:
+            j = expected
+        else:
+            candidates = positions.get(b"".join(anchor))
+            if candidates is None:
+                i += 1
+                expected += 1
+                continue
+            nearest = bisect_left(candidates, expected)
+            j = min(
+                candidates[max(nearest - 1, 0) : nearest + 1],
+                key=lambda candidate: abs(candidate - expected),
+            )
+
+        start_i, start_j = i, j
+        while (
+            start_i > copied
+            and start_j > 0
+            and target_tokens[start_i - 1] == source_tokens[start_j - 1]
+        ):
+            start_i -= 1
+            start_j -= 1
+        while (
+            i < len(target_tokens)
+            and j < len(source_tokens)
+            and target_tokens[i] == source_tokens[j]
+        ):
+            i += 1
+            j += 1
+        copied = i
+        expected = j
+        yield start_i, i, start_j, j
+
+
+def compute_delta(source, target):
+    """
+    Return the compressed instructions building target out of source
+
+    The common prefix and suffix are matched first, the changed middle is then
+    matched greedily token by token in linear time.
+    """
+    prefix = common_prefix_length(source, target)
+    suffix = common_prefix_length(source[prefix:][::-1], target[prefix:][::-1])
+
+    ops = []
+
+    def copy(start, end):
+        # Contiguous copies are merged into one instruction
+        if ops and ops[-1][0] == COPY and ops[-1][2] == start:
+            ops[-1] = (COPY, ops[-1][1], end)
+        elif end > start:
+            ops.append((COPY, start, end))
+
+    def insert(data):
+        if data:
+            ops.append((INSERT, data))
+
+    copy(0, prefix)
+    source_middle = source[prefix : len(source) - suffix]
+    target_middle = target[prefix : len(target) - suffix]
+    if source_middle and target_middle:
+        source_tokens = tokenize(source_middle)
+        target_tokens = tokenize(target_middle)
+        source_offsets = [prefix]
+        for token in source_tokens:
+            source_offsets.append(source_offsets[-1] + len(token))
+        target_offsets = [0]
+        for token in target_tokens:
+            target_offsets.append(target_offsets[-1] + len(token))
+
+        inserted = 0
+        for i1, i2, j1, j2 in match_tokens(source_tokens, target_tokens):
+            insert(target_middle[target_offsets[inserted] : target_offsets[i1]])
+            copy(source_offsets[j1], source_offsets[j2])
+            inserted = i2
+        insert(target_middle[target_offsets[inserted] :])
+    else:
+        insert(target_middle)
+    copy(len(source) - suffix, len(source))
+
+    encoded = []
+    for op in ops:
+        if op[0] == COPY:
+            encoded.append(COPY + struct.pack(">II", op[1], op[2] - op[1]))
+        else:
+            encoded.append(INSERT + struct.pack(">I", len(op[1])) + op[1])
+    return zlib.compress(b"".join(encoded))
+
+
+def apply_delta(source, delta):
+    """Build the target of a delta out of its source"""
+    data = zlib.decompress(delta)
+    parts = []
+    offset = 0
+    while offset < len(data):
+        op = data[offset : offset + 1]
+        offset += 1
+        if op == COPY:
+            start, length = struct.unpack_from(">II", data, offset)
+            offset += 8
+            parts.append(source[start : start + length])
+        else:
+            (length,) = struct.unpack_from(">I", data, offset)
+            offset += 4
+            parts.append(data[offset : offset + length])
+            offset += length
+    return b"".join(parts)
+
+
+def get_version_values(version):
+    return {field: getattr(version, field) for field in VERSION_FIELDS}
+
+
+def ordered_versions(model, parent_field, parent_id):
+    return model.objects.filter(**{parent_field: parent_id}).order_by("-created_at")
+
+
+def get_version_content(version, parent_field):
+    """
+    Return the description fields of a version
+
+    The latest version of a parent is stored in full, older ones as a delta
+    against the next newer version, with a full snapshot every
+    DESCRIPTION_VERSION_SNAPSHOT_INTERVAL versions bounding the chain to walk.
+    """
+    if version.description_delta is None:
+        return get_version_values(version)
+
+    newer = list(
+        ordered_versions(
+            version.__class__, parent_field, getattr(version, parent_field)
+        )
+        .filter(created_at__gt=version.created_at)
+        .reverse()
+        .only("description_delta", *VERSION_FIELDS)
+    )
+    chain = [version]
+    for row in newer:
+        if row.description_delta is None:
+            document = encode_document(get_version_values(row))
+            break
+        chain.append(row)
+    else:
+        raise ValueError(f"Version {version.pk} has no full snapshot to rebuild from")
+
+    for row in reversed(chain):
+        document = apply_delta(document, bytes(row.description_delta))
+    return decode_document(document)
+
+
+def materialize_version(version, parent_field):
+    """Fill the description fields of a version stored as a delta"""
+    for field, value in get_version_content(version, parent_field).items():
+        setattr(version, field, value)
+    return version
+
+
+def lock_versions(model, parent_id):
+    """
+    Serialize the version writers of a parent until the end of the transaction
+
+    An advisory lock on the parent id is taken rather than a row lock, so that
+    the saves of the page or issue itself are never blocked by a writer.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(%s))",
+            [f"{model._meta.db_table}:{parent_id}"],
+        )
+
+
+def store_as_delta(version, newer, parent_field):
+    """
+    Replace the full description of a version with a delta against the newer
+    version, unless it has to stay a snapshot
+
+    The delta is computed without holding the lock, it is only written if
+    neither version was rewritten in the meantime.
+    """
+    model = version.__class__
+    parent_id = getattr(version, parent_field)
+    interval = settings.DESCRIPTION_VERSION_SNAPSHOT_INTERVAL
+    # Consecutive deltas right before this version all walk through it
+    older = list(
+        ordered_versions(model, parent_field, parent_id)
+        .filter(created_at__lt=version.created_at)
+        .annotate(
+            is_delta=ExpressionWrapper(
+                Q(description_delta__isnull=False), output_field=BooleanField()
+            )
+        )
+        .values_list("is_delta", flat=True)[: interval - 1]
+    )
+    run = 0
+    for is_delta in older:
+        if not is_delta:
+            break
+        run += 1
+    if run + 1 >= interval:
+        return
+
+    newer_document = encode_document(get_version_values(newer))
+    document = encode_document(get_version_values(version))
+    delta = compute_delta(newer_document, document)
+    # Documents rewritten as a whole are cheaper to keep in full
+    if len(delta) * 2 > len(zlib.compress(document)):
+        return
+
+    with transaction.atomic():
+        lock_versions(model, parent_id)
+        current = {
+            row.pop("pk"): encode_document(row)
+            for row in model.objects.filter(
+                pk__in=[version.pk, newer.pk], description_delta__isnull=True
+            ).values("pk", *VERSION_FIELDS)
+        }
+        if current != {version.pk: document, newer.pk: newer_document}:
+            return
+        model.objects.filter(pk=version.pk).update(
+            description_delta=delta, **EMPTY_VERSION
+        )
+
+
+def add_version(model, parent_field, parent_id, values, **fields):
+    """
+    Create the latest version of a parent in full and store the previous
+    latest version as a delta against it
+    """
+    with transaction.atomic():
+        # Versions of a parent are chained, writers are serialized on the parent
+        lock_versions(model, parent_id)
+        previous = ordered_versions(model, parent_field, parent_id).first()
+        version = model.objects.create(**{parent_field: parent_id}, **values, **fields)
+    if previous is not None and previous.description_delta is None:
+        store_as_delta(previous, version, parent_field)
+    return version
+
+
+def update_latest_version(version, values, parent_field, **fields):
+    """
+    Overwrite the description of the latest version, rebasing the delta of the
+    version before it on the new description
+    """
+    model = version.__class__
+    with transaction.atomic():
+        lock_versions(model, getattr(version, parent_field))
+        # The fields of a delta row are empty, the delta would stay in use
+        if model.objects.filter(
+            pk=version.pk, description_delta__isnull=False
+        ).exists():
+            raise ValueError(f"Version {version.pk} is stored as a delta")
+        document = encode_document(get_version_values(version))
+        for field, value in {**values, **fields}.items():
+            setattr(version, field, value)
+        version.save(update_fields=[*values, *fields])
+
+        previous = (
+            ordered_versions(model, parent_field, getattr(version, parent_field))
+            .filter(created_at__lt=version.created_at)
+            .first()
+        )
+        if previous is not None and previous.description_delta is not None:
+            model.objects.filter(pk=previous.pk).update(
+                description_delta=compute_delta(
+                    encode_document(get_version_values(version)),
+                    apply_delta(document, bytes(previous.description_delta)),
+                )
+            )
+    return version
+
+
+def prune_versions(model, parent_field, parent_id, keep):
+    """Delete the versions older than the latest keep ones in one statement"""
+    versions = ordered_versions(model, parent_field, parent_id)
+    # Older versions only depend on newer ones, the kept chain stays complete
+    return versions.filter(
+        created_at__lt=Subquery(versions.values("created_at")[keep - 1 : keep])
+    ).delete()
@@ -1,6 +1,17 @@
 # python imports
 from math import ceil
 
+# Third party imports
+from rest_framework.exceptions import ParseError
+
+# Module imports
+from plane.utils.paginator import (
+    COUNT_EXACT,
+    KeysetCursor,
+    get_total_count,
+    keyset_filter,
+)
+
 # constants
 PAGINATOR_MAX_LIMIT = 1000
 
@@ -26,12 +37,89 @@ class PaginateCursor:
             raise ValueError(f"Invalid cursor format: {e}")
 
 
-def paginate(base_queryset, queryset, cursor, on_result):
+def keyset_paginate(
+    base_queryset, queryset, cursor, on_result, order_by, count_mode=COUNT_EXACT
+):
+    # Keyset cursors only move forward, the order key is always ascending
+    try:
+        cursor_object = (
+            KeysetCursor.from_string(cursor)
+            if cursor
+            else KeysetCursor(PAGINATOR_MAX_LIMIT)
+        )
+    except ValueError:
+        raise ParseError(detail="Invalid cursor parameter.")
+    page_size = min(cursor_object.value, PAGINATOR_MAX_LIMIT)
+
+    # Order by the key with created_at and id as the tie breakers
+    queryset = queryset.order_by(order_by, "-created_at", "-id")
+    if cursor_object.position is not None:
+        queryset = queryset.filter(
+            keyset_filter(cursor_object.position, order_key=order_by)
+        )
+
+    # Fetch the positions of the page along with one extra row
+    positions = list(
+        queryset.values_list(order_by, "created_at", "id")[: page_size + 1]
+    )
+    next_page_results = len(positions) > page_size
+    positions = positions[:page_size]
+
+    paginated_data = queryset[:page_size]
+    if on_result:
+        paginated_data = on_result(paginated_data)
+
+    next_cursor = None
+    if next_page_results:
+        next_cursor = str(KeysetCursor(page_size, positions[-1]))
+
+    # getting the issues count
+    total_results = get_total_count(base_queryset, count_mode)
+    total_pages = (
+        ceil(total_results / page_size) if total_results is not None else None
+    )
+
+    return {
+        "prev_cursor": None,
+        "cursor": str(cursor_object),
+        "next_cursor": next_cursor,
+        "prev_page_results": cursor_object.position is not None,
+        "next_page_results": next_page_results,
+        "page_count": len(paginated_data),
+        "total_results": total_results,
+        "total_pages": total_pages,
+        "results": paginated_data,
+    }
+
+
+def paginate(
+    base_queryset,
+    queryset,
+    cursor,
+    on_result,
+    order_by=None,
+    keyset=False,
+    count_mode=COUNT_EXACT,
+):
+    # Keyset pagination for the opted in requests and keyset cursors
+    if order_by and (keyset or (cursor and KeysetCursor.is_keyset(cursor))):
+        return keyset_paginate(
+            base_queryset=base_queryset,
+            queryset=queryset,
+            cursor=cursor,
+            on_result=on_result,
+            order_by=order_by,
+            count_mode=count_mode,
+        )
+
     # validating for cursor
     if cursor is None:
         cursor_object = PaginateCursor(PAGINATOR_MAX_LIMIT, 0, 0)
     else:
-        cursor_object = PaginateCursor.from_string(cursor)
+        try:
+            cursor_object = PaginateCursor.from_string(cursor)
+        except ValueError:
+            raise ParseError(detail="Invalid cursor parameter.")
 
     # getting the issues count
     total_results = base_queryset.count()
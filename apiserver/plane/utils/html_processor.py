@@ -25,3 +25,29 @@ def strip_tags(html):
     s = MLStripper()
     s.feed(html)
     return s.get_data()
+
+
+class ComponentParser(MLStripper):
+    """
+    Collects the attributes of the given component tags while stripping the
+    markup, in a single pass over the html
+    """
+
+    def __init__(self, tags):
+        super().__init__()
+        self.components = {tag: [] for tag in tags}
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.components:
+            self.components[tag].append(dict(attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+
+def parse_html(html, tags):
+    """Return the stripped text and the attributes of each component tag"""
+    parser = ComponentParser(tags)
+    parser.feed(html or "")
+    parser.close()
+    return parser.get_data(), parser.components
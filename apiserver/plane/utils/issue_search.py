@@ -5,16 +5,41 @@ import re
 from django.db.models import Q
 
 # Module imports
+from plane.db.models import Project
+from plane.utils.search import search_query, search_rank, with_search_vector
 
 
-def search_issues(query, queryset):
-    fields = ["name", "sequence_id", "project__identifier"]
-    q = Q()
-    for field in fields:
-        if field == "sequence_id" and len(query) <= 20:
-            sequences = re.findall(r"\b\d+\b", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(q).distinct()
+def issue_search_filter(query, text_query, slug):
+    """
+    Match the issues whose name or description has words starting with the
+    words of the query, whose sequence id is a number of the query or whose
+    project identifier contains the query
+    """
+    # The projects are resolved up front so that every branch of the filter
+    # is an index condition the planner can combine with the vector index
+    project_ids = list(
+        Project.objects.filter(
+            workspace__slug=slug, identifier__icontains=query
+        ).values_list("id", flat=True)
+    )
+    q = Q(project_id__in=project_ids) if project_ids else Q(pk__in=[])
+    if len(query) <= 20:
+        # Match whole integers only (exclude decimal numbers)
+        for sequence_id in re.findall(r"\b\d+\b", query):
+            q |= Q(sequence_id=sequence_id)
+
+    if text_query is not None:
+        q |= Q(search_vector=text_query)
+    return q
+
+
+def search_issues(query, queryset, slug):
+    """Filter the issues of the workspace matching the query, best ranked first"""
+    text_query = search_query(query)
+    return (
+        with_search_vector(queryset)
+        .filter(issue_search_filter(query, text_query, slug))
+        .annotate(search_rank=search_rank(text_query))
+        .order_by("-search_rank", "-created_at")
+        .distinct()
+    )
@@ -1,10 +1,15 @@
 # Python imports
+import base64
+import datetime
+import json
 import math
 from collections import defaultdict
 from collections.abc import Sequence
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Q, Value, When, Window
 from django.db.models.functions import RowNumber
 
 # Third party imports
@@ -55,6 +60,165 @@ class Cursor:
             raise ValueError(f"Invalid cursor format: {e}")
 
 
+class KeysetPositionEncoder(DjangoJSONEncoder):
+    """Keep the microseconds that DjangoJSONEncoder drops from datetimes"""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetCursor:
+    """
+    Cursor pointing at the sort position of the last row of a page
+    The position is the (order_key, created_at, id) tuple of the boundary row
+    encoded as url safe base64 json and prefixed with `k`
+    http://example.com/api/issues/?cursor=100:k<position>:0&per_page=100
+    """
+
+    prefix = "k"
+
+    def __init__(self, value, position=None, is_prev=False, has_results=None):
+        self.value = int(value)
+        self.position = tuple(position) if position is not None else None
+        self.is_prev = bool(is_prev)
+        self.has_results = has_results
+
+    # Return the cursor value in string format
+    def __str__(self):
+        token = ""
+        if self.position is not None:
+            token = (
+                base64.urlsafe_b64encode(
+                    json.dumps(self.position, cls=KeysetPositionEncoder).encode()
+                )
+                .decode()
+                .rstrip("=")
+            )
+        return f"{self.value}:{self.prefix}{token}:{int(self.is_prev)}"
+
+    def __eq__(self, other):
+        return all(
+            getattr(self, attr) == getattr(other, attr, None)
+            for attr in ("value", "position", "is_prev", "has_results")
+        )
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}: value={self.value} "
+            f"position={self.position}, is_prev={int(self.is_prev)}"
+        )
+
+    def __bool__(self):
+        return bool(self.has_results)
+
+    @classmethod
+    def is_keyset(cls, value):
+        """Check if the cursor string is in the keyset format"""
+        bits = str(value).split(":")
+        return len(bits) == 3 and bits[1].startswith(cls.prefix)
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the cursor value from string format"""
+        try:
+            bits = value.split(":")
+            if len(bits) != 3 or not bits[1].startswith(cls.prefix):
+                raise ValueError(
+                    "Cursor must be in the format 'value:k<position>:is_prev'"
+                )
+
+            token = bits[1][len(cls.prefix) :]
+            position = None
+            if token:
+                position = json.loads(
+                    base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+                )
+                if not isinstance(position, list) or len(position) != 3:
+                    raise ValueError("Cursor position must have three values")
+            return cls(int(bits[0]), position, bool(int(bits[2])))
+        except (TypeError, ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
+def keyset_filter(position, order_key=None, desc=False, forward=True):
+    """
+    Build the seek condition for rows after (or before) the given position
+    The rows are expected to be ordered by the order key with nulls last,
+    then by `-created_at` and `-id` as the tie breakers
+    """
+    key_value, created_at, pk = position
+
+    # Tie breakers are always descending
+    ties = (
+        Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        if forward
+        else Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+    )
+
+    if not order_key or order_key == "created_at":
+        return ties
+
+    # Comparison that moves away from the position in the requested direction
+    lookup = "lt" if desc == forward else "gt"
+    if key_value is None:
+        # Nulls are sorted last so every non null value comes before them
+        if forward:
+            return Q(**{f"{order_key}__isnull": True}) & ties
+        return Q(**{f"{order_key}__isnull": False}) | (
+            Q(**{f"{order_key}__isnull": True}) & ties
+        )
+
+    condition = Q(**{f"{order_key}__{lookup}": key_value}) | (
+        Q(**{order_key: key_value}) & ties
+    )
+    if forward:
+        condition |= Q(**{f"{order_key}__isnull": True})
+    return condition
+
+
+def estimate_count(queryset):
+    """
+    Return the planner estimate of the number of rows in the queryset
+    Unfiltered querysets use `pg_class.reltuples` and filtered ones use the
+    row estimate of the query plan, so no scan is done in either case
+    """
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # reltuples is -1 for tables that were never analyzed
+            if row and row[0] >= 0:
+                return int(row[0])
+
+        sql, params = queryset.query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# Total count modes
+COUNT_EXACT = "exact"
+COUNT_ESTIMATED = "estimated"
+COUNT_NONE = "none"
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATED, COUNT_NONE)
+
+
+def get_total_count(queryset, count_mode=COUNT_EXACT):
+    """Return the total count of the queryset according to the count mode"""
+    if count_mode == COUNT_NONE:
+        return None
+    if count_mode == COUNT_ESTIMATED:
+        return estimate_count(queryset)
+    return queryset.count()
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -93,8 +257,13 @@ class OffsetPaginator:
     with cursor controls
     http://example.com/api/users/?cursor=10.0.0&per_page=10
     cursor=limit,offset=page,
+    Passing a KeysetCursor switches to seek pagination on the
+    (order_key, created_at, id) position instead of the offset
     """
 
+    # Whether the paginator accepts keyset cursors
+    supports_keyset = True
+
     def __init__(
         self,
         queryset,
@@ -102,6 +271,7 @@ class OffsetPaginator:
         max_limit=MAX_LIMIT,
         max_offset=None,
         on_results=None,
+        count_mode=COUNT_EXACT,
     ):
         # Key tuple and remove `-` if descending order by
         self.key = (
@@ -115,8 +285,13 @@ class OffsetPaginator:
         self.max_limit = max_limit
         self.max_offset = max_offset
         self.on_results = on_results
+        self.count_mode = count_mode
 
     def get_result(self, limit=1000, cursor=None):
+        # Seek pagination for keyset cursors
+        if isinstance(cursor, KeysetCursor):
+            return self.get_keyset_result(limit=limit, cursor=cursor)
+
         # offset is page #
         # value is page limit
         if cursor is None:
@@ -164,10 +339,10 @@ class OffsetPaginator:
             results = self.on_results(results)
 
         # Count the queryset
-        count = queryset.count()
+        count = get_total_count(queryset, self.count_mode)
 
         # Optionally, calculate the total count and max_hits if needed
-        max_hits = math.ceil(count / limit)
+        max_hits = math.ceil(count / limit) if count is not None else None
 
         # Return the cursor results
         return CursorResult(
@@ -178,11 +353,191 @@ class OffsetPaginator:
             max_hits=max_hits,
         )
 
+    def get_keyset_result(self, limit=1000, cursor=None):
+        # Get the min from limit and max limit
+        limit = min(limit, cursor.value or limit, self.max_limit)
+        order_key = self.key[0] if self.key else None
+
+        # Order by the key with created_at and id as unique tie breakers
+        ordering = [F("created_at").desc(), F("id").desc()]
+        if order_key:
+            ordering.insert(
+                0,
+                (
+                    F(order_key).desc(nulls_last=True)
+                    if self.desc
+                    else F(order_key).asc(nulls_last=True)
+                ),
+            )
+        queryset = self.queryset.order_by(*ordering)
+
+        # Seek to the position of the cursor
+        page_queryset = queryset
+        if cursor.position is not None:
+            page_queryset = queryset.filter(
+                keyset_filter(
+                    cursor.position,
+                    order_key=order_key,
+                    desc=self.desc,
+                    forward=not cursor.is_prev,
+                )
+            )
+        if cursor.is_prev:
+            page_queryset = page_queryset.reverse()
+
+        # Fetch the positions of the page along with one extra row
+        if order_key and order_key != "created_at":
+            positions = list(
+                page_queryset.values_list(order_key, "created_at", "id")[: limit + 1]
+            )
+        else:
+            positions = [
+                (created_at if order_key else None, created_at, pk)
+                for created_at, pk in page_queryset.values_list("created_at", "id")[
+                    : limit + 1
+                ]
+            ]
+        has_more = len(positions) > limit
+        positions = positions[:limit]
+        if cursor.is_prev:
+            # Load the page in the forward order
+            positions.reverse()
+            results = queryset.filter(pk__in=[position[2] for position in positions])
+        else:
+            results = page_queryset[:limit]
+
+        first = positions[0] if positions else None
+        last = positions[-1] if positions else None
+
+        # Adjust cursors based on the boundary rows of the page
+        next_cursor = KeysetCursor(
+            limit,
+            last if last else cursor.position,
+            False,
+            has_more if not cursor.is_prev else cursor.position is not None,
+        )
+        prev_cursor = KeysetCursor(
+            limit,
+            first if first else cursor.position,
+            True,
+            has_more if cursor.is_prev else cursor.position is not None,
+        )
+
+        # Process the results
+        if self.on_results:
+            results = self.on_results(results)
+
+        # Count the queryset
+        count = get_total_count(self.queryset, self.count_mode)
+        max_hits = math.ceil(count / limit) if count is not None else None
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=max_hits,
+        )
+
     def process_results(self, results):
         raise NotImplementedError
 
 
+def fetch_grouped_page(queryset, group_fields, offset, stop):
+    """
+    Fetch the windowed page rows and the per group totals in a single query
+    The queryset must be a values queryset annotated with `counted` and a
+    `row_number` window partitioned by the group fields. Every non empty
+    partition returns at least one row so that its totals are known even when
+    none of its rows fall on the page.
+    Returns the page rows, the distinct counted totals for every group level
+    keyed by the stringified group values, the largest partition size and the
+    total number of rows.
+    """
+    qn = connection.ops.quote_name
+    query = queryset.query
+    names = [*query.extra_select, *query.values_select, *query.annotation_select]
+    sql, params = query.sql_with_params()
+
+    # One totals CTE per group level, the last level matches the window partition.
+    # Each group value also gets a text key and a null flag, so the levels and the
+    # page rows are joined on plain equalities that hash instead of on
+    # IS NOT DISTINCT FROM, which nests loops over every group of the board
+    levels = [group_fields[: index + 1] for index in range(len(group_fields))]
+    ctes = [f"page_rows ({', '.join(qn(name) for name in names)}) AS ({sql})"]
+    for index, fields in enumerate(levels):
+        columns = ", ".join(
+            f"{qn(field)} AS g{position}, "
+            f"COALESCE({qn(field)}::text, '') AS k{position}, "
+            f"{qn(field)} IS NULL AS n{position}"
+            for position, field in enumerate(fields)
+        )
+        ctes.append(
+            f"level_{index} AS (SELECT {columns}, "
+            f"COUNT(DISTINCT {qn('id')}) FILTER (WHERE {qn('counted')} = 1) AS total, "
+            f"MAX({qn('row_number')}) AS max_row_number, "
+            f"SUM(COUNT(*)) OVER () AS total_rows "
+            f"FROM page_rows GROUP BY {', '.join(qn(field) for field in fields)})"
+        )
+
+    last = len(levels) - 1
+    joins = "".join(
+        f" JOIN level_{index} ON "
+        + " AND ".join(
+            f"level_{index}.k{position} = level_{last}.k{position} "
+            f"AND level_{index}.n{position} = level_{last}.n{position}"
+            for position in range(index + 1)
+        )
+        for index in range(last)
+    )
+    page_join = " AND ".join(
+        f"COALESCE(page_rows.{qn(field)}::text, '') = level_{last}.k{position} "
+        f"AND (page_rows.{qn(field)} IS NULL) = level_{last}.n{position}"
+        for position, field in enumerate(group_fields)
+    )
+    extra_columns = ", ".join(
+        [f"level_{last}.g{position}" for position in range(len(group_fields))]
+        + [f"level_{index}.total" for index in range(len(levels))]
+        + [f"level_{last}.max_row_number", "level_0.total_rows"]
+    )
+    sql = (
+        f"WITH {', '.join(ctes)} "
+        f"SELECT {', '.join(f'page_rows.{qn(name)}' for name in names)}, "
+        f"{extra_columns} FROM level_{last}{joins} "
+        f"LEFT JOIN page_rows ON {page_join} "
+        f"AND page_rows.{qn('row_number')} > %s AND page_rows.{qn('row_number')} < %s "
+        f"ORDER BY page_rows.{qn('row_number')} NULLS LAST"
+    )
+
+    results = []
+    totals = [{} for _ in levels]
+    max_row_number = 0
+    total_rows = 0
+    with connection.cursor() as cursor:
+        cursor.execute(sql, (*params, offset, stop))
+        for row in cursor.fetchall():
+            values = row[len(names) :]
+            group_values = [str(value) for value in values[: len(group_fields)]]
+            for index in range(len(levels)):
+                totals[index][tuple(group_values[: index + 1])] = values[
+                    len(group_fields) + index
+                ]
+            max_row_number = max(max_row_number, values[-2] or 0)
+            total_rows = values[-1] or 0
+
+            # Rows without a row number only carry the totals of their partition
+            result = dict(zip(names, row[: len(names)]))
+            if result["row_number"] is not None:
+                result.pop("row_number")
+                result.pop("counted")
+                results.append(result)
+
+    return results, totals, max_row_number, int(total_rows)
+
+
 class GroupedOffsetPaginator(OffsetPaginator):
+    supports_keyset = False
+
     # Field mappers - list m2m fields here
     FIELD_MAPPER = {
         "labels__id": "label_ids",
@@ -208,6 +563,58 @@ class GroupedOffsetPaginator(OffsetPaginator):
         self.group_by_fields = group_by_fields
         # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
         self.count_filter = count_filter
+        # Group totals computed along with the page rows
+        self.total_group_dict = {}
+
+    def get_group_fields(self):
+        return [self.group_by_field_name]
+
+    def get_page_queryset(self):
+        # Flag the rows that are counted in the group totals
+        counted = (
+            Case(
+                When(self.count_filter, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+            if self.count_filter is not None
+            else Value(1, output_field=IntegerField())
+        )
+        # Create window for all the groups
+        queryset = self.queryset.annotate(
+            counted=counted,
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=[F(field) for field in self.get_group_fields()],
+                order_by=(
+                    (
+                        F(*self.key).desc(
+                            nulls_last=True
+                        )  # order by desc if desc is set
+                        if self.desc
+                        else F(*self.key).asc(nulls_last=True)  # Order by asc if set
+                    ),
+                    F("created_at").desc(),
+                ),
+            ),
+        )
+
+        # Select the fields of the results along with the window values
+        results = self.on_results(queryset) if self.on_results else queryset.values()
+        fields = list(results._fields) or [
+            *results.query.values_select,
+            *results.query.annotation_select,
+        ]
+        fields.extend(field for field in self.get_group_fields() if field not in fields)
+        # The values of on_results mask the window annotations, unmask them to
+        # select them along with the fields
+        results = results.order_by()
+        results.query.set_annotation_mask(None)
+        return results.values(
+            *[field for field in fields if field not in ("counted", "row_number")],
+            "counted",
+            "row_number",
+        )
 
     def get_result(self, limit=50, cursor=None):
         # offset is page #
@@ -217,9 +624,6 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
         limit = min(limit, self.max_limit)
 
-        # Adjust the initial offset and stop based on the cursor and limit
-        queryset = self.queryset
-
         page = cursor.offset
         offset = cursor.offset * cursor.value
         stop = offset + (cursor.value or limit) + 1
@@ -232,55 +636,22 @@ class GroupedOffsetPaginator(OffsetPaginator):
         if offset < 0:
             raise BadPaginationError("Pagination offset cannot be negative")
 
-        # Compute the results
-        results = {}
-        # Create window for all the groups
-        queryset = queryset.annotate(
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[F(self.group_by_field_name)],
-                order_by=(
-                    (
-                        F(*self.key).desc(
-                            nulls_last=True
-                        )  # order by desc if desc is set
-                        if self.desc
-                        else F(*self.key).asc(nulls_last=True)  # Order by asc if set
-                    ),
-                    F("created_at").desc(),
-                ),
-            )
-        )
-        # Filter the results by row number
-        results = queryset.filter(row_number__gt=offset, row_number__lt=stop).order_by(
-            (
-                F(*self.key).desc(nulls_last=True)
-                if self.desc
-                else F(*self.key).asc(nulls_last=True)
-            ),
-            F("created_at").desc(),
+        # Compute the page rows and the group totals in one query
+        results, totals, max_row_number, count = fetch_grouped_page(
+            self.get_page_queryset(), self.get_group_fields(), offset, stop
         )
+        self.set_totals(totals)
 
         # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(
-            limit, page + 1, False, queryset.filter(row_number__gte=stop).exists()
-        )
+        next_cursor = Cursor(limit, page + 1, False, max_row_number >= stop)
 
         # Add previous cursors
         prev_cursor = Cursor(limit, page - 1, True, page > 0)
 
-        # Count the queryset
-        count = queryset.count()
-
         # Optionally, calculate the total count and max_hits if needed
         # This might require adjustments based on specific use cases
         if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
+            max_hits = math.ceil(max(totals[0].values()) / limit)
         else:
             max_hits = 0
         return CursorResult(
@@ -291,50 +662,29 @@ class GroupedOffsetPaginator(OffsetPaginator):
             max_hits=max_hits,
         )
 
-    def __get_total_queryset(self):
-        # Get total items for each group
-        return (
-            self.queryset.values(self.group_by_field_name)
-            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-            .order_by()
-        )
-
-    def __get_total_dict(self):
-        # Convert the total into dictionary of keys as group name and value as the total
-        total_group_dict = {}
-        for group in self.__get_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = (
-                total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
-                + (1 if group.get("count") == 0 else group.get("count"))
-            )
-        return total_group_dict
+    def set_totals(self, totals):
+        # Groups with no counted rows are still reported with one result
+        self.total_group_dict = {
+            group: (1 if count == 0 else count) for (group,), count in totals[0].items()
+        }
 
     def __get_field_dict(self):
         # Create a field dictionary
-        total_group_dict = self.__get_total_dict()
         return {
             str(field): {
                 "results": [],
-                "total_results": total_group_dict.get(str(field), 0),
+                "total_results": self.total_group_dict.get(str(field), 0),
             }
             for field in self.group_by_fields
         }
 
-    def __result_already_added(self, result, group):
-        # Check if the result is already added then add it
-        for existing_issue in group:
-            if existing_issue["id"] == result["id"]:
-                return True
-        return False
-
     def __query_multi_grouper(self, results):
-        # Grouping for m2m values
-        total_group_dict = self.__get_total_dict()
-
         # Preparing a dict to keep track of group IDs associated with each entity ID
         result_group_mapping = defaultdict(set)
         # Preparing a dict to group result by group ID
         grouped_by_field_name = defaultdict(list)
+        # Track the results already added to each group
+        added_results = defaultdict(set)
 
         # Iterate over results to fill the above dictionaries
         for result in results:
@@ -344,23 +694,22 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
         # Adding group_ids key to each issue and grouping by group_name
         for result in results:
-            result_id = result["id"]
-            group_ids = list(result_group_mapping[str(result_id)])
+            result_id = str(result["id"])
+            group_ids = list(result_group_mapping[result_id])
             result[self.FIELD_MAPPER.get(self.group_by_field_name)] = (
                 [] if "None" in group_ids else group_ids
             )
             # If a result belongs to multiple groups, add it to each group
             for group_id in group_ids:
-                if not self.__result_already_added(
-                    result, grouped_by_field_name[group_id]
-                ):
+                if result_id not in added_results[group_id]:
+                    added_results[group_id].add(result_id)
                     grouped_by_field_name[group_id].append(result)
 
         # Convert grouped_by_field_name back to a list for each group
         processed_results = {
             str(group_id): {
                 "results": issues,
-                "total_results": total_group_dict.get(str(group_id)),
+                "total_results": self.total_group_dict.get(str(group_id)),
             }
             for group_id, issues in grouped_by_field_name.items()
         }
@@ -388,7 +737,7 @@ class GroupedOffsetPaginator(OffsetPaginator):
         return processed_results
 
 
-class SubGroupedOffsetPaginator(OffsetPaginator):
+class SubGroupedOffsetPaginator(GroupedOffsetPaginator):
     # Field mappers this are the fields that are m2m
     FIELD_MAPPER = {
         "labels__id": "label_ids",
@@ -408,171 +757,45 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         **kwargs,
     ):
         # Initiate the parent class for all the parameters
-        super().__init__(queryset, *args, **kwargs)
-
-        # Set the group by field name
-        self.group_by_field_name = group_by_field_name
-        self.group_by_fields = group_by_fields
+        super().__init__(
+            queryset, group_by_field_name, group_by_fields, count_filter, *args, **kwargs
+        )
 
         # Set the sub group by field name
         self.sub_group_by_field_name = sub_group_by_field_name
         self.sub_group_by_fields = sub_group_by_fields
 
-        # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
-        self.count_filter = count_filter
-
-    def get_result(self, limit=30, cursor=None):
-        # offset is page #
-        # value is page limit
-        if cursor is None:
-            cursor = Cursor(0, 0, 0)
-
-        # get the minimum value
-        limit = min(limit, self.max_limit)
-
-        # Adjust the initial offset and stop based on the cursor and limit
-        queryset = self.queryset
-
-        # the current page
-        page = cursor.offset
-
-        # the offset
-        offset = cursor.offset * cursor.value
+        # Sub group totals computed along with the page rows
+        self.total_sub_group_dict = {}
 
-        # the stop
-        stop = offset + (cursor.value or limit) + 1
+    def get_group_fields(self):
+        return [self.group_by_field_name, self.sub_group_by_field_name]
 
-        if self.max_offset is not None and offset >= self.max_offset:
-            raise BadPaginationError("Pagination offset too large")
-        if offset < 0:
-            raise BadPaginationError("Pagination offset cannot be negative")
-
-        # Compute the results
-        results = {}
-
-        # Create windows for group and sub group field name
-        queryset = queryset.annotate(
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[
-                    F(self.group_by_field_name),
-                    F(self.sub_group_by_field_name),
-                ],
-                order_by=(
-                    (
-                        F(*self.key).desc(nulls_last=True)
-                        if self.desc
-                        else F(*self.key).asc(nulls_last=True)
-                    ),
-                    "-created_at",
-                ),
-            )
-        )
-
-        # Filter the results
-        results = queryset.filter(row_number__gt=offset, row_number__lt=stop).order_by(
-            (
-                F(*self.key).desc(nulls_last=True)
-                if self.desc
-                else F(*self.key).asc(nulls_last=True)
-            ),
-            F("created_at").desc(),
-        )
-
-        # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(
-            limit, page + 1, False, queryset.filter(row_number__gte=stop).exists()
-        )
-
-        # Add previous cursors
-        prev_cursor = Cursor(limit, page - 1, True, page > 0)
-
-        # Count the queryset
-        count = queryset.count()
-
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
-        return CursorResult(
-            results=results,
-            next=next_cursor,
-            prev=prev_cursor,
-            hits=count,
-            max_hits=max_hits,
-        )
-
-    def __get_group_total_queryset(self):
-        # Get group totals
-        return (
-            self.queryset.order_by(self.group_by_field_name)
-            .values(self.group_by_field_name)
-            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-            .distinct()
-        )
-
-    def __get_subgroup_total_queryset(self):
-        # Get subgroup totals
-        return (
-            self.queryset.values(self.group_by_field_name, self.sub_group_by_field_name)
-            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-            .order_by()
-            .values(self.group_by_field_name, self.sub_group_by_field_name, "count")
-        )
-
-    def __get_total_dict(self):
-        # Use the above to convert to dictionary of 2D objects
-        total_group_dict = {}
-        total_sub_group_dict = {}
-        for group in self.__get_group_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = (
-                total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
-                + (1 if group.get("count") == 0 else group.get("count"))
-            )
-
-        # Sub group total values
-        for item in self.__get_subgroup_total_queryset():
-            group = str(item[self.group_by_field_name])
-            subgroup = str(item[self.sub_group_by_field_name])
-            count = item["count"]
-
-            # Create a dictionary of group and sub group
-            if group not in total_sub_group_dict:
-                total_sub_group_dict[str(group)] = {}
-
-            # Create a dictionary of sub group
-            if subgroup not in total_sub_group_dict[group]:
-                total_sub_group_dict[str(group)][str(subgroup)] = {}
+    def get_result(self, limit=30, cursor=None):
+        return super().get_result(limit=limit, cursor=cursor)
 
-            # Create a nested dictionary of group and sub group
-            total_sub_group_dict[group][subgroup] = count
+    def set_totals(self, totals):
+        # Use the totals to build the dictionary of 2D objects
+        super().set_totals(totals)
 
-        return total_group_dict, total_sub_group_dict
+        self.total_sub_group_dict = {}
+        for (group, subgroup), count in totals[1].items():
+            self.total_sub_group_dict.setdefault(group, {})[subgroup] = count
 
     def __get_field_dict(self):
-        # Create a field dictionary
-        total_group_dict, total_sub_group_dict = self.__get_total_dict()
-
         # Create a dictionary of group and sub group
         return {
             str(group): {
                 "results": {
                     str(sub_group): {
                         "results": [],
-                        "total_results": total_sub_group_dict.get(str(group)).get(
-                            str(sub_group), 0
-                        ),
+                        "total_results": self.total_sub_group_dict.get(
+                            str(group)
+                        ).get(str(sub_group), 0),
                     }
-                    for sub_group in total_sub_group_dict.get(str(group), [])
+                    for sub_group in self.total_sub_group_dict.get(str(group), [])
                 },
-                "total_results": total_group_dict.get(str(group), 0),
+                "total_results": self.total_group_dict.get(str(group), 0),
             }
             for group in self.group_by_fields
         }
@@ -698,20 +921,43 @@ class BasePaginator:
     ):
         """Paginate the request"""
         per_page = self.get_per_page(request, default_per_page, max_per_page)
+
+        # Keyset pagination is opted in with `pagination=keyset` or a keyset cursor
+        cursor_value = request.GET.get(self.cursor_name)
+        if (
+            getattr(paginator or paginator_cls, "supports_keyset", False)
+            and cursor_cls is Cursor
+            and (
+                request.GET.get("pagination") == "keyset"
+                or (cursor_value and KeysetCursor.is_keyset(cursor_value))
+            )
+        ):
+            cursor_cls = KeysetCursor
+            if not cursor_value:
+                cursor_value = str(KeysetCursor(per_page))
+
         # Convert the cursor value to integer and float from string
         input_cursor = None
         try:
-            input_cursor = cursor_cls.from_string(
-                request.GET.get(self.cursor_name, f"{per_page}:0:0")
-            )
+            input_cursor = cursor_cls.from_string(cursor_value or f"{per_page}:0:0")
         except ValueError:
             raise ParseError(detail="Invalid cursor parameter.")
 
+        # The total count can be skipped or estimated with `count=none|estimated`
+        count_mode = request.GET.get("count", COUNT_EXACT)
+        if count_mode not in COUNT_MODES:
+            raise ParseError(detail="Invalid count parameter.")
+        if not paginator and count_mode != COUNT_EXACT:
+            paginator_kwargs["count_mode"] = count_mode
+
         if not paginator:
             if group_by_field_name:
                 paginator_kwargs["group_by_field_name"] = group_by_field_name
                 paginator_kwargs["group_by_fields"] = group_by_fields
                 paginator_kwargs["count_filter"] = count_filter
+                # Grouped paginators fetch the processed rows with the group totals
+                paginator_kwargs["on_results"] = on_results
+                on_results = None
 
                 if sub_group_by_field_name:
                     paginator_kwargs["sub_group_by_field_name"] = (
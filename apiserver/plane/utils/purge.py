@@ -0,0 +1,154 @@
+# Python imports
+import json
+import logging
+import time
+from datetime import datetime
+from functools import lru_cache
+
+# Django imports
+from django.apps import apps
+from django.conf import settings
+from django.db.models.deletion import Collector
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+PURGE_CHECKPOINT_TIMEOUT = 7 * 86400
+PURGE_LOCK_TIMEOUT = 6 * 3600
+
+
+def purge_checkpoint_key(name):
+    return f"purge:{name}"
+
+
+def purge_metrics_key(name):
+    return f"purge:{name}:metrics"
+
+
+@lru_cache(maxsize=None)
+def get_soft_delete_models():
+    """
+    Return the soft deletable models ordered so that a model comes before every
+    model it references, children are purged before their parents
+    """
+    candidates = sorted(
+        (
+            model
+            for model in apps.get_models()
+            if hasattr(model, "deleted_at") and not model._meta.proxy
+        ),
+        key=lambda model: model._meta.label_lower,
+    )
+
+    # Models referencing each model through a foreign key or one to one field
+    children = {model: [] for model in candidates}
+    for model in candidates:
+        for field in model._meta.concrete_fields:
+            parent = field.related_model if field.is_relation else None
+            if parent in children and parent is not model:
+                children[parent].append(model)
+
+    ordered = []
+    visited = set()
+
+    def visit(model):
+        # Cycles are broken at the first model seen again, the collector of the
+        # non raw batches takes care of the rows still referencing it
+        if model in visited:
+            return
+        visited.add(model)
+        for child in children[model]:
+            visit(child)
+        ordered.append(model)
+
+    for model in candidates:
+        visit(model)
+    return tuple(ordered)
+
+
+def delete_in_batches(queryset, batch_size):
+    """
+    Delete the rows of the queryset in primary key batches, returns the count
+    Batches of models without delete signals or cascades are deleted with a
+    single raw DELETE, the others go through the collector one batch at a time
+    """
+    model = queryset.model
+    count = 0
+    while True:
+        pks = list(queryset.order_by().values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return count
+        batch = model._base_manager.filter(pk__in=pks)
+        if Collector(using=batch.db).can_fast_delete(batch):
+            count += batch._raw_delete(batch.db)
+        else:
+            count += batch.delete()[1].get(model._meta.label, 0)
+
+
+def purge(name, models, field, cutoff, batch_size=None):
+    """
+    Delete the rows of the models whose field is older than the cutoff, table
+    after table in the given order
+
+    The tables done are checkpointed in redis with the cutoff, a run stopped by
+    a time limit or a crash is resumed by the next one with the same cutoff.
+    The rows and rows per second of every table are kept as metrics.
+    """
+    batch_size = batch_size or settings.PURGE_BATCH_SIZE
+    ri = redis_instance()
+    key = purge_checkpoint_key(name)
+    logger = logging.getLogger("plane")
+
+    if not ri.set(f"{key}:lock", "true", nx=True, ex=PURGE_LOCK_TIMEOUT):
+        logger.info(f"Purge {name} is already running")
+        return
+
+    try:
+        checkpoint = {k.decode(): v.decode() for k, v in ri.hgetall(key).items()}
+        if "cutoff" in checkpoint:
+            cutoff = datetime.fromisoformat(checkpoint["cutoff"])
+        else:
+            ri.hset(key, "cutoff", cutoff.isoformat())
+        ri.expire(key, PURGE_CHECKPOINT_TIMEOUT)
+
+        for model in models:
+            label = model._meta.label_lower
+            if checkpoint.get(label) == "done":
+                continue
+
+            start = time.monotonic()
+            rows = delete_in_batches(
+                model._base_manager.filter(**{f"{field}__lt": cutoff}), batch_size
+            )
+            seconds = time.monotonic() - start
+
+            ri.hset(key, label, "done")
+            ri.hset(
+                purge_metrics_key(name),
+                label,
+                json.dumps(
+                    {
+                        "rows": rows,
+                        "seconds": round(seconds, 3),
+                        "rows_per_second": round(rows / seconds, 1) if seconds else 0,
+                        "cutoff": cutoff.isoformat(),
+                    }
+                ),
+            )
+            if rows:
+                logger.info(f"Purged {rows} {label} rows in {seconds:.1f}s")
+
+        # Completed, the next run starts a new purge
+        ri.delete(key)
+    finally:
+        ri.delete(f"{key}:lock")
+
+
+def get_purge_metrics(name):
+    """Return the metrics of the last purge of every table"""
+    return {
+        label.decode(): json.loads(metrics)
+        for label, metrics in redis_instance()
+        .hgetall(purge_metrics_key(name))
+        .items()
+    }
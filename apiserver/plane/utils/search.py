@@ -0,0 +1,162 @@
+# Python imports
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Django imports
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+from django.db import OperationalError, close_old_connections, connection, transaction
+from django.db.models import F, FloatField, Value
+from django.db.models.expressions import RawSQL
+
+# Module imports
+from plane.utils.exception_logger import log_exception
+
+# Text search configuration of the search vectors, without stemming so that
+# every language is matched on its words as typed
+SEARCH_CONFIG = "simple"
+
+# Results returned per searched entity
+SEARCH_RESULTS_LIMIT = 100
+
+# Tables with a search_vector column maintained by a trigger
+SEARCH_VECTOR_TABLES = ["issues", "pages"]
+
+WORD = re.compile(r"\w+")
+
+
+def search_query(query):
+    """Return the query matching the documents having a word starting with
+    every word of the search, None when the search has no word"""
+    words = WORD.findall(query)
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"{word}:*" for word in words),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+def with_search_vector(queryset):
+    """Expose the search_vector column of the table to the queryset filters"""
+    return queryset.alias(
+        search_vector=RawSQL(
+            f'"{queryset.model._meta.db_table}"."search_vector"',
+            [],
+            output_field=SearchVectorField(),
+        )
+    )
+
+
+def backfill_search_vectors(table, batch_size=1000, rebuild=False, db_connection=None):
+    """
+    Fill the search vectors of the rows of the table missing one, or of every
+    row with rebuild, and return the number of rows filled
+
+    The table is walked in primary key batches, each one its own statement so
+    that no long running transaction holds the rows.
+    """
+    db_connection = db_connection or connection
+    last_id = None
+    filled = 0
+    while True:
+        with db_connection.cursor() as cursor:
+            # Rewriting the name fires the trigger building the vector
+            cursor.execute(
+                f"""
+                WITH batch AS (
+                    SELECT id FROM {table}
+                    WHERE %(last_id)s::uuid IS NULL OR id > %(last_id)s::uuid
+                    ORDER BY id
+                    LIMIT %(batch_size)s
+                ), updated AS (
+                    UPDATE {table} SET name = {table}.name
+                    FROM batch
+                    WHERE {table}.id = batch.id
+                    AND (%(rebuild)s OR {table}.search_vector IS NULL)
+                    RETURNING 1
+                )
+                SELECT
+                    (SELECT id FROM batch ORDER BY id DESC LIMIT 1),
+                    (SELECT COUNT(*) FROM updated)
+                """,
+                {"last_id": last_id, "batch_size": batch_size, "rebuild": rebuild},
+            )
+            last_id, count = cursor.fetchone()
+        if last_id is None:
+            return filled
+        filled += count
+
+
+def search_rank(text_query):
+    if text_query is None:
+        return Value(0.0, output_field=FloatField())
+    return SearchRank(F("search_vector"), text_query)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_search_executor():
+    """Return the process wide pool running the searches of every request"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.GLOBAL_SEARCH_MAX_WORKERS,
+                thread_name_prefix="search",
+            )
+    return _executor
+
+
+def database_search(search, timeout):
+    """
+    Wrap a search returning a queryset to be evaluated on the connection of
+    the pool thread, its statements are cancelled by the database once the
+    timeout is over
+    """
+
+    def run():
+        close_old_connections()
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SET LOCAL statement_timeout = %s", [int(timeout * 1000)]
+                    )
+                return list(search())
+        finally:
+            close_old_connections()
+
+    return run
+
+
+def run_searches(searches, timeout):
+    """
+    Run the searches concurrently and return their results with the names of
+    the searches that did not finish in time, which get no results
+    """
+    futures = {
+        name: get_search_executor().submit(search) for name, search in searches.items()
+    }
+    done, _ = wait(futures.values(), timeout=timeout)
+
+    results = {}
+    timed_out = []
+    for name, future in futures.items():
+        results[name] = []
+        if future not in done:
+            # Searches still queued are dropped, running ones are cancelled by
+            # their statement timeout
+            future.cancel()
+            timed_out.append(name)
+        elif isinstance(future.exception(), OperationalError):
+            timed_out.append(name)
+        elif future.exception() is not None:
+            log_exception(future.exception())
+        else:
+            results[name] = future.result()
+    return results, timed_out
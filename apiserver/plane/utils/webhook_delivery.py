@@ -0,0 +1,117 @@
+# Python imports
+import hashlib
+import hmac
+import json
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from urllib.parse import urlsplit
+
+# Third party imports
+import requests
+from requests.adapters import HTTPAdapter
+
+# Django imports
+from django.conf import settings
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process wide session keeping a keep-alive pool per host"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=settings.WEBHOOK_MAX_WORKERS,
+                pool_maxsize=settings.WEBHOOK_PER_HOST_CONCURRENCY,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+    return _session
+
+
+def build_request(url, event, payload, secret_key=None, headers=None):
+    """Serialize and sign the payload once, the signed bytes are sent as is"""
+    body = json.dumps(payload)
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": event,
+        **(headers or {}),
+    }
+
+    # Use HMAC for generating signature
+    if secret_key:
+        headers["X-Plane-Signature"] = hmac.new(
+            secret_key.encode("utf-8"), body.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+    return {"url": url, "headers": headers, "body": body}
+
+
+def send_request(request, timeout=None):
+    """Send a single request, network errors are returned instead of raised"""
+    timeout = timeout or (
+        settings.WEBHOOK_CONNECT_TIMEOUT,
+        settings.WEBHOOK_READ_TIMEOUT,
+    )
+    try:
+        response = get_session().post(
+            request["url"],
+            headers=request["headers"],
+            data=request["body"].encode("utf-8"),
+            timeout=timeout,
+        )
+        return {
+            "status": response.status_code,
+            "headers": response.headers,
+            "body": response.text,
+            "error": None,
+        }
+    except requests.RequestException as e:
+        return {"status": None, "headers": None, "body": None, "error": e}
+
+
+def deliver(requests_, max_workers=None, per_host=None, timeout=None):
+    """
+    Send the requests concurrently and return the results in the same order
+    Every host gets at most per_host requests in flight so a slow or
+    unreachable endpoint only holds its own share of the workers
+    """
+    max_workers = max_workers or settings.WEBHOOK_MAX_WORKERS
+    per_host = per_host or settings.WEBHOOK_PER_HOST_CONCURRENCY
+    results = [None] * len(requests_)
+    if not requests_:
+        return results
+
+    # Queue the requests by the receiving host
+    queues = {}
+    for index, request in enumerate(requests_):
+        queues.setdefault(urlsplit(request["url"]).netloc, deque()).append(index)
+
+    def drain(queue):
+        while True:
+            try:
+                index = queue.popleft()
+            except IndexError:
+                return
+            results[index] = send_request(requests_[index], timeout=timeout)
+
+    # Interleave the hosts so the first workers started cover every host
+    workers = zip_longest(
+        *[[queue] * min(per_host, len(queue)) for queue in queues.values()]
+    )
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests_))) as executor:
+        for wave in workers:
+            for queue in wave:
+                if queue is not None:
+                    executor.submit(drain, queue)
+
+    return results
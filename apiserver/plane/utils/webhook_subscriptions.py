@@ -0,0 +1,58 @@
+# Django imports
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models import Webhook
+
+# Subscription flag of the webhook for every event
+EVENT_WEBHOOK_FIELD = {
+    "project": "project",
+    "issue": "issue",
+    "module": "module",
+    "module_issue": "module",
+    "cycle": "cycle",
+    "cycle_issue": "cycle",
+    "issue_comment": "issue_comment",
+}
+WEBHOOK_FIELDS = sorted(set(EVENT_WEBHOOK_FIELD.values()))
+
+# Events without a subscription flag are sent to every active webhook
+ALL_EVENTS = "*"
+
+WEBHOOK_INDEX_TIMEOUT = 60 * 60
+
+
+def webhook_index_key(slug):
+    return f"webhook_index:{slug}"
+
+
+def build_webhook_index(slug):
+    """Map every subscription flag to the ids of the active webhooks having it set"""
+    index = {field: [] for field in [ALL_EVENTS, *WEBHOOK_FIELDS]}
+    for webhook in Webhook.objects.filter(
+        workspace__slug=slug, is_active=True
+    ).values("id", *WEBHOOK_FIELDS):
+        index[ALL_EVENTS].append(str(webhook["id"]))
+        for field in WEBHOOK_FIELDS:
+            if webhook[field]:
+                index[field].append(str(webhook["id"]))
+    return index
+
+
+def get_webhook_index(slug):
+    key = webhook_index_key(slug)
+    index = cache.get(key)
+    if index is None:
+        index = build_webhook_index(slug)
+        cache.set(key, index, WEBHOOK_INDEX_TIMEOUT)
+    return index
+
+
+def get_event_webhook_ids(slug, event):
+    """Return the ids of the active webhooks of the workspace subscribed to the event"""
+    index = get_webhook_index(slug)
+    return index[EVENT_WEBHOOK_FIELD.get(event, ALL_EVENTS)]
+
+
+def invalidate_webhook_index(slug):
+    cache.delete(webhook_index_key(slug))